@@ -3,49 +3,92 @@ Benchmark System for TSP Algorithms
 Đo và so sánh hiệu năng của các thuật toán TSP
 """
 
+import gc
+import multiprocessing as mp
+import os
+import platform
+import subprocess
+import sys
 import time
 import tracemalloc
 import numpy as np
-from typing import Dict, List, Tuple, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from statistics import mean, stdev, median
 import json
 from datetime import datetime
 
-from solvers import (
-    NearestNeighbor,
-    NearestInsertion,
-    FarthestInsertion,
-    AntColonyOptimization,
-)
+from solvers import Profiler, get_solver, get_metric
+from solvers.matrix import MATRIX_DTYPES, MATRIX_LAYOUTS, build_distance_matrix, matrix_nbytes
+from solvers.binary_io import load_binary
+from solvers.generators import generate_points
+from solvers.tsplib import read_tsplib
+
+# Biến môi trường giới hạn số luồng của các thư viện BLAS/OpenMP
+BLAS_THREAD_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                    'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS')
 
 
 class PerformanceMetrics:
     """Class để lưu trữ các metrics hiệu năng"""
     
     def __init__(self):
-        self.execution_time = 0.0
+        self.setup_time = 0.0       # khởi tạo solver (ma trận khoảng cách, ...)
+        self.execution_time = 0.0   # solve(), wall clock
+        self.cpu_time = 0.0         # solve(), CPU của tiến trình
         self.tour_distance = 0.0
-        self.memory_usage = 0.0  # MB
+        self.memory_usage = 0.0     # MB, đỉnh tracemalloc trong solve()
+        self.setup_memory = 0.0     # MB, đỉnh tracemalloc khi khởi tạo
+        self.rss_setup = None       # MB, tăng RSS đỉnh khi khởi tạo (None nếu không đo được)
+        self.rss_solve = None       # MB, tăng RSS đỉnh thêm trong solve()
         self.num_iterations = 0
-        self.num_comparisons = 0
+        self.num_comparisons = 0    # distance lookups + insertion evals + candidate scans
+        self.operations = None      # OperationCounters.to_dict() của lần đo bộ nhớ
+        self.profile = None         # Profiler.summary() của lần chạy profile (nếu bật)
         self.tour = []
+        self.complexity = None      # (time, space) do solver tự khai báo qua get_complexity()
         
     def to_dict(self) -> Dict:
         return {
+            'setup_time': round(self.setup_time, 6),
             'execution_time': round(self.execution_time, 6),
+            'cpu_time': round(self.cpu_time, 6),
             'tour_distance': round(self.tour_distance, 2),
             'memory_usage_mb': round(self.memory_usage, 2),
+            'setup_memory_mb': round(self.setup_memory, 2),
+            'rss_setup_mb': None if self.rss_setup is None else round(self.rss_setup, 2),
+            'rss_solve_mb': None if self.rss_solve is None else round(self.rss_solve, 2),
             'num_iterations': self.num_iterations,
             'num_comparisons': self.num_comparisons,
+            'operations': self.operations,
+            'profile': self.profile,
             'tour_length': len(self.tour)
         }
 
 
+def _summary(values: List[float], digits: int) -> Dict:
+    """mean/std/min/max/median của một dãy số"""
+    return {
+        'mean': round(mean(values), digits),
+        'std': round(stdev(values) if len(values) > 1 else 0, digits),
+        'min': round(min(values), digits),
+        'max': round(max(values), digits),
+        'median': round(median(values), digits)
+    }
+
+
 class BenchmarkStats:
     """Class để lưu thống kê từ nhiều lần chạy"""
     
-    def __init__(self, runs: List[PerformanceMetrics]):
+    def __init__(self, runs: List[PerformanceMetrics], memory_runs: List[PerformanceMetrics] = None,
+                 profile: Dict = None):
+        """
+        runs: Các lần đo thời gian (không bật tracemalloc)
+        memory_runs: Các lần đo bộ nhớ riêng (mặc định dùng chính runs)
+        profile: Tóm tắt theo pha của lần chạy profile riêng (None nếu không bật)
+        """
         self.runs = runs
+        self.profile = profile
+        self.memory_runs = memory_runs if memory_runs else runs
         self.n_runs = len(runs)
         
         # Thống kê thời gian
@@ -56,6 +99,11 @@ class BenchmarkStats:
         self.time_max = max(times)
         self.time_median = median(times)
         
+        setup_times = [r.setup_time for r in runs]
+        self.setup_time_mean = mean(setup_times)
+        self.setup_time_std = stdev(setup_times) if len(setup_times) > 1 else 0
+        self.cpu_time_mean = mean(r.cpu_time for r in runs)
+        
         # Thống kê khoảng cách
         distances = [r.tour_distance for r in runs]
         self.distance_mean = mean(distances)
@@ -65,102 +113,248 @@ class BenchmarkStats:
         self.distance_median = median(distances)
         
         # Thống kê bộ nhớ
-        memories = [r.memory_usage for r in runs]
+        memories = [r.memory_usage for r in self.memory_runs]
         self.memory_mean = mean(memories)
         self.memory_std = stdev(memories) if len(memories) > 1 else 0
         self.memory_max = max(memories)
+        self.setup_memory_max = max(r.setup_memory for r in self.memory_runs)
+        rss = [r for r in self.memory_runs if r.rss_setup is not None]
+        self.rss_setup_max = max((r.rss_setup for r in rss), default=None)
+        self.rss_solve_max = max((r.rss_solve for r in rss), default=None)
+        
+        # Số phép toán (trung bình các lần đo bộ nhớ, chỉ thay đổi giữa các lần với solver ngẫu nhiên)
+        counted = [r.operations for r in self.memory_runs if r.operations is not None]
+        self.operations = {name: round(mean(ops[name] for ops in counted), 1)
+                           for name in counted[0]} if counted else None
         
     def to_dict(self) -> Dict:
         return {
             'n_runs': self.n_runs,
-            'time': {
-                'mean': round(self.time_mean, 6),
-                'std': round(self.time_std, 6),
-                'min': round(self.time_min, 6),
-                'max': round(self.time_max, 6),
-                'median': round(self.time_median, 6)
-            },
-            'distance': {
-                'mean': round(self.distance_mean, 2),
-                'std': round(self.distance_std, 2),
-                'min': round(self.distance_min, 2),
-                'max': round(self.distance_max, 2),
-                'median': round(self.distance_median, 2)
-            },
+            'time': _summary([r.execution_time for r in self.runs], 6),
+            'setup_time': _summary([r.setup_time for r in self.runs], 6),
+            'cpu_time': _summary([r.cpu_time for r in self.runs], 6),
+            'distance': _summary([r.tour_distance for r in self.runs], 2),
             'memory_mb': {
                 'mean': round(self.memory_mean, 2),
                 'std': round(self.memory_std, 2),
-                'max': round(self.memory_max, 2)
+                'max': round(self.memory_max, 2),
+                'setup_max': round(self.setup_memory_max, 2)
+            },
+            'rss_mb': None if self.rss_setup_max is None else {
+                'setup': round(self.rss_setup_max, 2),
+                'solve': round(self.rss_solve_max, 2)
+            },
+            'operations': self.operations,
+            'profile': self.profile,
+            # Giá trị từng lần chạy, dùng cho kiểm định thống kê (benchmark_history.py)
+            'samples': {
+                'time': [round(r.execution_time, 6) for r in self.runs],
+                'setup_time': [round(r.setup_time, 6) for r in self.runs],
+                'distance': [round(r.tour_distance, 2) for r in self.runs],
+                'memory_mb': [round(r.memory_usage, 4) for r in self.memory_runs]
             }
         }
 
 
+def _max_rss_mb() -> float:
+    """Đỉnh RSS của tiến trình hiện tại (MB)"""
+    import resource
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux trả về KB, macOS trả về byte
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _rss_worker(solver_class, cities, kwargs, conn):
+    """Chạy một lần trong tiến trình con để đo RSS mà không bị lịch sử tiến trình cha ảnh hưởng"""
+    try:
+        before = _max_rss_mb()
+        solver = solver_class(cities, **kwargs)
+        after_setup = _max_rss_mb()
+        solver.solve()
+        conn.send((after_setup - before, _max_rss_mb() - after_setup))
+    except Exception as exc:
+        conn.send(exc)
+    finally:
+        conn.close()
+
+
+def rss_supported() -> bool:
+    """Đo RSS cần module resource và start method 'fork' (Linux/macOS)"""
+    try:
+        import resource  # noqa: F401
+    except ImportError:
+        return False
+    return 'fork' in mp.get_all_start_methods()
+
+
 class TSPBenchmark:
     """Hệ thống benchmark cho TSP"""
     
-    def __init__(self, cities: List[Tuple[float, float]]):
+    def __init__(self, cities: List[Tuple[float, float]], warmup: int = 1,
+                 memory_runs: int = 1, measure_rss: bool = True, instance: Dict = None,
+                 profile: bool = False, sample_interval: Optional[float] = None,
+                 trace_dir: Optional[str] = None, metric: str = 'euclidean'):
+        """
+        warmup: Số lần chạy khởi động (bỏ kết quả) trước khi đo thời gian
+        memory_runs: Số lần chạy riêng để đo bộ nhớ (tracemalloc + RSS)
+        measure_rss: Đo RSS trong tiến trình con (nếu hệ điều hành hỗ trợ)
+        instance: Mô tả instance (tên, phân bố, seed, ...) ghi vào metadata
+        profile: Thêm một lần chạy riêng ghi span theo pha (solvers.profiling)
+        sample_interval: Chu kỳ lấy mẫu ngăn xếp (giây) trong lần chạy profile, None: không lấy mẫu
+        trace_dir: Thư mục ghi Chrome trace của lần chạy profile (None: không ghi)
+        metric: Metric khoảng cách truyền cho mọi solver (ví dụ 'geo' cho file TSPLIB GEO)
+        """
         self.cities = cities
         self.n_cities = len(cities)
-        
-    def _measure_algorithm(self, solver_class, **kwargs) -> PerformanceMetrics:
-        """Đo hiệu năng của một thuật toán"""
+        self.warmup = warmup
+        self.memory_runs = memory_runs
+        self.measure_rss = measure_rss and rss_supported()
+        self.instance = instance
+        self.metric = metric
+        self.profile = profile or sample_interval is not None or trace_dir is not None
+        self.sample_interval = sample_interval
+        self.trace_dir = trace_dir
+    
+    @classmethod
+    def iter_corpus(cls, corpus, **kwargs) -> Iterator[Tuple[str, 'TSPBenchmark']]:
+        """(tên, TSPBenchmark) cho từng instance của một InstanceCorpus"""
+        for name, cities in corpus:
+            yield name, cls(cities, instance=corpus.spec(name).to_dict(), **kwargs)
+    
+    def _measure_time(self, solver_class, **kwargs) -> PerformanceMetrics:
+        """
+        Đo thời gian khởi tạo và solve() riêng rẽ
+        tracemalloc tắt và GC tạm dừng trong vùng đo để không làm sai thời gian.
+        """
         metrics = PerformanceMetrics()
-        
-        # Bắt đầu đo bộ nhớ
-        tracemalloc.start()
-        
-        # Khởi tạo solver
-        if solver_class == AntColonyOptimization:
+        gc.collect()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            wall_start, cpu_start = time.perf_counter_ns(), time.process_time_ns()
             solver = solver_class(self.cities, **kwargs)
-        else:
-            solver = solver_class(self.cities)
-        
-        # Đo thời gian thực thi
-        start_time = time.perf_counter()
-        tour, distance, _ = solver.solve()
-        end_time = time.perf_counter()
-        
-        # Lấy thông tin bộ nhớ
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-        
-        # Lưu metrics
-        metrics.execution_time = end_time - start_time
+            wall_setup, cpu_setup = time.perf_counter_ns(), time.process_time_ns()
+            tour, distance, _ = solver.solve()
+            wall_end, cpu_end = time.perf_counter_ns(), time.process_time_ns()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        
+        metrics.setup_time = (wall_setup - wall_start) / 1e9
+        metrics.execution_time = (wall_end - wall_setup) / 1e9
+        metrics.cpu_time = (cpu_end - cpu_setup) / 1e9
         metrics.tour_distance = distance
-        metrics.memory_usage = peak / (1024 * 1024)  # Convert to MB
         metrics.tour = tour
         
         # Đếm số iterations (chỉ có ý nghĩa với ACO)
         if hasattr(solver, 'n_iterations'):
             metrics.num_iterations = solver.n_iterations
-            
+        try:
+            metrics.complexity = solver.get_complexity()
+        except NotImplementedError:
+            pass
         return metrics
     
-    def run_single(self, algorithm_name: str, **kwargs) -> PerformanceMetrics:
-        """Chạy benchmark cho một thuật toán một lần"""
-        algorithms = {
-            'nearest_neighbor': NearestNeighbor,
-            'nearest_insertion': NearestInsertion,
-            'farthest_insertion': FarthestInsertion,
-            'ant_colony': AntColonyOptimization
-        }
-        
-        if algorithm_name not in algorithms:
-            raise ValueError(f"Unknown algorithm: {algorithm_name}")
+    def _measure_memory(self, solver_class, **kwargs) -> PerformanceMetrics:
+        """
+        Đo đỉnh bộ nhớ (tracemalloc) của khởi tạo và solve() riêng rẽ, không tính thời gian
+        Bộ đếm phép toán cũng chỉ bật ở lần chạy này để các lần đo thời gian không phải trả giá.
+        """
+        metrics = PerformanceMetrics()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            solver = solver_class(self.cities, **kwargs)
+            metrics.setup_memory = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+            tracemalloc.reset_peak()
+            counters = solver.enable_counters()
+            baseline = tracemalloc.get_traced_memory()[0]
+            tour, distance, _ = solver.solve()
+            metrics.memory_usage = (tracemalloc.get_traced_memory()[1] - baseline) / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+        metrics.tour_distance = distance
+        metrics.tour = tour
+        metrics.num_comparisons = counters.comparisons
+        metrics.operations = counters.to_dict()
         
-        return self._measure_algorithm(algorithms[algorithm_name], **kwargs)
+        if self.measure_rss:
+            metrics.rss_setup, metrics.rss_solve = self._measure_rss(solver_class, **kwargs)
+        return metrics
+    
+    def _measure_rss(self, solver_class, **kwargs) -> Tuple[float, float]:
+        """Tăng RSS đỉnh (MB) khi khởi tạo và khi solve(), đo trong tiến trình con fork"""
+        ctx = mp.get_context('fork')
+        receiver, sender = ctx.Pipe(duplex=False)
+        proc = ctx.Process(target=_rss_worker, args=(solver_class, self.cities, kwargs, sender))
+        proc.start()
+        sender.close()
+        try:
+            result = receiver.recv()
+        finally:
+            proc.join()
+        if isinstance(result, Exception):
+            raise result
+        return result
+    
+    def _measure_profile(self, solver_class, algorithm_name: str, **kwargs) -> Dict:
+        """
+        Một lần chạy riêng ghi span theo pha (và mẫu ngăn xếp nếu có sample_interval)
+        Tách khỏi các lần đo thời gian vì span và bộ lấy mẫu có chi phí riêng.
+        """
+        profiler = Profiler(sample_interval=self.sample_interval)
+        gc.collect()
+        with profiler.sampling():
+            with profiler.span('setup'):
+                solver = solver_class(self.cities, **kwargs)
+            solver.enable_profiling(profiler)
+            with profiler.span('solve'):
+                solver.solve()
+        
+        if self.trace_dir is not None:
+            os.makedirs(self.trace_dir, exist_ok=True)
+            label = self.instance['name'] if self.instance is not None else f'{self.n_cities}cities'
+            path = os.path.join(self.trace_dir, f'trace_{label}_{algorithm_name}.json')
+            profiler.write_chrome_trace(path, metadata={
+                'algorithm': algorithm_name, 'n_cities': self.n_cities, 'params': kwargs,
+                'instance': self.instance})
+            print(f"  Trace saved to: {path}")
+        return profiler.summary()
+    
+    def run_single(self, algorithm_name: str, **kwargs) -> PerformanceMetrics:
+        """Chạy benchmark cho một thuật toán một lần (một lần đo thời gian + một lần đo bộ nhớ)"""
+        kwargs = {'metric': self.metric, **kwargs}
+        solver_class = get_solver(algorithm_name)
+        metrics = self._measure_time(solver_class, **kwargs)
+        memory = self._measure_memory(solver_class, **kwargs)
+        metrics.memory_usage = memory.memory_usage
+        metrics.setup_memory = memory.setup_memory
+        metrics.rss_setup, metrics.rss_solve = memory.rss_setup, memory.rss_solve
+        metrics.num_comparisons, metrics.operations = memory.num_comparisons, memory.operations
+        if self.profile:
+            metrics.profile = self._measure_profile(solver_class, algorithm_name, **kwargs)
+        return metrics
     
     def run_multiple(self, algorithm_name: str, n_runs: int = 10, **kwargs) -> BenchmarkStats:
         """Chạy benchmark nhiều lần và tính thống kê"""
         print(f"Running {algorithm_name} for {n_runs} times...")
+        solver_class = get_solver(algorithm_name)
+        kwargs = {'metric': self.metric, **kwargs}
+        
+        for _ in range(self.warmup):
+            self._measure_time(solver_class, **kwargs)
         
         runs = []
         for i in range(n_runs):
-            metrics = self.run_single(algorithm_name, **kwargs)
+            metrics = self._measure_time(solver_class, **kwargs)
             runs.append(metrics)
-            print(f"  Run {i+1}/{n_runs}: Time={metrics.execution_time:.4f}s, Distance={metrics.tour_distance:.2f}")
+            print(f"  Run {i+1}/{n_runs}: Setup={metrics.setup_time:.4f}s, "
+                  f"Time={metrics.execution_time:.4f}s, Distance={metrics.tour_distance:.2f}")
         
-        return BenchmarkStats(runs)
+        memory_runs = [self._measure_memory(solver_class, **kwargs) for _ in range(self.memory_runs)]
+        profile = self._measure_profile(solver_class, algorithm_name, **kwargs) if self.profile else None
+        return BenchmarkStats(runs, memory_runs, profile)
     
     def compare_all(self, n_runs: int = 10, aco_params: Dict = None) -> Dict[str, BenchmarkStats]:
         """So sánh tất cả thuật toán"""
@@ -169,27 +363,48 @@ class TSPBenchmark:
         print(f"{'='*70}\n")
         
         results = {}
-        
-        # Thuật toán đơn giản
-        for algo in ['nearest_neighbor', 'nearest_insertion', 'farthest_insertion']:
-            results[algo] = self.run_multiple(algo, n_runs)
+        for algo, params in default_algorithms(self.n_cities, aco_params).items():
+            results[algo] = self.run_multiple(algo, n_runs, **params)
             print()
         
-        # Ant Colony với parameters tùy chỉnh
-        if aco_params is None:
-            aco_params = {
-                'n_ants': min(50, self.n_cities),
-                'n_iterations': 100,
-                'alpha': 1.0,
-                'beta': 2.0,
-                'evaporation': 0.5,
-                'q': 100.0
-            }
-        
-        results['ant_colony'] = self.run_multiple('ant_colony', n_runs, **aco_params)
-        
         return results
     
+    def compare_matrix_layouts(self, metric: str = None) -> Dict[str, Dict]:
+        """Đo bộ nhớ và thời gian dựng ma trận khoảng cách cho mọi dtype/layout"""
+        points = np.asarray(self.cities, dtype=float).reshape(-1, 2)
+        metric_fn = get_metric(metric or self.metric)
+        baseline = matrix_nbytes(self.n_cities, 'float64', 'dense')
+        
+        report = {}
+        for layout in MATRIX_LAYOUTS:
+            for dtype in MATRIX_DTYPES:
+                tracemalloc.start()
+                start_time = time.perf_counter()
+                matrix = build_distance_matrix(points, metric_fn, dtype, layout)
+                build_time = time.perf_counter() - start_time
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                
+                report[f'{layout}/{dtype}'] = {
+                    'layout': layout,
+                    'dtype': dtype,
+                    'matrix_mb': matrix.nbytes / (1024 * 1024),
+                    'peak_mb': peak / (1024 * 1024),
+                    'build_time': build_time,
+                    'savings': baseline / matrix.nbytes if matrix.nbytes else 1.0,
+                }
+                del matrix
+        return report
+    
+    def print_matrix_layouts(self, report: Dict[str, Dict]):
+        """In bảng bộ nhớ của các cách lưu ma trận khoảng cách"""
+        print(f"\nDISTANCE MATRIX STORAGE ({self.n_cities} cities)")
+        print(f"{'Layout/dtype':<22} {'Matrix (MB)':<14} {'Peak (MB)':<12} {'Build (s)':<12} {'Savings':<8}")
+        print('-' * 70)
+        for name, row in report.items():
+            print(f"{name:<22} {row['matrix_mb']:<14.3f} {row['peak_mb']:<12.3f} "
+                  f"{row['build_time']:<12.4f} {row['savings']:.1f}x")
+    
     def print_comparison(self, results: Dict[str, BenchmarkStats]):
         """In bảng so sánh các thuật toán"""
         print(f"\n{'='*100}")
@@ -197,15 +412,22 @@ class TSPBenchmark:
         print(f"{'='*100}")
         
         # Header
-        print(f"\n{'Algorithm':<20} {'Time (s)':<25} {'Distance':<30} {'Memory (MB)':<15}")
-        print(f"{'':<20} {'Mean±Std [Min-Max]':<25} {'Mean±Std [Min-Max]':<30} {'Mean±Std':<15}")
+        print(f"\n{'Algorithm':<20} {'Setup (s)':<12} {'Solve (s)':<25} {'Distance':<30} {'Memory (MB)':<15}")
+        print(f"{'':<20} {'Mean':<12} {'Mean±Std [Min-Max]':<25} {'Mean±Std [Min-Max]':<30} {'Mean±Std':<15}")
         print('-' * 100)
         
         algo_names = {
             'nearest_neighbor': 'Nearest Neighbor',
             'nearest_insertion': 'Nearest Insertion',
             'farthest_insertion': 'Farthest Insertion',
-            'ant_colony': 'Ant Colony'
+            'ant_colony': 'Ant Colony',
+            'held_karp': 'Held-Karp (exact)',
+            'space_filling_curve': 'Space-Filling Curve',
+            'greedy_edge': 'Greedy Edge',
+            'savings': 'Savings',
+            'christofides': 'Christofides',
+            'spatial_decomposition': 'Spatial Decomposition',
+            'portfolio': 'Portfolio'
         }
         
         for algo_key, stats in results.items():
@@ -215,7 +437,7 @@ class TSPBenchmark:
             dist_str = f"{stats.distance_mean:.2f}±{stats.distance_std:.2f} [{stats.distance_min:.2f}-{stats.distance_max:.2f}]"
             mem_str = f"{stats.memory_mean:.2f}±{stats.memory_std:.2f}"
             
-            print(f"{name:<20} {time_str:<25} {dist_str:<30} {mem_str:<15}")
+            print(f"{name:<20} {stats.setup_time_mean:<12.4f} {time_str:<25} {dist_str:<30} {mem_str:<15}")
         
         print('-' * 100)
         
@@ -228,21 +450,49 @@ class TSPBenchmark:
         print(f"   Fastest: {algo_names[best_time[0]]} ({best_time[1].time_mean:.4f}s)")
         print(f"   Best Distance: {algo_names[best_distance[0]]} ({best_distance[1].distance_mean:.2f})")
         print(f"   Most Stable: {algo_names[most_stable[0]]} (std={most_stable[1].distance_std:.2f})")
+        
+        # Các pha tốn thời gian nhất (self time, không tính pha con) của lần chạy profile
+        profiled_results = [(algo, stats.profile) for algo, stats in results.items() if stats.profile]
+        if profiled_results:
+            print(f"\n🔥 HOT PHASES (self time share):")
+            for algo_key, profile in profiled_results:
+                phases = [f"{name} {phase['self_fraction']:.0%}"
+                          for name, phase in list(profile['phases'].items())[:4]
+                          if phase['self_fraction'] is not None]
+                print(f"   {algo_names.get(algo_key, algo_key)}: {', '.join(phases)}")
         print(f"{'='*100}\n")
     
-    def save_results(self, results: Dict[str, BenchmarkStats], filename: str = None):
+    def save_results(self, results: Dict[str, BenchmarkStats], filename: str = None,
+                     matrix_layouts: Dict[str, Dict] = None, runner: Dict = None):
         """Lưu kết quả benchmark ra file JSON"""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"benchmark_results_{self.n_cities}cities_{timestamp}.json"
+            if self.instance is not None:
+                filename = f"benchmark_results_{self.instance['name']}_{timestamp}.json"
+            else:
+                filename = f"benchmark_results_{self.n_cities}cities_{timestamp}.json"
         
         output = {
             'metadata': {
                 'n_cities': self.n_cities,
                 'timestamp': datetime.now().isoformat(),
+                # Quy trình đo: thời gian và bộ nhớ đo ở các lần chạy riêng
+                'protocol': {
+                    'timer': 'perf_counter_ns/process_time_ns, tracemalloc off, gc disabled',
+                    'warmup_runs': self.warmup,
+                    'memory_runs': self.memory_runs,
+                    'rss': 'fork child, ru_maxrss delta' if self.measure_rss else None,
+                    'profile': {'sample_interval': self.sample_interval} if self.profile else None,
+                },
+                'instance': self.instance,
+                'metric': self.metric,
+                'environment': environment_fingerprint(),
+                'runner': runner or {'mode': 'sequential'},
             },
             'results': {algo: stats.to_dict() for algo, stats in results.items()}
         }
+        if matrix_layouts is not None:
+            output['matrix_layouts'] = matrix_layouts
         
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(output, f, indent=2, ensure_ascii=False)
@@ -251,13 +501,172 @@ class TSPBenchmark:
         return filename
 
 
-def generate_random_cities(n: int, seed: int = None) -> List[Tuple[float, float]]:
-    """Tạo danh sách thành phố ngẫu nhiên"""
-    if seed is not None:
-        np.random.seed(seed)
+# Trên ngưỡng này các thuật toán cần ma trận n×n hoặc O(n³) bước Python (NN, chèn, ACO)
+# không còn chạy xong được (100k thành phố: ~80 GB mỗi ma trận float64)
+DENSE_ALGORITHM_LIMIT = 2000
+# Trên ngưỡng này chèn gần/xa nhất (O(n³) bước Python) và ACO (100 vòng × n_ants tour)
+# mất hàng phút tới hàng giờ mỗi lần chạy (n=200: ACO ~2 phút; n=1000: NI ~3 phút, ACO ~1 giờ)
+SLOW_ALGORITHM_LIMIT = 100
+
+
+def default_algorithms(n_cities: int, aco_params: Dict = None) -> Dict[str, Dict]:
+    """
+    Các thuật toán được benchmark mặc định và tham số của chúng, chọn theo kích thước
+    Tới SLOW_ALGORITHM_LIMIT: NN, chèn gần/xa nhất và ACO. Tới DENSE_ALGORITHM_LIMIT:
+    NN cùng các heuristic xây dựng nhanh. Lớn hơn nữa chỉ dùng các solver không cần ma trận
+    (đường cong Hilbert, greedy edge và savings qua tập ứng viên k láng giềng, phân rã không gian).
+    """
+    if n_cities > DENSE_ALGORITHM_LIMIT:
+        return {
+            'space_filling_curve': {},
+            'greedy_edge': {},
+            'savings': {},
+            # Một tiến trình: tracemalloc/RSS không thấy bộ nhớ của tiến trình con
+            'spatial_decomposition': {'n_workers': 1},
+        }
+    if n_cities > SLOW_ALGORITHM_LIMIT:
+        return {
+            'nearest_neighbor': {},
+            'space_filling_curve': {},
+            'greedy_edge': {},
+            'savings': {},
+        }
     
-    cities = [(np.random.uniform(0, 100), np.random.uniform(0, 100)) for _ in range(n)]
-    return cities
+    return {
+        'nearest_neighbor': {},
+        'nearest_insertion': {},
+        'farthest_insertion': {},
+        'ant_colony': aco_params if aco_params is not None else default_aco_params(n_cities),
+    }
+
+
+def default_aco_params(n_cities: int) -> Dict:
+    """Tham số Ant Colony mặc định khi benchmark"""
+    return {
+        'n_ants': min(50, n_cities),
+        'n_iterations': 100,
+        'alpha': 1.0,
+        'beta': 2.0,
+        'evaporation': 0.5,
+        'q': 100.0
+    }
+
+
+def algorithm_params(algorithm: str, n_cities: int, aco_params: Dict = None) -> Dict:
+    """
+    Tham số benchmark của một solver đã đăng ký bất kỳ, kể cả khi nó không nằm trong
+    default_algorithms(n_cities): khi đó ACO dùng tham số mặc định của benchmark,
+    phân rã không gian chạy một tiến trình, các solver khác dùng mặc định của lớp.
+    """
+    get_solver(algorithm)  # ValueError nếu tên chưa đăng ký
+    defaults = default_algorithms(n_cities, aco_params)
+    if algorithm in defaults:
+        return defaults[algorithm]
+    if algorithm == 'ant_colony':
+        return aco_params if aco_params is not None else default_aco_params(n_cities)
+    if algorithm == 'spatial_decomposition':
+        return {'n_workers': 1}
+    return {}
+
+
+def _cpu_model() -> str:
+    """Tên CPU (đọc /proc/cpuinfo trên Linux, nếu không dùng platform.processor())"""
+    try:
+        with open('/proc/cpuinfo', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    return line.split(':', 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def _blas_info() -> Dict:
+    """Thư viện BLAS mà numpy dùng (numpy >= 1.25), rỗng nếu không lấy được"""
+    try:
+        config = np.show_config(mode='dicts')
+        deps = config.get('Build Dependencies', {})
+        return {name: {'name': dep.get('name'), 'version': dep.get('version')}
+                for name, dep in deps.items() if name in ('blas', 'lapack')}
+    except Exception:
+        return {}
+
+
+def _git_commit() -> str:
+    """Commit hiện tại của repo (None nếu không phải git checkout)"""
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                             timeout=5, cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() if out.returncode == 0 else None
+
+
+def environment_fingerprint() -> Dict:
+    """Cấu hình phần cứng/phần mềm đi kèm mỗi bộ kết quả benchmark"""
+    memory_bytes = None
+    if hasattr(os, 'sysconf'):
+        try:
+            memory_bytes = os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+        except (ValueError, OSError):
+            pass
+    return {
+        'cpu': _cpu_model(),
+        'cpu_count': os.cpu_count(),
+        'cpu_affinity': len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None,
+        'memory_gb': None if memory_bytes is None else round(memory_bytes / 1024 ** 3, 2),
+        'platform': platform.platform(),
+        'python': f"{platform.python_implementation()} {platform.python_version()}",
+        'numpy': np.__version__,
+        'blas': _blas_info(),
+        'blas_threads': {var: os.environ[var] for var in BLAS_THREAD_VARS if var in os.environ},
+        'git_commit': _git_commit(),
+    }
+
+
+def generate_random_cities(n: int, seed: int = None, distribution: str = 'uniform',
+                           **params) -> np.ndarray:
+    """
+    Tạo n thành phố ngẫu nhiên (mảng (n, 2)) bằng np.random.Generator riêng
+    distribution: 'uniform', 'clustered', 'grid', 'roads', 'mixed' (xem solvers.generators)
+    """
+    return generate_points(distribution, n, np.random.default_rng(seed), **params)
+
+
+def load_instance(path: str) -> Tuple[np.ndarray, str]:
+    """
+    Toạ độ và tên metric (solvers.metrics) của một file TSPLIB (.tsp) hoặc nhị phân (.tspb, memmap)
+    File .tspb lấy metric từ metadata['metric'] (mặc định euclidean). File EXPLICIT
+    chỉ có ma trận khoảng cách nên bị từ chối: các solver cần toạ độ và metric.
+    """
+    if path.endswith('.tspb'):
+        instance = load_binary(path)
+        return instance.cities, instance.metric
+    instance = read_tsplib(path)
+    if instance.edge_weight_type == 'EXPLICIT':
+        raise ValueError(f"{path}: EXPLICIT instances (distance matrix only) cannot be benchmarked, "
+                         f"solvers need node coordinates and a metric")
+    return instance.cities, instance.metric
+
+
+def _profile_options(args: List[str]) -> Dict[str, Any]:
+    """
+    Tách các tuỳ chọn profile khỏi args (sửa tại chỗ) thành tham số của TSPBenchmark
+    --profile, --sample-ms MS (lấy mẫu ngăn xếp), --trace-dir DIR (ghi Chrome trace)
+    """
+    options = {}
+    if '--profile' in args:
+        args.remove('--profile')
+        options['profile'] = True
+    for flag, key, convert in (('--sample-ms', 'sample_interval', lambda v: float(v) / 1000),
+                               ('--trace-dir', 'trace_dir', str)):
+        if flag in args:
+            i = args.index(flag)
+            if i + 1 >= len(args):
+                raise ValueError(f"{flag} needs a value")
+            options[key] = convert(args[i + 1])
+            del args[i:i + 2]
+    return options
 
 
 def main():
@@ -265,6 +674,39 @@ def main():
     print("TSP Algorithm Benchmark System")
     print("=" * 70)
     
+    args = sys.argv[1:]
+    options = _profile_options(args)
+    
+    # python benchmark.py --corpus standard -> benchmark mọi instance của corpus
+    if len(args) > 1 and args[0] == '--corpus':
+        from instance_corpus import get_corpus
+        
+        for name, benchmark in TSPBenchmark.iter_corpus(get_corpus(args[1]), **options):
+            print(f"\n\n{'#'*70}")
+            print(f"# Testing with {name}")
+            print(f"{'#'*70}")
+            results = benchmark.compare_all(n_runs=5)
+            benchmark.print_comparison(results)
+            benchmark.save_results(results)
+        return
+    
+    # python benchmark.py a280.tsp berlin52.tsp big.tspb ... -> benchmark các file
+    if args:
+        for path in args:
+            print(f"\n\n{'#'*70}")
+            print(f"# Testing with {path}")
+            print(f"{'#'*70}")
+            cities, metric = load_instance(path)
+            benchmark = TSPBenchmark(cities, metric=metric, **options)
+            results = benchmark.compare_all(n_runs=5)
+            benchmark.print_comparison(results)
+            layouts = None
+            if benchmark.n_cities <= DENSE_ALGORITHM_LIMIT:
+                layouts = benchmark.compare_matrix_layouts()
+                benchmark.print_matrix_layouts(layouts)
+            benchmark.save_results(results, matrix_layouts=layouts)
+        return
+    
     # Cấu hình
     n_cities_list = [10, 20, 30, 50]  # Test với các kích thước khác nhau
     n_runs = 5  # Số lần chạy mỗi thuật toán
@@ -280,16 +722,18 @@ def main():
         cities = generate_random_cities(n_cities, seed=42)
         
         # Tạo benchmark
-        benchmark = TSPBenchmark(cities)
+        benchmark = TSPBenchmark(cities, **options)
         
         # Chạy benchmark
         results = benchmark.compare_all(n_runs=n_runs)
         
         # In kết quả
         benchmark.print_comparison(results)
+        layouts = benchmark.compare_matrix_layouts()
+        benchmark.print_matrix_layouts(layouts)
         
         # Lưu kết quả
-        benchmark.save_results(results)
+        benchmark.save_results(results, matrix_layouts=layouts)
         
         all_results[n_cities] = results
     
@@ -0,0 +1,359 @@
+"""
+Benchmark History and Regression Detection
+Lưu lịch sử kết quả benchmark (SQLite) và phát hiện hồi quy so với baseline
+
+    python benchmark_history.py import benchmarkresult/*.json --label v1
+    python benchmark_history.py baseline v1
+    python benchmark_history.py compare benchmark_results_50cities_*.json --label candidate
+
+`compare` trả mã lỗi 1 khi có hồi quy (thời gian, bộ nhớ hoặc khoảng cách)
+vượt ngưỡng và có ý nghĩa thống kê, để chặn thay đổi làm chậm trong CI.
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Chỉ số được so sánh: tên -> (khoá trong BenchmarkStats.to_dict, ngưỡng tương đối mặc định)
+METRICS = {
+    'time': ('time', 0.10),
+    'memory': ('memory_mb', 0.10),
+    'distance': ('distance', 0.01),
+}
+
+# Mẫu nhỏ hơn thì tính p-value Mann–Whitney chính xác thay vì xấp xỉ chuẩn
+_EXACT_LIMIT = 400
+
+
+@lru_cache(maxsize=None)
+def _u_counts(n1: int, n2: int) -> Tuple[int, ...]:
+    """Số cách sắp xếp cho mỗi giá trị U (n1 × n2 + 1 giá trị), không có ties"""
+    if n1 == 0 or n2 == 0:
+        return (1,)
+    with_first = _u_counts(n1 - 1, n2)   # phần tử lớn nhất thuộc mẫu 1: U tăng n2
+    with_second = _u_counts(n1, n2 - 1)
+    counts = [0] * (n1 * n2 + 1)
+    for u, c in enumerate(with_first):
+        counts[u + n2] += c
+    for u, c in enumerate(with_second):
+        counts[u] += c
+    return tuple(counts)
+
+
+def mann_whitney_greater(new: Sequence[float], base: Sequence[float]) -> float:
+    """
+    One-sided Mann–Whitney p-value for "new tends to be larger than base"
+    Exact for small samples without ties, normal approximation with tie
+    and continuity correction otherwise.
+    """
+    new, base = np.asarray(new, dtype=float), np.asarray(base, dtype=float)
+    n1, n2 = len(new), len(base)
+    u = float(np.sum(new[:, None] > base[None, :]) + 0.5 * np.sum(new[:, None] == base[None, :]))
+
+    combined = np.concatenate([new, base])
+    _, tie_counts = np.unique(combined, return_counts=True)
+    if n1 * n2 <= _EXACT_LIMIT and np.all(tie_counts == 1):
+        counts = _u_counts(n1, n2)
+        return sum(counts[math.ceil(u):]) / sum(counts)
+
+    total = n1 + n2
+    tie_term = float(np.sum(tie_counts ** 3 - tie_counts)) / (total * (total - 1))
+    variance = n1 * n2 / 12.0 * ((total + 1) - tie_term)
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2.0 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def bootstrap_ratio_ci(new: Sequence[float], base: Sequence[float], n_resamples: int = 2000,
+                       confidence: float = 0.95, seed: int = 0) -> Optional[Tuple[float, float]]:
+    """Bootstrap confidence interval of median(new) / median(base)"""
+    new, base = np.asarray(new, dtype=float), np.asarray(base, dtype=float)
+    if len(new) < 2 or len(base) < 2:
+        return None
+    rng = np.random.default_rng(seed)
+    new_medians = np.median(rng.choice(new, (n_resamples, len(new))), axis=1)
+    base_medians = np.median(rng.choice(base, (n_resamples, len(base))), axis=1)
+    valid = base_medians > 0
+    if not np.any(valid):
+        return None
+    ratios = new_medians[valid] / base_medians[valid]
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(ratios, [tail, 100 - tail])
+    return float(low), float(high)
+
+
+def _summary_p_value(new: Dict, base: Dict, n_new: int, n_base: int) -> float:
+    """Welch z-test từ mean/std (file cũ không có giá trị từng lần chạy)"""
+    spread = math.sqrt(new.get('std', 0) ** 2 / max(n_new, 1) +
+                       base.get('std', 0) ** 2 / max(n_base, 1))
+    delta = new['mean'] - base['mean']
+    if spread == 0:
+        return 0.0 if delta > 0 else 1.0
+    return 0.5 * math.erfc(delta / spread / math.sqrt(2))
+
+
+def compare_metric(new_stats: Dict, base_stats: Dict, key: str) -> Optional[Dict]:
+    """
+    Compare one metric of two BenchmarkStats dicts
+    Uses per-run samples (Mann–Whitney + bootstrap CI) when both sides have
+    them, otherwise a Welch z-test on the summary. Samples without spread on
+    both sides (deterministic distances, single memory runs) are compared
+    directly: any increase counts as significant.
+    """
+    new_summary, base_summary = new_stats.get(key), base_stats.get(key)
+    if not new_summary or not base_summary:
+        return None
+    new_samples = (new_stats.get('samples') or {}).get(key)
+    base_samples = (base_stats.get('samples') or {}).get(key)
+
+    if new_samples and base_samples:
+        new_center, base_center = float(np.median(new_samples)), float(np.median(base_samples))
+        if np.ptp(new_samples) == 0 and np.ptp(base_samples) == 0:
+            p_value, method = (0.0 if new_center > base_center else 1.0), 'exact'
+        else:
+            p_value, method = mann_whitney_greater(new_samples, base_samples), 'mann-whitney'
+        ci = bootstrap_ratio_ci(new_samples, base_samples)
+    else:
+        new_center = new_summary.get('median', new_summary['mean'])
+        base_center = base_summary.get('median', base_summary['mean'])
+        p_value = _summary_p_value(new_summary, base_summary,
+                                   new_stats.get('n_runs', 1), base_stats.get('n_runs', 1))
+        method, ci = 'welch', None
+
+    if base_center > 0:
+        ratio = new_center / base_center
+    else:
+        ratio = 1.0 if new_center == base_center else float('inf')
+    return {'baseline': base_center, 'current': new_center, 'ratio': ratio,
+            'p_value': p_value, 'ci': ci, 'method': method}
+
+
+class BenchmarkHistory:
+    """Kho lịch sử kết quả benchmark trên SQLite: mỗi file JSON là một run"""
+
+    def __init__(self, path: str = 'benchmark_history.sqlite'):
+        self.path = path
+        self._db = sqlite3.connect(path)
+        self._db.executescript(
+            'CREATE TABLE IF NOT EXISTS runs ('
+            ' id INTEGER PRIMARY KEY AUTOINCREMENT, label TEXT, source TEXT UNIQUE,'
+            ' timestamp TEXT, n_cities INTEGER NOT NULL, metadata TEXT NOT NULL,'
+            ' imported REAL NOT NULL);'
+            'CREATE TABLE IF NOT EXISTS results ('
+            ' run_id INTEGER NOT NULL REFERENCES runs(id), algorithm TEXT NOT NULL,'
+            ' n_cities INTEGER NOT NULL, instance TEXT NOT NULL, stats TEXT NOT NULL,'
+            ' PRIMARY KEY (run_id, algorithm));'
+            'CREATE TABLE IF NOT EXISTS baselines ('
+            ' algorithm TEXT NOT NULL, n_cities INTEGER NOT NULL, instance TEXT NOT NULL,'
+            ' run_id INTEGER NOT NULL REFERENCES runs(id),'
+            ' PRIMARY KEY (algorithm, n_cities, instance));'
+        )
+        self._db.commit()
+
+    def import_results(self, data: Dict, label: str = None, source: str = None) -> int:
+        """Lưu một bộ kết quả (định dạng của TSPBenchmark.save_results), trả về id của run"""
+        if source is not None:
+            row = self._db.execute('SELECT id FROM runs WHERE source = ?', (source,)).fetchone()
+            if row is not None:
+                return row[0]
+        metadata = data['metadata']
+        n_cities = int(metadata['n_cities'])
+        # Instance có tên (corpus); file cũ chỉ có kích thước -> ''
+        instance = (metadata.get('instance') or {}).get('name', '')
+        cursor = self._db.execute(
+            'INSERT INTO runs (label, source, timestamp, n_cities, metadata, imported)'
+            ' VALUES (?, ?, ?, ?, ?, ?)',
+            (label, source, metadata.get('timestamp'), n_cities, json.dumps(metadata), time.time()))
+        run_id = cursor.lastrowid
+        self._db.executemany(
+            'INSERT INTO results (run_id, algorithm, n_cities, instance, stats) VALUES (?, ?, ?, ?, ?)',
+            [(run_id, algorithm, n_cities, instance, json.dumps(stats))
+             for algorithm, stats in data['results'].items()])
+        self._db.commit()
+        return run_id
+
+    def import_file(self, path: str, label: str = None) -> int:
+        """Nhập một file JSON kết quả (bỏ qua nếu đã nhập)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return self.import_results(data, label=label, source=os.path.abspath(path))
+
+    def import_files(self, patterns: List[str], label: str = None) -> List[int]:
+        paths = sorted({path for pattern in patterns for path in glob.glob(pattern)})
+        return [self.import_file(path, label) for path in paths]
+
+    def runs(self) -> List[Dict]:
+        rows = self._db.execute(
+            'SELECT id, label, source, timestamp, n_cities FROM runs ORDER BY id').fetchall()
+        return [dict(zip(('id', 'label', 'source', 'timestamp', 'n_cities'), row)) for row in rows]
+
+    def _run_ids(self, run: str) -> List[int]:
+        """Id của các run ứng với một id hoặc một label"""
+        if str(run).isdigit():
+            return [int(run)]
+        rows = self._db.execute('SELECT id FROM runs WHERE label = ? ORDER BY id', (run,)).fetchall()
+        if not rows:
+            raise ValueError(f"Unknown run or label: {run}")
+        return [row[0] for row in rows]
+
+    def results(self, run_ids: List[int]) -> Dict[Tuple[str, int, str], Tuple[int, Dict]]:
+        """(algorithm, n_cities, instance) -> (run_id, stats) của các run (run sau ghi đè run trước)"""
+        out = {}
+        for run_id in sorted(run_ids):
+            for algorithm, n_cities, instance, stats in self._db.execute(
+                    'SELECT algorithm, n_cities, instance, stats FROM results WHERE run_id = ?',
+                    (run_id,)):
+                out[(algorithm, n_cities, instance)] = (run_id, json.loads(stats))
+        return out
+
+    def set_baseline(self, run: str, algorithms: Optional[List[str]] = None) -> int:
+        """Đặt run (id hoặc label) làm baseline cho mọi (thuật toán, kích thước, instance) nó chứa"""
+        entries = self.results(self._run_ids(run))
+        chosen = [(*key, run_id) for key, (run_id, _) in entries.items()
+                  if algorithms is None or key[0] in algorithms]
+        self._db.executemany('INSERT OR REPLACE INTO baselines (algorithm, n_cities, instance, run_id)'
+                             ' VALUES (?, ?, ?, ?)', chosen)
+        self._db.commit()
+        return len(chosen)
+
+    def baseline_for(self, algorithm: str, n_cities: int, instance: str,
+                     before: int) -> Optional[Tuple[int, Dict]]:
+        """Baseline đã chọn, nếu chưa chọn thì run gần nhất trước đó có cùng (thuật toán, kích thước)"""
+        row = self._db.execute(
+            'SELECT r.run_id, r.stats FROM baselines b JOIN results r'
+            ' ON r.run_id = b.run_id AND r.algorithm = b.algorithm'
+            ' WHERE b.algorithm = ? AND b.n_cities = ? AND b.instance = ?',
+            (algorithm, n_cities, instance)).fetchone()
+        if row is None:
+            row = self._db.execute(
+                'SELECT run_id, stats FROM results'
+                ' WHERE algorithm = ? AND n_cities = ? AND instance = ? AND run_id < ?'
+                ' ORDER BY run_id DESC LIMIT 1', (algorithm, n_cities, instance, before)).fetchone()
+        return None if row is None else (row[0], json.loads(row[1]))
+
+    def compare(self, run_ids: List[int], baseline: str = None,
+                thresholds: Dict[str, float] = None, alpha: float = 0.05) -> List[Dict]:
+        """
+        So sánh các run với baseline cho từng (thuật toán, kích thước, chỉ số)
+        baseline: Run/label cụ thể (mặc định: baseline đã đặt, hoặc run trước đó)
+        thresholds: Mức tăng tương đối tối thiểu coi là hồi quy theo chỉ số
+        alpha: Mức ý nghĩa của kiểm định một phía
+        """
+        thresholds = {**{name: default for name, (_, default) in METRICS.items()}, **(thresholds or {})}
+        explicit = self.results(self._run_ids(baseline)) if baseline is not None else None
+
+        rows = []
+        for (algorithm, n_cities, instance), (run_id, stats) in sorted(self.results(run_ids).items()):
+            if explicit is not None:
+                base = explicit.get((algorithm, n_cities, instance))
+            else:
+                base = self.baseline_for(algorithm, n_cities, instance, before=run_id)
+            if base is None or base[0] == run_id:
+                continue
+            for name, (key, _) in METRICS.items():
+                result = compare_metric(stats, base[1], key)
+                if result is None:
+                    continue
+                threshold = thresholds[name]
+                significant = result['p_value'] < alpha
+                if significant and result['ratio'] > 1 + threshold:
+                    status = 'regression'
+                elif result['ratio'] < 1 - threshold and \
+                        compare_metric(base[1], stats, key)['p_value'] < alpha:
+                    status = 'improvement'
+                else:
+                    status = 'ok'
+                rows.append({'algorithm': algorithm, 'n_cities': n_cities, 'instance': instance,
+                             'metric': name,
+                             'run_id': run_id, 'baseline_run': base[0], 'threshold': threshold,
+                             'status': status, **result})
+        return rows
+
+    @staticmethod
+    def print_report(rows: List[Dict]):
+        print(f"\n{'='*115}")
+        print("REGRESSION REPORT")
+        print(f"{'='*115}")
+        print(f"{'Algorithm':<22} {'Instance':<20} {'Metric':<9} {'Baseline':<12} {'Current':<12} "
+              f"{'Change':<9} {'p':<8} {'95% CI':<16} Status")
+        print('-' * 115)
+        for row in rows:
+            ci = f"[{row['ci'][0]:.2f}, {row['ci'][1]:.2f}]" if row['ci'] else '-'
+            marker = {'regression': '❌ REGRESSION', 'improvement': '✓ improvement'}.get(row['status'], 'ok')
+            instance = row['instance'] or f"{row['n_cities']} cities"
+            print(f"{row['algorithm']:<22} {instance:<20} {row['metric']:<9} "
+                  f"{row['baseline']:<12.4g} {row['current']:<12.4g} "
+                  f"{(row['ratio'] - 1) * 100:+8.1f}% {row['p_value']:<8.3f} {ci:<16} {marker}")
+        regressions = sum(row['status'] == 'regression' for row in rows)
+        print('-' * 115)
+        print(f"{regressions} regression(s) in {len(rows)} comparisons")
+        print(f"{'='*115}\n")
+
+    def close(self):
+        self._db.close()
+
+
+def main():
+    """Nhập kết quả, đặt baseline và so sánh; compare trả mã lỗi 1 khi có hồi quy"""
+    parser = argparse.ArgumentParser(description='Benchmark history and regression detection')
+    parser.add_argument('--db', default='benchmark_history.sqlite')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    importer = commands.add_parser('import', help='import result JSON files')
+    importer.add_argument('files', nargs='+')
+    importer.add_argument('--label', default=None)
+
+    commands.add_parser('list', help='list stored runs')
+
+    baseline = commands.add_parser('baseline', help='use a run id or label as baseline')
+    baseline.add_argument('run')
+    baseline.add_argument('--algorithms', nargs='+', default=None)
+
+    compare = commands.add_parser('compare', help='import result files and compare with the baseline')
+    compare.add_argument('files', nargs='+')
+    compare.add_argument('--label', default=None)
+    compare.add_argument('--baseline', default=None, help='run id or label (default: stored baseline)')
+    compare.add_argument('--alpha', type=float, default=0.05)
+    for name, (_, default) in METRICS.items():
+        compare.add_argument(f'--{name}-threshold', type=float, default=default,
+                             help=f'relative {name} increase counted as a regression')
+    args = parser.parse_args()
+
+    history = BenchmarkHistory(args.db)
+    try:
+        if args.command == 'import':
+            ids = history.import_files(args.files, args.label)
+            print(f"✓ Imported {len(ids)} file(s) into {args.db}")
+        elif args.command == 'list':
+            for run in history.runs():
+                print(f"{run['id']:>5}  {run['n_cities']:>7} cities  {run['timestamp'] or '-':<28} "
+                      f"{run['label'] or '-':<16} {run['source'] or '-'}")
+        elif args.command == 'baseline':
+            count = history.set_baseline(args.run, args.algorithms)
+            print(f"✓ Baseline set for {count} (algorithm, size) pair(s)")
+        else:
+            ids = history.import_files(args.files, args.label)
+            if not ids:
+                print("❌ No result files matched")
+                sys.exit(2)
+            thresholds = {name: getattr(args, f'{name}_threshold') for name in METRICS}
+            rows = history.compare(ids, args.baseline, thresholds, args.alpha)
+            history.print_report(rows)
+            if any(row['status'] == 'regression' for row in rows):
+                sys.exit(1)
+    finally:
+        history.close()
+
+
+if __name__ == "__main__":
+    main()
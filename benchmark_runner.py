@@ -0,0 +1,243 @@
+"""
+Parallel Benchmark Runner for TSP Algorithms
+Chạy ma trận (thuật toán, số thành phố, seed, lần chạy) trên nhiều tiến trình
+
+Mỗi worker có thể được gắn cố định vào một CPU và bị giới hạn số luồng BLAS,
+để các worker không tranh nhau lõi; kết quả được gộp lại thành BenchmarkStats
+và lưu cùng định dạng JSON với benchmark.py (kèm fingerprint phần cứng).
+
+    python benchmark_runner.py --sizes 10 20 50 1000 --runs 5 --workers 4 --pin
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from benchmark import (BLAS_THREAD_VARS, BenchmarkStats, PerformanceMetrics, TSPBenchmark,
+                       algorithm_params, default_algorithms, generate_random_cities)
+from solvers import get_solver
+
+
+class BenchmarkTask(NamedTuple):
+    """Một ô của ma trận benchmark: một lần chạy một thuật toán trên một instance"""
+    algorithm: str
+    n_cities: int
+    seed: int
+    run: int
+    params: Dict
+
+
+# Trạng thái riêng của mỗi worker (khởi tạo trong _init_worker)
+_worker_cpu: Optional[int] = None
+_warmed_up = set()
+_thread_limiter = None
+
+
+def _init_worker(cpu_queue, blas_threads: Optional[int]):
+    """Gắn worker vào một CPU và giới hạn luồng BLAS (chạy một lần khi worker khởi động)"""
+    global _worker_cpu, _thread_limiter
+
+    if cpu_queue is not None and hasattr(os, 'sched_setaffinity'):
+        try:
+            _worker_cpu = cpu_queue.get_nowait()
+            os.sched_setaffinity(0, {_worker_cpu})
+        except Exception:  # hết CPU để chia hoặc không được phép gắn: chạy không gắn
+            _worker_cpu = None
+
+    if blas_threads is not None:
+        # Biến môi trường chỉ có tác dụng nếu numpy chưa được import (start method 'spawn');
+        # threadpoolctl (nếu có) giới hạn được cả thư viện BLAS đã nạp
+        try:
+            from threadpoolctl import threadpool_limits
+        except ImportError:
+            pass
+        else:
+            _thread_limiter = threadpool_limits(limits=blas_threads)
+
+
+def _run_task(task: BenchmarkTask, warmup: int, memory_runs: int,
+              measure_rss: bool) -> Tuple[BenchmarkTask, PerformanceMetrics,
+                                          Optional[PerformanceMetrics], Optional[int]]:
+    """Đo một lần chạy trong worker; chỉ các lần chạy đầu đo thêm bộ nhớ"""
+    cities = generate_random_cities(task.n_cities, seed=task.seed)
+    benchmark = TSPBenchmark(cities, warmup=warmup, memory_runs=memory_runs,
+                             measure_rss=measure_rss)
+    solver_class = get_solver(task.algorithm)
+
+    # Khởi động một lần cho mỗi (thuật toán, instance) trong mỗi worker
+    key = (task.algorithm, task.n_cities, task.seed)
+    if key not in _warmed_up:
+        for _ in range(warmup):
+            benchmark._measure_time(solver_class, **task.params)
+        _warmed_up.add(key)
+
+    metrics = benchmark._measure_time(solver_class, **task.params)
+    memory = None
+    if task.run < memory_runs:
+        memory = benchmark._measure_memory(solver_class, **task.params)
+    metrics.tour = list(metrics.tour)
+    return task, metrics, memory, _worker_cpu
+
+
+def build_tasks(sizes: List[int], n_runs: int, seeds: List[int] = (42,),
+                algorithms: Optional[List[str]] = None,
+                aco_params: Dict = None) -> List[BenchmarkTask]:
+    """
+    Ma trận (thuật toán × số thành phố × seed × lần chạy)
+    algorithms: Tên solver đã đăng ký bất kỳ (mặc định: default_algorithms theo kích thước);
+        ValueError nếu có tên chưa đăng ký.
+    Sắp xếp tác vụ lớn trước (LPT) để các worker kết thúc gần cùng lúc.
+    """
+    tasks = []
+    for n_cities in sizes:
+        if algorithms is None:
+            selected = default_algorithms(n_cities, aco_params)
+        else:
+            selected = {algorithm: algorithm_params(algorithm, n_cities, aco_params)
+                        for algorithm in algorithms}
+        for algorithm, params in selected.items():
+            for seed in seeds:
+                for run in range(n_runs):
+                    tasks.append(BenchmarkTask(algorithm, n_cities, seed, run, params))
+
+    # Ant Colony đắt nhất, sau đó theo kích thước
+    tasks.sort(key=lambda t: (t.algorithm == 'ant_colony', t.n_cities), reverse=True)
+    return tasks
+
+
+class ParallelBenchmark:
+    """Lập lịch các lần chạy benchmark trên một pool tiến trình"""
+
+    def __init__(self, n_workers: Optional[int] = None, pin_cpus: bool = False,
+                 blas_threads: Optional[int] = 1, start_method: str = 'spawn',
+                 warmup: int = 1, memory_runs: int = 1, measure_rss: bool = True):
+        """
+        n_workers: Số tiến trình worker (mặc định: số CPU được phép dùng)
+        pin_cpus: Gắn mỗi worker vào một CPU riêng (chỉ Linux)
+        blas_threads: Số luồng BLAS/OpenMP mỗi worker (None: không giới hạn)
+        start_method: 'spawn' (mặc định, worker import numpy sau khi biến
+            môi trường đã đặt) hoặc 'fork' / 'forkserver'
+        warmup, memory_runs, measure_rss: Như TSPBenchmark
+        """
+        available = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') \
+            else list(range(os.cpu_count() or 1))
+        if start_method not in mp.get_all_start_methods():
+            raise ValueError(f"start_method must be one of {mp.get_all_start_methods()}, "
+                             f"got {start_method!r}")
+        self.n_workers = n_workers or len(available)
+        if self.n_workers < 1:
+            raise ValueError(f"n_workers must be positive, got {self.n_workers}")
+        self.pin_cpus = pin_cpus and hasattr(os, 'sched_setaffinity')
+        self.cpus = available
+        self.blas_threads = blas_threads
+        self.start_method = start_method
+        self.warmup = warmup
+        self.memory_runs = memory_runs
+        self.measure_rss = measure_rss
+
+    def worker_cpus(self) -> List[int]:
+        """CPU gắn cho từng worker (xoay vòng nếu nhiều worker hơn CPU)"""
+        return [self.cpus[i % len(self.cpus)] for i in range(self.n_workers)]
+
+    def config(self) -> Dict:
+        """Cấu hình runner (lưu vào metadata)"""
+        return {
+            'mode': 'parallel',
+            'n_workers': self.n_workers,
+            'pin_cpus': self.pin_cpus,
+            'cpus': self.worker_cpus() if self.pin_cpus else None,
+            'blas_threads': self.blas_threads,
+            'start_method': self.start_method,
+        }
+
+    def run(self, tasks: List[BenchmarkTask]) -> Dict[int, Dict[str, BenchmarkStats]]:
+        """
+        Chạy mọi tác vụ và gộp kết quả
+        Trả về {n_cities: {algorithm: BenchmarkStats}}; các seed của cùng một
+        kích thước được gộp chung vào một BenchmarkStats.
+        """
+        ctx = mp.get_context(self.start_method)
+        cpu_queue = None
+        if self.pin_cpus:
+            cpu_queue = ctx.Queue()
+            for cpu in self.worker_cpus():
+                cpu_queue.put(cpu)
+
+        # Worker spawn kế thừa biến môi trường lúc tạo tiến trình
+        saved_env = {var: os.environ.get(var) for var in BLAS_THREAD_VARS}
+        if self.blas_threads is not None:
+            for var in BLAS_THREAD_VARS:
+                os.environ[var] = str(self.blas_threads)
+
+        timing = defaultdict(list)
+        memory = defaultdict(list)
+        try:
+            with ProcessPoolExecutor(max_workers=self.n_workers, mp_context=ctx,
+                                     initializer=_init_worker,
+                                     initargs=(cpu_queue, self.blas_threads)) as pool:
+                futures = [pool.submit(_run_task, task, self.warmup, self.memory_runs,
+                                       self.measure_rss) for task in tasks]
+                for done, future in enumerate(as_completed(futures), 1):
+                    task, metrics, mem, cpu = future.result()
+                    key = (task.n_cities, task.algorithm)
+                    timing[key].append((task.seed, task.run, metrics))
+                    if mem is not None:
+                        memory[key].append((task.seed, task.run, mem))
+                    where = f" cpu={cpu}" if cpu is not None else ''
+                    print(f"  [{done}/{len(tasks)}] {task.algorithm} n={task.n_cities} "
+                          f"seed={task.seed} run={task.run}{where}: "
+                          f"Time={metrics.execution_time:.4f}s, Distance={metrics.tour_distance:.2f}")
+        finally:
+            for var, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(var, None)
+                else:
+                    os.environ[var] = value
+
+        results = defaultdict(dict)
+        for (n_cities, algorithm), runs in timing.items():
+            # Thứ tự hoàn thành không xác định: sắp lại theo (seed, run)
+            runs = [m for _, _, m in sorted(runs, key=lambda r: r[:2])]
+            mem_runs = [m for _, _, m in sorted(memory[(n_cities, algorithm)], key=lambda r: r[:2])]
+            results[n_cities][algorithm] = BenchmarkStats(runs, mem_runs)
+        return dict(results)
+
+
+def main():
+    """Chạy benchmark song song và lưu mỗi kích thước ra một file JSON"""
+    parser = argparse.ArgumentParser(description='Parallel TSP benchmark runner')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 30, 50])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--seeds', type=int, nargs='+', default=[42])
+    parser.add_argument('--algorithms', nargs='+', default=None)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--pin', action='store_true', help='pin each worker to one CPU')
+    parser.add_argument('--blas-threads', type=int, default=1,
+                        help='BLAS/OpenMP threads per worker (0: no limit)')
+    parser.add_argument('--start-method', default='spawn', choices=mp.get_all_start_methods())
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--memory-runs', type=int, default=1)
+    parser.add_argument('--no-rss', action='store_true')
+    args = parser.parse_args()
+
+    runner = ParallelBenchmark(n_workers=args.workers, pin_cpus=args.pin,
+                               blas_threads=args.blas_threads or None,
+                               start_method=args.start_method, warmup=args.warmup,
+                               memory_runs=args.memory_runs, measure_rss=not args.no_rss)
+    tasks = build_tasks(args.sizes, args.runs, args.seeds, args.algorithms)
+    print(f"Running {len(tasks)} tasks on {runner.n_workers} workers...")
+    all_results = runner.run(tasks)
+
+    for n_cities in sorted(all_results):
+        benchmark = TSPBenchmark(generate_random_cities(n_cities, seed=args.seeds[0]),
+                                 warmup=runner.warmup, memory_runs=runner.memory_runs,
+                                 measure_rss=runner.measure_rss)
+        benchmark.print_comparison(all_results[n_cities])
+        benchmark.save_results(all_results[n_cities], runner={**runner.config(), 'seeds': args.seeds})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Named, cached instance corpus for benchmarks
+Bộ instance có tên, sinh tái lập được từ (phân bố, n, seed, tham số) và được
+lưu đệm thành file .tspb (đọc lại bằng memmap, không phải sinh lại)
+
+    corpus = get_corpus('standard')
+    for name, cities in corpus:
+        ...
+"""
+
+import hashlib
+import json
+import os
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from solvers.binary_io import load_binary, save_binary
+from solvers.generators import DISTRIBUTIONS, generate_points
+
+# Tăng khi thuật toán sinh thay đổi để các file đệm cũ không được dùng lại
+GENERATOR_VERSION = 1
+
+
+class InstanceSpec(NamedTuple):
+    """Mô tả đủ để sinh lại một instance"""
+    name: str
+    distribution: str
+    n: int
+    seed: int
+    # Mặc định là mapping rỗng chỉ đọc, không phải dict dùng chung giữa các spec
+    params: Mapping[str, Any] = MappingProxyType({})
+
+    def key(self) -> str:
+        """Hash nội dung của spec (tên không ảnh hưởng tới điểm sinh ra)"""
+        payload = json.dumps([GENERATOR_VERSION, self.distribution, self.n, self.seed,
+                              dict(self.params)], sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+    def to_dict(self) -> Dict:
+        return {'name': self.name, 'distribution': self.distribution, 'n': self.n,
+                'seed': self.seed, 'params': dict(self.params),
+                'generator_version': GENERATOR_VERSION}
+
+
+def make_specs(sizes: List[int], distributions: Optional[List[str]] = None,
+               seeds: List[int] = (0,)) -> List[InstanceSpec]:
+    """Mọi tổ hợp phân bố × kích thước × seed, tên dạng 'clustered-1000-s0'"""
+    distributions = list(DISTRIBUTIONS) if distributions is None else distributions
+    return [InstanceSpec(f'{distribution}-{n}-s{seed}', distribution, n, seed)
+            for distribution in distributions for n in sizes for seed in seeds]
+
+
+# Các corpus dựng sẵn
+CORPORA: Dict[str, List[InstanceSpec]] = {
+    'small': make_specs([50]),
+    'standard': make_specs([100, 1000], seeds=[0, 1]),
+    'large': make_specs([10_000, 100_000]),
+}
+
+
+class InstanceCorpus:
+    """Tập instance có tên, sinh khi cần và lưu đệm trên đĩa"""
+
+    def __init__(self, specs: List[InstanceSpec], cache_dir: Optional[str] = 'corpus_cache'):
+        """
+        specs: Các instance của corpus (tên phải khác nhau)
+        cache_dir: Thư mục chứa các file .tspb đã sinh (None: không lưu đệm, luôn sinh lại)
+        """
+        names = [spec.name for spec in specs]
+        if len(set(names)) != len(names):
+            raise ValueError("instance names in a corpus must be unique")
+        for spec in specs:
+            if spec.distribution not in DISTRIBUTIONS:
+                raise ValueError(f"Unknown distribution: {spec.distribution}")
+        self.specs = {spec.name: spec for spec in specs}
+        self.cache_dir = cache_dir
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def __iter__(self) -> Iterator[Tuple[str, np.ndarray]]:
+        for name in self.specs:
+            yield name, self.load(name)
+
+    def names(self) -> List[str]:
+        return list(self.specs)
+
+    def spec(self, name: str) -> InstanceSpec:
+        if name not in self.specs:
+            raise ValueError(f"Unknown instance: {name}")
+        return self.specs[name]
+
+    def path(self, name: str) -> Optional[str]:
+        """File đệm của một instance (None nếu không lưu đệm)"""
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f'{name}-{self.spec(name).key()}.tspb')
+
+    def load(self, name: str) -> np.ndarray:
+        """Toạ độ (n, 2) của instance: đọc từ file đệm nếu có, nếu không thì sinh và lưu"""
+        spec = self.spec(name)
+        path = self.path(name)
+        if path is not None and os.path.exists(path):
+            return load_binary(path).cities
+
+        points = generate_points(spec.distribution, spec.n, spec.seed, **spec.params)
+        if path is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Ghi ra file tạm rồi đổi tên để tiến trình khác không đọc phải file dở dang
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            save_binary(tmp_path, points, metadata={'instance': spec.to_dict()})
+            os.replace(tmp_path, path)
+        return points
+
+
+def get_corpus(name: str, cache_dir: Optional[str] = 'corpus_cache') -> InstanceCorpus:
+    """Corpus dựng sẵn theo tên ('small', 'standard', 'large')"""
+    if name not in CORPORA:
+        raise ValueError(f"Unknown corpus: {name}")
+    return InstanceCorpus(CORPORA[name], cache_dir)
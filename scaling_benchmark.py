@@ -0,0 +1,303 @@
+"""
+Scaling Benchmark for TSP Algorithms
+Đo thời gian/bộ nhớ trên các kích thước n tăng theo cấp số nhân và so sánh
+độ dốc log-log thực nghiệm với độ phức tạp mà get_complexity() khai báo
+
+    python scaling_benchmark.py --min-n 10 --max-n 20000 --time-cap 10
+"""
+
+import argparse
+import json
+import re
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from benchmark import TSPBenchmark, environment_fingerprint, generate_random_cities
+from solvers import SOLVERS, get_solver
+from solvers.generators import DISTRIBUTIONS
+from solvers.matrix import matrix_nbytes
+
+# Thuật toán không đo mặc định: Held-Karp (hàm mũ) và Portfolio (chạy theo ngân sách thời gian)
+SKIPPED_BY_DEFAULT = ('held_karp', 'portfolio')
+
+# Tham số cố định để độ phức tạp chỉ còn phụ thuộc vào n
+DEFAULT_PARAMS = {
+    'ant_colony': {'n_ants': 10, 'n_iterations': 10, 'seed': 0},
+}
+
+# Chênh lệch cho phép giữa độ dốc đo được và số mũ khai báo
+# (thừa số log n làm độ dốc lớn hơn một chút trên khoảng n hữu hạn)
+SLOPE_TOLERANCE = 0.35
+LOG_ALLOWANCE = 0.35
+
+_SUPERSCRIPTS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹', '0123456789')
+_N_POWER = re.compile(r'(?<![A-Za-z_])n(?![A-Za-z_(])(?:\^(\d+)|([⁰¹²³⁴⁵⁶⁷⁸⁹]+))?')
+
+
+def _power(caret: str, superscript: str) -> int:
+    if caret:
+        return int(caret)
+    if superscript:
+        return int(superscript.translate(_SUPERSCRIPTS))
+    return 1
+
+
+def parse_complexity(expr: str) -> Tuple[Optional[float], bool]:
+    """
+    Polynomial exponent of n in a Big O string and whether it has a log factor
+    'O(n² log n)' -> (2, True), 'O(iterations × n_ants × n·k)' -> (1, False);
+    (None, False) when the bound is not a polynomial in n (2ⁿ, T(c), ...).
+    """
+    body = expr.strip()
+    if body.startswith('O(') and body.endswith(')'):
+        body = body[2:-1]
+    if 'ⁿ' in body or '^n' in body or re.search(r'[A-Za-z]\(', body.replace('log', '')):
+        return None, False
+
+    if body.strip().isdigit():
+        return 0.0, False
+
+    exponent, has_log = None, False
+    for term in body.split('+'):
+        term_log = bool(re.search(r'log', term))
+        powers = _N_POWER.findall(re.sub(r'log\s*\(?n\)?', '', term))
+        if not powers and not term_log:
+            continue
+        term_exponent = float(sum(_power(caret, sup) for caret, sup in powers))
+        if exponent is None or term_exponent > exponent:
+            exponent, has_log = term_exponent, term_log
+    return exponent, has_log
+
+
+def fit_loglog(sizes: List[int], values: List[float]) -> Optional[Dict]:
+    """Least-squares fit log(value) = slope·log(n) + intercept (cần ít nhất 2 điểm dương)"""
+    points = [(n, v) for n, v in zip(sizes, values) if v > 0]
+    if len(points) < 2:
+        return None
+    x = np.log([n for n, _ in points])
+    y = np.log([v for _, v in points])
+    slope, intercept = np.polyfit(x, y, 1)
+    residual = y - (slope * x + intercept)
+    total = np.sum((y - y.mean()) ** 2)
+    r2 = 1.0 - float(np.sum(residual ** 2)) / float(total) if total > 0 else 1.0
+    return {'slope': round(float(slope), 3), 'intercept': round(float(intercept), 4),
+            'r2': round(r2, 4), 'n_points': len(points)}
+
+
+def check_exponent(fitted: Optional[Dict], declared: str) -> Dict:
+    """So sánh độ dốc đo được với số mũ khai báo"""
+    exponent, has_log = parse_complexity(declared)
+    result = {'declared': declared, 'declared_exponent': exponent, 'declared_log': has_log,
+              'fitted_exponent': fitted['slope'] if fitted else None, 'mismatch': None}
+    if fitted is not None and exponent is not None:
+        low = exponent - SLOPE_TOLERANCE
+        high = exponent + SLOPE_TOLERANCE + (LOG_ALLOWANCE if has_log else 0.0)
+        result['mismatch'] = not (low <= fitted['slope'] <= high)
+    return result
+
+
+def _upper_half(points: List[Dict]) -> List[Dict]:
+    """Điểm có n từ trung điểm log của dải n trở lên (ít nhất 3 điểm cuối)"""
+    if len(points) <= 3:
+        return points
+    midpoint = np.sqrt(points[0]['n'] * points[-1]['n'])
+    upper = [p for p in points if p['n'] >= midpoint]
+    return upper if len(upper) >= 3 else points[-3:]
+
+
+def geometric_sizes(min_n: int, max_n: int, points: int) -> List[int]:
+    """Các kích thước n cách đều trên thang log"""
+    return sorted({int(round(n)) for n in np.geomspace(min_n, max_n, points)})
+
+
+class ScalingBenchmark:
+    """Chạy từng thuật toán trên các n tăng dần cho đến khi vượt giới hạn thời gian/bộ nhớ"""
+
+    def __init__(self, sizes: List[int], time_cap: float = 10.0, matrix_cap_mb: float = 1024.0,
+                 repeats: int = 1, min_fit_time: float = 1e-3, seed: int = 42,
+                 distribution: str = 'uniform'):
+        """
+        sizes: Các số thành phố cần đo (tăng dần)
+        time_cap: Bỏ kích thước tiếp theo khi thời gian dự đoán của một lần chạy vượt quá (giây)
+        matrix_cap_mb: Bỏ kích thước có ma trận khoảng cách lớn hơn (với solver cần ma trận)
+        repeats: Số lần đo thời gian mỗi kích thước (lấy trung vị)
+        min_fit_time: Bỏ các điểm nhanh hơn ngưỡng này khi fit (nhiễu bộ đếm và overhead)
+        distribution: Phân bố điểm của các instance (xem solvers.generators)
+        """
+        self.sizes = sorted(sizes)
+        self.time_cap = time_cap
+        self.matrix_cap_mb = matrix_cap_mb
+        self.repeats = repeats
+        self.min_fit_time = min_fit_time
+        self.seed = seed
+        self.distribution = distribution
+
+    def _too_large(self, solver_class, n: int, done: List[Tuple[int, float]]) -> Optional[str]:
+        """Lý do bỏ qua kích thước n (None nếu vẫn chạy được)"""
+        if solver_class.needs_distance_matrix and \
+                matrix_nbytes(n) / (1024 * 1024) > self.matrix_cap_mb:
+            return 'matrix_cap'
+        if done:
+            # Ngoại suy từ hai điểm cuối (độ dốc tối thiểu 1)
+            (n1, t1), (n2, t2) = (done[-2] if len(done) > 1 else done[-1]), done[-1]
+            slope = 1.0
+            if n2 > n1 and t1 > 0 and t2 > 0:
+                slope = max(1.0, np.log(t2 / t1) / np.log(n2 / n1))
+            if t2 * (n / n2) ** slope > self.time_cap:
+                return 'time_cap'
+        return None
+
+    def run_algorithm(self, algorithm: str, params: Dict = None) -> Dict:
+        """Đo một thuật toán trên mọi kích thước và fit độ dốc thời gian/bộ nhớ"""
+        solver_class = get_solver(algorithm)
+        params = DEFAULT_PARAMS.get(algorithm, {}) if params is None else params
+        points = []
+        done = []
+        stopped = None
+        for n in self.sizes:
+            stopped = self._too_large(solver_class, n, done)
+            if stopped:
+                break
+            benchmark = TSPBenchmark(generate_random_cities(n, seed=self.seed,
+                                                            distribution=self.distribution), warmup=0,
+                                     memory_runs=1, measure_rss=False)
+            try:
+                runs = [benchmark._measure_time(solver_class, **params) for _ in range(self.repeats)]
+                memory = benchmark._measure_memory(solver_class, **params)
+            except (ValueError, MemoryError) as exc:  # ví dụ Held-Karp vượt giới hạn bộ nhớ
+                stopped = f'error: {exc}'
+                break
+            setup = float(np.median([r.setup_time for r in runs]))
+            solve = float(np.median([r.execution_time for r in runs]))
+            points.append({
+                'n': n,
+                'setup_time': setup,
+                'solve_time': solve,
+                'total_time': setup + solve,
+                'memory_mb': memory.setup_memory + memory.memory_usage,
+                'complexity': list(runs[0].complexity) if runs[0].complexity else None,
+            })
+            done.append((n, setup + solve))
+            print(f"  {algorithm} n={n}: {setup + solve:.4f}s, "
+                  f"{memory.setup_memory + memory.memory_usage:.2f} MB")
+
+        return self._fit(algorithm, params, points, stopped)
+
+    def _fit(self, algorithm: str, params: Dict, points: List[Dict], stopped: Optional[str]) -> Dict:
+        declared = next((p['complexity'] for p in reversed(points) if p['complexity']), None)
+        # Độ phức tạp khai báo có thể đổi theo n (ví dụ ACO chuyển sang candidate list):
+        # chỉ fit trên các điểm có cùng khai báo với kích thước lớn nhất
+        same = [p for p in points if p['complexity'] == declared]
+        if len(same) >= 3:
+            points_fit = same
+        else:
+            points_fit = points
+        # Độ phức tạp là tiệm cận: chỉ fit nửa trên của dải n (trên thang log),
+        # bỏ các điểm quá nhanh mà overhead cố định chi phối
+        asymptotic = _upper_half(points_fit)
+        timed = [p for p in asymptotic if p['total_time'] >= self.min_fit_time]
+        if len(timed) < 3:
+            timed = asymptotic
+
+        time_fit = fit_loglog([p['n'] for p in timed], [p['total_time'] for p in timed])
+        memory_fit = fit_loglog([p['n'] for p in asymptotic], [p['memory_mb'] for p in asymptotic])
+        return {
+            'algorithm': algorithm,
+            'params': params,
+            'points': points,
+            'stopped': stopped,
+            'time_fit': time_fit,
+            'memory_fit': memory_fit,
+            'time_check': check_exponent(time_fit, declared[0]) if declared else None,
+            'space_check': check_exponent(memory_fit, declared[1]) if declared else None,
+        }
+
+    def run(self, algorithms: Optional[List[str]] = None) -> Dict[str, Dict]:
+        if algorithms is None:
+            algorithms = [name for name in SOLVERS if name not in SKIPPED_BY_DEFAULT]
+        results = {}
+        for algorithm in algorithms:
+            print(f"Scaling {algorithm} over n = {self.sizes}...")
+            results[algorithm] = self.run_algorithm(algorithm)
+        return results
+
+    @staticmethod
+    def print_report(results: Dict[str, Dict]):
+        """Bảng số mũ khai báo và số mũ đo được"""
+        print(f"\n{'='*100}")
+        print("EMPIRICAL COMPLEXITY")
+        print(f"{'='*100}")
+        print(f"{'Algorithm':<22} {'Declared time':<30} {'Fitted':<8} {'Declared space':<16} "
+              f"{'Fitted':<8} {'n max':<8} Flag")
+        print('-' * 100)
+        for name, result in results.items():
+            time_check = result['time_check'] or {}
+            space_check = result['space_check'] or {}
+            flags = [label for label, check in (('TIME', time_check), ('SPACE', space_check))
+                     if check.get('mismatch')]
+            n_max = result['points'][-1]['n'] if result['points'] else '-'
+            fitted_time = time_check.get('fitted_exponent')
+            fitted_space = space_check.get('fitted_exponent')
+            print(f"{name:<22} {str(time_check.get('declared', '-')):<30} "
+                  f"{'-' if fitted_time is None else f'{fitted_time:.2f}':<8} "
+                  f"{str(space_check.get('declared', '-')):<16} "
+                  f"{'-' if fitted_space is None else f'{fitted_space:.2f}':<8} {n_max!s:<8} "
+                  f"{'MISMATCH ' + '/'.join(flags) if flags else 'ok'}")
+        print(f"{'='*100}\n")
+
+    def save_results(self, results: Dict[str, Dict], filename: str = None) -> str:
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"scaling_results_{timestamp}.json"
+        output = {
+            'metadata': {
+                'sizes': self.sizes,
+                'time_cap': self.time_cap,
+                'matrix_cap_mb': self.matrix_cap_mb,
+                'repeats': self.repeats,
+                'seed': self.seed,
+                'distribution': self.distribution,
+                'timestamp': datetime.now().isoformat(),
+                'environment': environment_fingerprint(),
+            },
+            'results': results
+        }
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+        print(f"✓ Results saved to: {filename}")
+        return filename
+
+
+def main():
+    """Chạy bộ đo scaling; trả về mã lỗi 1 với --strict nếu có khai báo sai"""
+    parser = argparse.ArgumentParser(description='TSP scaling benchmark')
+    parser.add_argument('--min-n', type=int, default=10)
+    parser.add_argument('--max-n', type=int, default=20000)
+    parser.add_argument('--points', type=int, default=12)
+    parser.add_argument('--time-cap', type=float, default=10.0)
+    parser.add_argument('--matrix-cap-mb', type=float, default=1024.0)
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--distribution', default='uniform', choices=list(DISTRIBUTIONS))
+    parser.add_argument('--algorithms', nargs='+', default=None)
+    parser.add_argument('--strict', action='store_true',
+                        help='exit with status 1 when a declared complexity does not match')
+    args = parser.parse_args()
+
+    suite = ScalingBenchmark(geometric_sizes(args.min_n, args.max_n, args.points),
+                             time_cap=args.time_cap, matrix_cap_mb=args.matrix_cap_mb,
+                             repeats=args.repeats, distribution=args.distribution)
+    results = suite.run(args.algorithms)
+    suite.print_report(results)
+    suite.save_results(results)
+
+    mismatched = [name for name, r in results.items()
+                  if any((r[check] or {}).get('mismatch') for check in ('time_check', 'space_check'))]
+    if args.strict and mismatched:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
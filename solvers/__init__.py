@@ -1,14 +1,62 @@
-from .base import TSPSolver
+from .base import SolveCancelled, TSPSolver
 from .nearest_neighbor import NearestNeighbor
 from .nearest_insertion import NearestInsertion
 from .farthest_insertion import FarthestInsertion
 from .ant_colony import AntColonyOptimization
+from .held_karp import HeldKarp
+from .greedy_edge import GreedyEdge
+from .savings import Savings
+from .christofides import Christofides
+from .space_filling_curve import SpaceFillingCurve, hilbert_order
+from .decomposition import SpatialDecomposition
+from .portfolio import Portfolio
+from .registry import SOLVERS, get_solver, register_solver
+from .metrics import METRICS, get_metric, register_metric
+from .matrix import CondensedMatrix
+from .counters import OperationCounters
+from .profiling import Profiler
+from .async_api import AsyncSolverPool, solve_async
+from .batch import pack_instances, solve_batch
+from .cache import SolutionCache
+from .incremental import IncrementalTour
+from .binary_io import load_binary, save_binary
+from .tsplib import read_tsplib, read_tour, write_tour, write_tsplib
 
 __all__ = [
     "TSPSolver",
+    "SolveCancelled",
     "NearestNeighbor",
     "NearestInsertion",
     "FarthestInsertion",
     "AntColonyOptimization",
+    "HeldKarp",
+    "SpaceFillingCurve",
+    "GreedyEdge",
+    "Savings",
+    "Christofides",
+    "SpatialDecomposition",
+    "Portfolio",
+    "SOLVERS",
+    "get_solver",
+    "register_solver",
+    "METRICS",
+    "get_metric",
+    "register_metric",
+    "CondensedMatrix",
+    "OperationCounters",
+    "Profiler",
+    "AsyncSolverPool",
+    "solve_async",
+    "pack_instances",
+    "solve_batch",
+    "hilbert_order",
+    "SolutionCache",
+    "IncrementalTour",
+    "load_binary",
+    "save_binary",
+    "read_tsplib",
+    "read_tour",
+    "write_tour",
+    "write_tsplib",
 ]
 
@@ -1,12 +1,14 @@
-import random
 import time
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 import numpy as np
 
 
 from .base import TSPSolver
+from .neighbors import candidate_pairs
+from .pheromone import CandidatePheromone
+from .profiling import profiled
 
 
 
@@ -14,6 +16,11 @@ from .base import TSPSolver
 class AntColonyOptimization(TSPSolver):
     """Ant Colony Optimization algorithm for TSP"""
 
+    deterministic = False
+
+    # Ma trận dày chỉ được dựng khi n <= candidate_threshold
+    needs_distance_matrix = False
+
 
     def __init__(self, cities: List[Tuple[float, float]],
                  n_ants: int = 50,
@@ -21,7 +28,13 @@ class AntColonyOptimization(TSPSolver):
                  alpha: float = 1.0,
                  beta: float = 2.0,
                  evaporation: float = 0.5,
-                 q: float = 100.0):
+                 q: float = 100.0,
+                 seed: Optional[int] = None,
+                 k: int = 20,
+                 candidate_threshold: int = 1000,
+                 metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64',
+                 matrix_layout: str = 'dense'):
         """
         Initialize ACO solver
         n_ants: Number of ants
@@ -30,33 +43,69 @@ class AntColonyOptimization(TSPSolver):
         beta: Importance of heuristic (distance)
         evaporation: Pheromone evaporation rate
         q: Pheromone deposit constant
+        seed: Random seed (None = different run every time)
+        k: Candidate neighbours per city used above candidate_threshold
+        candidate_threshold: Up to this many cities pheromone and heuristic
+            are dense n×n matrices; above it they live only on the k-nearest
+            candidate edges (CSR store, memory linear in n)
+        metric: Distance metric name (see solvers.metrics)
+        matrix_dtype, matrix_layout: Distance matrix storage (see TSPSolver)
         """
-        super().__init__(cities)
+        super().__init__(cities, metric, matrix_dtype, matrix_layout)
         self.n_ants = n_ants
         self.n_iterations = n_iterations
         self.alpha = alpha
         self.beta = beta
         self.evaporation = evaporation
         self.q = q
+        self.seed = seed
+        self.k = k
+        self.candidate_threshold = candidate_threshold
+        self.rng = np.random.default_rng(seed)
+        self.sparse = self.n > candidate_threshold
 
 
+        # Ma trận khoảng cách gọn (float32/int32) thì pheromone và heuristic cũng dùng float32
+        dtype = np.float64 if matrix_dtype == 'float64' else np.float32
+        if self.sparse:
+            self._init_candidate_store(dtype)
+            return
+
         initial_pheromone = 1.0 / (self.n * np.mean(self.distance_matrix))
-        self.pheromone = np.ones((self.n, self.n)) * initial_pheromone
+        self.pheromone = np.full((self.n, self.n), initial_pheromone, dtype=dtype)
         np.fill_diagonal(self.pheromone, 0)
 
 
-        self.heuristic = np.zeros((self.n, self.n))
-        for i in range(self.n):
-            for j in range(self.n):
-                if i != j:
-                    self.heuristic[i][j] = 1.0 / self.distance_matrix[i][j]
+        self.heuristic = np.zeros((self.n, self.n), dtype=dtype)
+        with np.errstate(divide='ignore'):
+            for i in range(self.n):
+                self.heuristic[i] = 1.0 / np.asarray(self.distance_matrix[i], dtype=np.float64)
+                self.heuristic[i, i] = 0
+
 
+    def _init_candidate_store(self, dtype):
+        """Pheromone and heuristic on the k-nearest candidate edges only"""
+        u, v = candidate_pairs(self.points, self.k)
+
+        # Ước lượng khoảng cách trung bình bằng mẫu ngẫu nhiên thay vì cả ma trận n×n
+        sample = min(100000, self.n * self.n)
+        a = self.rng.integers(self.n, size=sample)
+        b = self.rng.integers(self.n, size=sample)
+        initial_pheromone = 1.0 / (self.n * float(np.mean(self._pair_distances(a, b))))
+
+        self.pheromone = CandidatePheromone(u, v, self.n, initial_pheromone, dtype)
+        rows = np.repeat(np.arange(self.n), np.diff(self.pheromone.indptr))
+        distances = self._pair_distances(rows, self.pheromone.indices)
+        self.heuristic = (1.0 / np.maximum(distances, 1e-12)).astype(dtype)
+        self._weighted_heuristic = self.heuristic ** self.beta
 
     def get_complexity(self) -> Tuple[str, str]:
         """
         Time Complexity: O(iterations * n_ants * n²)
-        Space Complexity: O(n²)
+        Space Complexity: O(n²) (O(n·k) with the candidate store)
         """
+        if self.sparse:
+            return ("O(iterations × n_ants × n·k)", "O(n·k)")
         return ("O(iterations × n_ants × n²)", "O(n²)")
 
 
@@ -65,10 +114,13 @@ class AntColonyOptimization(TSPSolver):
         return tour, distance, time_taken
 
 
+    @profiled('construct')
     def _construct_solution(self) -> Tuple[List[int], float]:
         """Construct a solution using ant colony"""
+        if self.sparse:
+            return self._construct_candidate_solution()
         # Mỗi kiến bắt đầu từ thành phố ngẫu nhiên (chiến lược đúng của ACO)
-        start = random.randint(0, self.n - 1)
+        start = int(self.rng.integers(self.n))
         tour = [start]
         unvisited = set(range(self.n)) - {start}
 
@@ -77,31 +129,115 @@ class AntColonyOptimization(TSPSolver):
         while unvisited:
             probabilities = []
             for city in unvisited:
-                pheromone = self.pheromone[current][city] ** self.alpha
-                heuristic = self.heuristic[current][city] ** self.beta
-                probabilities.append(pheromone * heuristic)
+                pheromone = self.pheromone[current, city] ** self.alpha
+                heuristic = self.heuristic[current, city] ** self.beta
+                probabilities.append(float(pheromone * heuristic))
 
 
             total = sum(probabilities)
             if total == 0:
-                next_city = random.choice(list(unvisited))
+                next_city = int(self.rng.choice(list(unvisited)))
             else:
                 probabilities = [p / total for p in probabilities]
-                next_city = np.random.choice(list(unvisited), p=probabilities)
+                next_city = int(self.rng.choice(list(unvisited), p=probabilities))
 
 
             tour.append(next_city)
             unvisited.remove(next_city)
             current = next_city
 
+        if self.counters is not None:
+            # Bước thứ r xét n - r thành phố chưa thăm; một số ngẫu nhiên mỗi bước (+ điểm xuất phát)
+            self.counters.candidate_scans += self.n * (self.n - 1) // 2
+            self.counters.rng_draws += self.n
+
 
         distance = self.calculate_tour_distance(tour)
         return tour, distance
 
 
+    def _roulette(self, weights: np.ndarray) -> int:
+        """Index drawn with probability proportional to weights"""
+        cumulative = np.cumsum(weights, dtype=np.float64)
+        total = cumulative[-1]
+        if not (total > 0 and np.isfinite(total)):
+            return int(self.rng.integers(len(weights)))
+        index = int(np.searchsorted(cumulative, self.rng.random() * total, side='right'))
+        return min(index, len(weights) - 1)
+
+    def _construct_candidate_solution(self) -> Tuple[List[int], float]:
+        """
+        Construct a tour on the candidate store
+        The next city is drawn among unvisited candidates of the current
+        city; only when all of them are visited does the ant move to the
+        nearest remaining city (every non-candidate edge has the same trail).
+        """
+        store = self.pheromone
+        visited = np.zeros(self.n, dtype=bool)
+        # Danh sách thành phố chưa thăm, xoá O(1) bằng cách đổi chỗ với phần tử cuối
+        unvisited = np.arange(self.n)
+        where = np.arange(self.n)
+        remaining = self.n
+
+        def visit(city: int):
+            nonlocal remaining
+            visited[city] = True
+            remaining -= 1
+            last = unvisited[remaining]
+            slot = where[city]
+            unvisited[slot], where[last] = last, slot
+
+        current = int(self.rng.integers(self.n))
+        visit(current)
+        tour = [current]
+        fallbacks = 0
+        while remaining:
+            edges = store.neighbors(current)
+            candidates = store.indices[edges]
+            free = ~visited[candidates]
+            if free.any():
+                choices = candidates[free]
+                weights = store.values[edges][free] ** self.alpha * self._weighted_heuristic[edges][free]
+                current = int(choices[self._roulette(weights)])
+            else:
+                # Ngoài tập ứng viên vết pheromone đều bằng mặc định: đi tới thành phố gần nhất
+                choices = unvisited[:remaining]
+                fallbacks += 1
+                if self.counters is not None:
+                    self.counters.candidate_scans += remaining
+                current = int(choices[np.argmin(self._distances_from(current, choices))])
+            visit(current)
+            tour.append(current)
+
+        if self.counters is not None:
+            # Mỗi bước duyệt toàn bộ danh sách ứng viên của thành phố hiện tại
+            self.counters.candidate_scans += int(np.diff(store.indptr)[tour[:-1]].sum())
+            self.counters.rng_draws += self.n - fallbacks
+
+        distance = self.calculate_tour_distance(tour)
+        return tour, distance
+
+    @profiled('pheromone_update')
     def _update_pheromone(self, tours: List[Tuple[List[int], float]]):
         """Update pheromone matrix"""
+        if self.sparse:
+            # Bay hơi chỉ trên n·k cạnh ứng viên, cộng dồn một lần cho mọi kiến
+            self.pheromone.evaporate(self.evaporation)
+            tours = [(np.asarray(tour), distance) for tour, distance in tours if distance > 0]
+            if tours:
+                a = np.concatenate([tour for tour, _ in tours])
+                b = np.concatenate([np.roll(tour, -1) for tour, _ in tours])
+                amounts = np.concatenate([np.full(len(tour), self.q / distance) for tour, distance in tours])
+                self.pheromone.deposit(a, b, amounts)
+            if self.counters is not None:
+                deposited = sum(len(tour) for tour, _ in tours)
+                self.counters.pheromone_updates += len(self.pheromone) + 1 + 2 * deposited
+            return
+
         self.pheromone *= (1 - self.evaporation)
+        if self.counters is not None:
+            self.counters.pheromone_updates += self.n * self.n + 2 * sum(
+                len(tour) for tour, distance in tours if distance > 0)
 
 
         for tour, distance in tours:
@@ -110,33 +246,28 @@ class AntColonyOptimization(TSPSolver):
                 for i in range(len(tour)):
                     from_city = tour[i]
                     to_city = tour[(i + 1) % len(tour)]
-                    self.pheromone[from_city][to_city] += deposit
-                    self.pheromone[to_city][from_city] += deposit
+                    self.pheromone[from_city, to_city] += deposit
+                    self.pheromone[to_city, from_city] += deposit
 
 
-    def solve_with_steps(self) -> Tuple[List[int], float, float, List[Dict]]:
+    def iter_solve(self, min_interval: float = 0.0) -> Iterator[Dict]:
+        """
+        Run ACO, yielding an 'improvement' event whenever an ant beats the
+        best tour, an 'iteration' event after each pheromone update (at most
+        every min_interval seconds) and a final 'done' event
+        """
         start_time = time.time()
-        steps = []
-
+        last_event = start_time
 
         best_tour = None
         best_distance = float('inf')
 
-
-        steps.append({
-            'step': 0,
-            'description': f'Khởi tạo ACO với {self.n_ants} kiến, {self.n_iterations} lần lặp',
-            'tour': None,
-            'iteration': 0,
-            'best_distance': None
-        })
-
-
         for iteration in range(self.n_iterations):
             tours = []
 
 
             for _ in range(self.n_ants):
+                self._checkpoint()
                 tour, distance = self._construct_solution()
                 tours.append((tour, distance))
 
@@ -144,19 +275,77 @@ class AntColonyOptimization(TSPSolver):
                 if distance < best_distance:
                     best_distance = distance
                     best_tour = tour.copy()
+                    last_event = time.time()
+                    yield {
+                        'type': 'improvement',
+                        'iteration': iteration + 1,
+                        'tour': best_tour.copy(),
+                        'best_distance': best_distance,
+                        'elapsed': last_event - start_time
+                    }
 
 
             self._update_pheromone(tours)
 
 
-            if (iteration + 1) % max(1, self.n_iterations // 10) == 0 or iteration == 0:
-                steps.append({
-                    'step': iteration + 1,
-                    'description': f'Lần lặp {iteration + 1}: Khoảng cách tốt nhất = {best_distance:.2f}',
-                    'tour': best_tour.copy() if best_tour else None,
+            now = time.time()
+            if now - last_event >= min_interval:
+                last_event = now
+                yield {
+                    'type': 'iteration',
                     'iteration': iteration + 1,
-                    'best_distance': best_distance
-                })
+                    'tour': None,
+                    'best_distance': best_distance,
+                    'elapsed': now - start_time
+                }
+
+
+        yield {
+            'type': 'done',
+            'iteration': self.n_iterations,
+            'tour': best_tour.copy() if best_tour else None,
+            'best_distance': best_distance,
+            'elapsed': time.time() - start_time
+        }
+
+
+    def solve_with_steps(self) -> Tuple[List[int], float, float, List[Dict]]:
+        start_time = time.time()
+        steps = []
+
+
+        best_tour = None
+        best_distance = float('inf')
+
+
+        steps.append({
+            'step': 0,
+            'description': f'Khởi tạo ACO với {self.n_ants} kiến, {self.n_iterations} lần lặp',
+            'tour': None,
+            'iteration': 0,
+            'best_distance': None
+        })
+
+
+        for event in self.iter_solve():
+            if event['type'] == 'improvement':
+                best_tour = event['tour']
+                best_distance = event['best_distance']
+                continue
+            if event['type'] != 'iteration':
+                continue
+
+
+            iteration = event['iteration'] - 1
+            if (iteration + 1) % max(1, self.n_iterations // 10) == 0 or iteration == 0:
+                with self._span('record_steps'):
+                    steps.append({
+                        'step': iteration + 1,
+                        'description': f'Lần lặp {iteration + 1}: Khoảng cách tốt nhất = {best_distance:.2f}',
+                        'tour': best_tour.copy() if best_tour else None,
+                        'iteration': iteration + 1,
+                        'best_distance': best_distance
+                    })
 
 
         time_taken = time.time() - start_time
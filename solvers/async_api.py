@@ -0,0 +1,182 @@
+import asyncio
+import multiprocessing as mp
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from .base import SolveCancelled, TSPSolver
+
+SolverSpec = Union[str, Type[TSPSolver]]
+
+
+def _make_solver(solver: SolverSpec, cities, params: Dict) -> TSPSolver:
+    """Build a solver from a registered name or a TSPSolver subclass"""
+    if isinstance(solver, str):
+        from .registry import get_solver
+        solver = get_solver(solver)
+    return solver(cities, **params)
+
+
+def _thread_job(solver: SolverSpec, cities, params: Dict,
+                cancel: threading.Event) -> Tuple[List[int], float, float]:
+    """
+    Run a solver in a worker thread
+    Threads cannot be killed, so cancellation is cooperative: the solver
+    checks the event at the checkpoints of its main loop (TSPSolver._checkpoint)
+    and between progress events.
+    """
+    if cancel.is_set():
+        raise SolveCancelled()
+    instance = _make_solver(solver, cities, params)
+    instance.cancel_event = cancel
+    best_tour, best_distance = None, float('inf')
+    elapsed = 0.0
+    events = instance.iter_solve()
+    try:
+        for event in events:
+            if event['tour'] is not None:
+                best_tour, best_distance = event['tour'], event['best_distance']
+            elapsed = event['elapsed']
+            if cancel.is_set():
+                raise SolveCancelled()
+    finally:
+        events.close()
+    return best_tour, best_distance, elapsed
+
+
+def _discard_result(future: asyncio.Future):
+    """Retrieve the outcome of an abandoned job so asyncio does not log it as unhandled"""
+    if not future.cancelled():
+        future.exception()
+
+
+def _process_job(conn, solver: SolverSpec, cities, params: Dict):
+    """Run a solver in a dedicated process and send the result through a pipe"""
+    try:
+        tour, distance, time_taken = _make_solver(solver, cities, params).solve()
+        conn.send(('ok', (list(tour), float(distance), time_taken)))
+    except Exception as exc:
+        conn.send(('error', exc))
+    finally:
+        conn.close()
+
+
+class AsyncSolverPool:
+    """asyncio front end that runs solvers in threads or processes"""
+
+    def __init__(self, executor: str = 'thread', max_workers: Optional[int] = None):
+        """
+        executor: 'thread' (cooperative cancellation at the solvers' checkpoints)
+            or 'process' (one process per request, terminated on cancellation)
+        max_workers: Maximum number of solves running at once; further
+            requests wait on a semaphore without blocking the event loop
+        """
+        if executor not in ('thread', 'process'):
+            raise ValueError(f"executor must be 'thread' or 'process', got {executor!r}")
+        self.executor = executor
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._threads = ThreadPoolExecutor(self.max_workers) if executor == 'thread' else None
+        self._mp_context = mp.get_context()
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """One semaphore per event loop (asyncio primitives are loop-bound)"""
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_workers)
+        return self._semaphores[loop]
+
+    async def solve(self, solver: SolverSpec, cities, timeout: Optional[float] = None,
+                    **params) -> Tuple[List[int], float, float]:
+        """
+        Solve without blocking the event loop, returns (tour, distance, time_taken)
+        solver: Registered solver name or TSPSolver subclass
+        timeout: Seconds before the request is cancelled (raises asyncio.TimeoutError)
+        params: Constructor keyword arguments for the solver
+        """
+        async with self._semaphore():
+            if self.executor == 'thread':
+                job = self._solve_in_thread(solver, cities, params)
+            else:
+                job = self._solve_in_process(solver, cities, params)
+            return await asyncio.wait_for(job, timeout)
+
+    async def _solve_in_thread(self, solver: SolverSpec, cities, params: Dict):
+        loop = asyncio.get_running_loop()
+        cancel = threading.Event()
+        future = loop.run_in_executor(self._threads, _thread_job, solver, cities, params, cancel)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # Báo cho luồng dừng ở checkpoint kế tiếp nhưng không đợi nó: người gọi
+            # nhận lỗi ngay. Luồng bị bỏ vẫn chiếm một worker của thread pool cho tới
+            # checkpoint, nên các yêu cầu mới xếp hàng trong pool chứ không chạy vượt tải.
+            cancel.set()
+            future.add_done_callback(_discard_result)
+            raise
+
+    async def _solve_in_process(self, solver: SolverSpec, cities, params: Dict):
+        loop = asyncio.get_running_loop()
+        receiver, sender = self._mp_context.Pipe(duplex=False)
+        cities = np.asarray(cities, dtype=float)
+        proc = self._mp_context.Process(target=_process_job,
+                                        args=(sender, solver, cities, params), daemon=True)
+        proc.start()
+        sender.close()
+        try:
+            await self._wait_readable(loop, receiver, proc)
+            try:
+                status, payload = receiver.recv()
+            except EOFError:
+                proc.join()
+                raise RuntimeError(f"solver process exited with code {proc.exitcode}") from None
+            if status == 'error':
+                raise payload
+            return payload
+        finally:
+            # Hết giờ hoặc bị huỷ: kết thúc tiến trình ngay
+            if proc.is_alive():
+                proc.terminate()
+            await loop.run_in_executor(None, proc.join)
+            receiver.close()
+
+    async def _wait_readable(self, loop, conn, proc):
+        """Wait until the pipe has data or the worker has exited"""
+        ready = loop.create_future()
+        try:
+            loop.add_reader(conn.fileno(), lambda: ready.done() or ready.set_result(None))
+        except NotImplementedError:
+            # Event loop không hỗ trợ add_reader (Windows): hỏi vòng
+            while not conn.poll() and proc.is_alive():
+                await asyncio.sleep(0.01)
+            return
+        try:
+            await ready
+        finally:
+            loop.remove_reader(conn.fileno())
+
+    def close(self):
+        """Shut down the thread pool (running processes end with their requests)"""
+        if self._threads is not None:
+            self._threads.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> 'AsyncSolverPool':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+_default_pools: Dict[str, AsyncSolverPool] = {}
+
+
+async def solve_async(solver: SolverSpec, cities, timeout: Optional[float] = None,
+                      executor: str = 'thread', **params) -> Tuple[List[int], float, float]:
+    """Solve on a shared default pool of the given executor kind"""
+    if executor not in _default_pools:
+        _default_pools[executor] = AsyncSolverPool(executor)
+    return await _default_pools[executor].solve(solver, cities, timeout=timeout, **params)
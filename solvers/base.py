@@ -1,41 +1,257 @@
-import math
-from typing import List, Tuple
+import inspect
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 
+from .counters import OperationCounters
+from .matrix import MATRIX_DTYPES, MATRIX_LAYOUTS, DistanceMatrix, build_distance_matrix, cast_distances
+from .metrics import get_metric
+from .mst import prim_mst
+from .profiling import NULL_SPAN, Profiler, profiled
+
+
+class SolveCancelled(Exception):
+    """Raised from a solver's main loop once its cancel_event is set"""
+
+
+def as_points(cities) -> np.ndarray:
+    """Coordinates as an (n, 2) float64 array, zero-copy when already one"""
+    points = np.asarray(cities, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != 2:
+        points = points.reshape(-1, 2)
+    return points
+
 
 class TSPSolver:
     """Base class for TSP solvers"""
 
-    def __init__(self, cities: List[Tuple[float, float]]):
+    # Solvers that only look at coordinates set this to False so the
+    # O(n²) matrix is never built unless something actually asks for it
+    needs_distance_matrix = True
+
+    # Stochastic solvers set this to False (their results depend on a seed)
+    deterministic = True
+
+    # OperationCounters khi đã bật enable_counters(), None thì không đếm gì
+    counters: Optional[OperationCounters] = None
+
+    # Profiler khi đã bật enable_profiling(), None thì các span không làm gì
+    profiler: Optional[Profiler] = None
+
+    # Đặt event này (ví dụ từ luồng khác) để solve() dừng ở checkpoint kế tiếp
+    cancel_event: Optional[threading.Event] = None
+
+    def __init__(self, cities: List[Tuple[float, float]], metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64', matrix_layout: str = 'dense'):
         """
         Initialize with list of city coordinates
-        cities: List of (x, y) tuples
+        cities: List of (x, y) tuples or an (n, 2) array (float64 arrays and
+            memmaps are used as-is, without a copy)
+        metric: Registered distance metric name (see solvers.metrics)
+        matrix_dtype: 'float64', 'float32' or 'int32' (rounded; exact for TSPLIB metrics).
+            Solvers that work from coordinates without a matrix round their
+            distances the same way, so every solver scores tours alike.
+        matrix_layout: 'dense' n×n array or 'condensed' upper triangle (half
+            the memory); only affects solvers that build a matrix
         """
+        if matrix_dtype not in MATRIX_DTYPES:
+            raise ValueError(f"matrix_dtype must be one of {MATRIX_DTYPES}, got {matrix_dtype!r}")
+        if matrix_layout not in MATRIX_LAYOUTS:
+            raise ValueError(f"matrix_layout must be one of {MATRIX_LAYOUTS}, got {matrix_layout!r}")
+        self.metric = metric
+        self._metric = get_metric(metric)
+        self.matrix_dtype = matrix_dtype
+        self.matrix_layout = matrix_layout
         self.cities = cities
-        self.n = len(cities)
-        self.distance_matrix = self._calculate_distance_matrix()
-
-    def _calculate_distance_matrix(self) -> np.ndarray:
-        """Calculate Euclidean distance matrix between all cities"""
-        matrix = np.zeros((self.n, self.n))
-        for i in range(self.n):
-            for j in range(self.n):
-                if i != j:
-                    dx = self.cities[i][0] - self.cities[j][0]
-                    dy = self.cities[i][1] - self.cities[j][1]
-                    matrix[i][j] = math.sqrt(dx * dx + dy * dy)
-        return matrix
+        self.points = as_points(cities)
+        self.n = len(self.points)
+        self._distance_matrix = None
+        self._mst = None
+        if self.needs_distance_matrix:
+            self._distance_matrix = self._calculate_distance_matrix()
+
+    @classmethod
+    def resolve_params(cls, **params) -> Dict:
+        """
+        Constructor keyword arguments with defaults filled in (cities excluded)
+        Raises TypeError for parameters the constructor does not accept.
+        """
+        bound = inspect.signature(cls.__init__).bind(None, None, **params)
+        bound.apply_defaults()
+        resolved = dict(bound.arguments)
+        for name in list(resolved)[:2]:  # self, cities
+            del resolved[name]
+        return resolved
+
+    @classmethod
+    def is_deterministic(cls, params: Dict) -> bool:
+        """Whether solving with these constructor params always gives the same tour"""
+        return cls.deterministic or params.get('seed') is not None
+
+    def get_params(self) -> Dict:
+        """Constructor parameters of this solver instance"""
+        return {name: getattr(self, name) for name in self.resolve_params()
+                if hasattr(self, name)}
+
+    def _matrix_params(self) -> Dict:
+        """Metric and matrix storage options, forwarded to sub-solvers"""
+        return {'metric': self.metric, 'matrix_dtype': self.matrix_dtype,
+                'matrix_layout': self.matrix_layout}
+
+    @property
+    def distance_matrix(self) -> DistanceMatrix:
+        """Distance matrix, built on first access for lazy solvers"""
+        if self._distance_matrix is None:
+            self._distance_matrix = self._calculate_distance_matrix()
+        return self._distance_matrix
+
+    @profiled('distance_matrix')
+    def _calculate_distance_matrix(self) -> DistanceMatrix:
+        """Calculate the distance matrix between all cities under the solver's metric"""
+        return build_distance_matrix(self.points, self._metric, self.matrix_dtype, self.matrix_layout)
+
+    def enable_counters(self) -> OperationCounters:
+        """Start counting operations (see solvers.counters); returns the counters"""
+        self.counters = OperationCounters()
+        return self.counters
+
+    def disable_counters(self):
+        self.counters = None
+
+    def enable_profiling(self, profiler: Optional[Profiler] = None) -> Profiler:
+        """Record phase spans into profiler (a new one by default, see solvers.profiling)"""
+        self.profiler = profiler if profiler is not None else Profiler()
+        return self.profiler
+
+    def disable_profiling(self):
+        self.profiler = None
+
+    def _checkpoint(self):
+        """Cancellation point in a solver's main loop: raises SolveCancelled once cancel_event is set"""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise SolveCancelled()
 
+    def _span(self, name: str, **args):
+        """Span `name` of the solver's profiler, a shared no-op context when profiling is off"""
+        if self.profiler is None:
+            return NULL_SPAN
+        return self.profiler.span(name, **args)
+
+    @profiled('tour_distance')
     def calculate_tour_distance(self, tour: List[int]) -> float:
         """Calculate total distance of a tour"""
-        total = 0
+        if self.counters is not None:
+            self.counters.distance_lookups += len(tour)
+        if self._distance_matrix is None:
+            return self._coordinate_tour_distance(tour)
+        matrix = self.distance_matrix
+        total = 0.0
         for i in range(len(tour)):
             from_city = tour[i]
             to_city = tour[(i + 1) % len(tour)]
-            total += self.distance_matrix[from_city][to_city]
+            total += float(matrix[from_city, to_city])
         return total
 
+    def _coordinate_tour_distance(self, tour: List[int]) -> float:
+        """Tour distance straight from coordinates, without a distance matrix"""
+        if len(tour) < 2:
+            return 0.0
+        points = self.points[np.asarray(tour)]
+        return float(np.sum(self._coordinate_distances(points, np.roll(points, -1, axis=0)),
+                            dtype=np.float64))
+
+    def _coordinate_distances(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Metric distances between points, cast like the matrix would store them"""
+        distances = self._metric(a, b)
+        if self.matrix_dtype == 'float64':
+            return distances
+        return cast_distances(distances, np.dtype(self.matrix_dtype))
+
+    def _distances_from(self, city: int, targets=None) -> np.ndarray:
+        """Distances from one city to targets (all cities by default)"""
+        if self.counters is not None:
+            self.counters.distance_lookups += self.n if targets is None else len(targets)
+        if self._distance_matrix is not None:
+            row = self._distance_matrix[city]
+            return row if targets is None else row[targets]
+        points = self.points
+        others = points if targets is None else points[targets]
+        return self._coordinate_distances(others, points[city])
+
+    def _pair_distances(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        """Distances of the city pairs (u[i], v[i])"""
+        if self.counters is not None:
+            self.counters.distance_lookups += np.size(u)
+        if self._distance_matrix is not None:
+            return self._distance_matrix[u, v]
+        points = self.points
+        return self._coordinate_distances(points[u], points[v])
+
+    def minimum_spanning_tree(self) -> Tuple[np.ndarray, float]:
+        """
+        MST of the instance as (parent array, total weight)
+        Computed once per solver and shared by every caller (solvers, lower bounds).
+        """
+        if self._mst is None:
+            with self._span('mst'):
+                self._mst = prim_mst(self.distance_matrix)
+            if self.counters is not None:
+                # Prim dày đặc: mỗi bước duyệt một hàng ma trận
+                self.counters.distance_lookups += self.n * (self.n - 1)
+                self.counters.candidate_scans += self.n * (self.n - 1)
+        return self._mst
+
+    def lower_bound(self) -> float:
+        """MST weight, a lower bound on the optimal tour length"""
+        return self.minimum_spanning_tree()[1]
+
+    @profiled('join_fragments')
+    def _join_path_fragments(self, adjacency: List[List[int]]) -> List[int]:
+        """
+        Chain the paths described by an adjacency list into a single tour
+        Cities with no neighbours count as one-city paths. Paths are linked
+        nearest endpoint first, starting from the path found first.
+        """
+        visited = [False] * self.n
+        fragments = []
+        for city in range(self.n):
+            if visited[city] or len(adjacency[city]) == 2:
+                continue
+            # Duyệt từ một đầu mút của đoạn đường
+            path = [city]
+            visited[city] = True
+            prev, current = None, city
+            while True:
+                nxt = [c for c in adjacency[current] if c != prev]
+                if not nxt:
+                    break
+                prev, current = current, nxt[0]
+                path.append(current)
+                visited[current] = True
+            fragments.append(path)
+
+        # Nối các đoạn theo kiểu láng giềng gần nhất giữa các đầu mút
+        heads = np.array([f[0] for f in fragments])
+        tails = np.array([f[-1] for f in fragments])
+        used = np.zeros(len(fragments), dtype=bool)
+        tour = list(fragments[0])
+        used[0] = True
+        for _ in range(len(fragments) - 1):
+            end = tour[-1]
+            to_heads = np.where(used, np.inf, self._distances_from(end, heads))
+            to_tails = np.where(used, np.inf, self._distances_from(end, tails))
+            best_head = int(np.argmin(to_heads))
+            best_tail = int(np.argmin(to_tails))
+            if to_heads[best_head] <= to_tails[best_tail]:
+                tour.extend(fragments[best_head])
+                used[best_head] = True
+            else:
+                tour.extend(reversed(fragments[best_tail]))
+                used[best_tail] = True
+        return tour
+
     def solve(self):
         """
         Solve TSP and return (tour, distance, time_taken)
@@ -50,10 +266,56 @@ class TSPSolver:
         """
         raise NotImplementedError
 
+    def iter_solve(self, min_interval: float = 0.0) -> Iterator[Dict]:
+        """
+        Solve incrementally, yielding progress events as dicts:
+        'type' ('improvement', 'iteration' or 'done'), 'iteration',
+        'tour' (best tour so far, None on plain 'iteration' events),
+        'best_distance' and 'elapsed' seconds.
+        min_interval: Minimum seconds between plain 'iteration' events
+        Iterative solvers override this; the default runs solve() and
+        yields a single 'done' event. Closing the generator aborts the run.
+        """
+        start_time = time.time()
+        tour, distance, _ = self.solve()
+        yield {
+            'type': 'done',
+            'iteration': 1,
+            'tour': list(tour),
+            'best_distance': distance,
+            'elapsed': time.time() - start_time
+        }
+
+    def solve_anytime(self, time_budget: float) -> Tuple[List[int], float, float]:
+        """
+        Run iter_solve until it finishes or time_budget seconds pass
+        Returns the best (tour, distance, time_taken) seen so far; the budget
+        is checked between events, so it can be overrun by one event.
+        """
+        start_time = time.time()
+        best_tour, best_distance = None, float('inf')
+        events = self.iter_solve()
+        try:
+            for event in events:
+                if event['tour'] is not None and event['best_distance'] <= best_distance:
+                    best_tour, best_distance = event['tour'], event['best_distance']
+                if time.time() - start_time >= time_budget:
+                    break
+        finally:
+            events.close()
+        return best_tour, best_distance, time.time() - start_time
+
+    def incremental(self, tour: List[int] = None, search_radius: int = 8):
+        """
+        IncrementalTour over this instance for cheap add/remove updates
+        tour: Tour to start from (default: solve() first)
+        """
+        from .incremental import IncrementalTour
+        return IncrementalTour.from_solver(self, tour, search_radius)
+
     def get_complexity(self):
         """
         Return (time_complexity, space_complexity) as Big O notation
         Must be implemented by subclasses
         """
         raise NotImplementedError
-
@@ -0,0 +1,143 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+# Nhiều bài toán nhỏ được gói thành một mảng toạ độ (N, 2) + mảng offsets (m + 1)
+PackedInstances = Tuple[np.ndarray, np.ndarray]
+
+
+def pack_instances(instances: Iterable) -> PackedInstances:
+    """
+    Pack ragged instances into one (N, 2) float64 array plus offsets
+    Instance i occupies coords[offsets[i]:offsets[i + 1]].
+    """
+    arrays = [np.asarray(inst, dtype=np.float64).reshape(-1, 2) for inst in instances]
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(a) for a in arrays])
+    coords = np.concatenate(arrays) if arrays else np.zeros((0, 2))
+    return coords, offsets
+
+
+def _solve_chunk(solver: str, params: Dict, coords: np.ndarray,
+                 offsets: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solve every instance of a packed chunk
+    Tours come back packed the same way (int32, local indices), so only two
+    arrays cross the process boundary per chunk.
+    """
+    from .matrix import cast_distances
+    from .metrics import get_metric
+    from .registry import get_solver
+
+    solver_class = get_solver(solver)
+    metric = get_metric(params.get('metric', 'euclidean'))
+    matrix_dtype = np.dtype(params.get('matrix_dtype', 'float64'))
+    tours = np.empty(len(coords), dtype=np.int32)
+    distances = np.empty(len(offsets) - 1, dtype=np.float64)
+    for i in range(len(offsets) - 1):
+        lo, hi = offsets[i], offsets[i + 1]
+        points = coords[lo:hi]
+        if hi - lo < 3:
+            tour = np.arange(hi - lo)
+            # Làm tròn như solver với matrix_dtype đã chọn (xem TSPSolver._coordinate_distances)
+            edges = cast_distances(metric(points, np.roll(points, -1, axis=0)), matrix_dtype)
+            distance = float(np.sum(edges, dtype=np.float64))
+        else:
+            tour, distance, _ = solver_class(points, **params).solve()
+        tours[lo:hi] = tour
+        distances[i] = distance
+    return tours, distances
+
+
+def _chunks(instances: Union[Iterable, PackedInstances],
+            chunk_size: int) -> Iterator[PackedInstances]:
+    """Split a packed batch, or lazily pack an iterable, into chunks"""
+    if isinstance(instances, tuple) and len(instances) == 2 and np.ndim(instances[1]) == 1 \
+            and np.ndim(instances[0]) == 2:
+        coords, offsets = instances
+        for start in range(0, len(offsets) - 1, chunk_size):
+            stop = min(start + chunk_size, len(offsets) - 1)
+            lo, hi = offsets[start], offsets[stop]
+            yield np.ascontiguousarray(coords[lo:hi], dtype=np.float64), offsets[start:stop + 1] - lo
+        return
+
+    iterator = iter(instances)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield pack_instances(chunk)
+
+
+def solve_batch(instances: Union[Iterable, PackedInstances],
+                solver: str = 'nearest_neighbor',
+                params: Optional[Dict] = None,
+                chunk_size: int = 256,
+                n_workers: Optional[int] = None,
+                ordered: bool = True) -> Iterator[Tuple[int, np.ndarray, float]]:
+    """
+    Solve many small instances across a process pool
+    instances: Iterable of city lists / (n, 2) arrays, or a packed (coords, offsets) pair
+    solver: Registered solver name
+    chunk_size: Instances per task sent to a worker
+    n_workers: Worker processes (default: CPU count, 1 = solve in-process)
+    ordered: Yield in input order, otherwise as chunks complete
+    Yields (index, tour, distance) with the tour as an int32 array.
+    """
+    params = params or {}
+    n_workers = n_workers or os.cpu_count() or 1
+    chunks = _chunks(instances, chunk_size)
+
+    def results_of(first_index, offsets, tours, distances):
+        for i in range(len(offsets) - 1):
+            yield first_index + i, tours[offsets[i]:offsets[i + 1]], float(distances[i])
+
+    if n_workers <= 1:
+        first_index = 0
+        for coords, offsets in chunks:
+            tours, distances = _solve_chunk(solver, params, coords, offsets)
+            yield from results_of(first_index, offsets, tours, distances)
+            first_index += len(offsets) - 1
+        return
+
+    # Giữ tối đa 2 chunk mỗi worker (đang chạy hoặc đã xong nhưng chờ chunk trước
+    # đó khi ordered) để luồng vào và kết quả không bị dồn hết vào bộ nhớ
+    max_in_flight = 2 * n_workers
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        in_flight = {}
+        done_chunks = {}
+        next_chunk = 0
+        next_to_yield = 0
+        first_index = 0
+        exhausted = False
+
+        while True:
+            while not exhausted and len(in_flight) + len(done_chunks) < max_in_flight:
+                try:
+                    coords, offsets = next(chunks)
+                except StopIteration:
+                    exhausted = True
+                    break
+                future = pool.submit(_solve_chunk, solver, params, coords, offsets)
+                in_flight[future] = (next_chunk, first_index, offsets)
+                next_chunk += 1
+                first_index += len(offsets) - 1
+
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                chunk_id, chunk_first, offsets = in_flight.pop(future)
+                tours, distances = future.result()
+                if ordered:
+                    done_chunks[chunk_id] = (chunk_first, offsets, tours, distances)
+                else:
+                    yield from results_of(chunk_first, offsets, tours, distances)
+
+            while next_to_yield in done_chunks:
+                yield from results_of(*done_chunks.pop(next_to_yield))
+                next_to_yield += 1
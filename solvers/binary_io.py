@@ -0,0 +1,124 @@
+"""
+Compact binary container for instances and results (.tspb)
+Định dạng nhị phân gọn cho toạ độ, ma trận, tour và metadata; đọc bằng np.memmap
+
+Layout:
+  8 bytes   magic b'TSPBIN01'
+  8 bytes   header length (uint64, little-endian)
+  header    UTF-8 JSON {"metadata": {...}, "arrays": {name: {"dtype", "shape", "offset"}}}
+  arrays    raw C-order data, each starting on a 64-byte boundary
+"""
+
+import json
+import struct
+from typing import Dict, List, Optional
+
+import numpy as np
+
+MAGIC = b'TSPBIN01'
+_ALIGN = 64
+_PREFIX = struct.Struct('<8sQ')
+
+
+class BinaryInstance:
+    """Arrays and metadata read from a .tspb file (memmaps when loaded with mmap=True)"""
+
+    def __init__(self, arrays: Dict[str, np.ndarray], metadata: Dict):
+        self.arrays = arrays
+        self.metadata = metadata
+
+    @property
+    def cities(self) -> np.ndarray:
+        return self.arrays['cities']
+
+    @property
+    def metric(self) -> str:
+        """Solver metric recorded in metadata['metric'] (euclidean when absent)"""
+        return self.metadata.get('metric', 'euclidean')
+
+    @property
+    def matrix(self) -> Optional[np.ndarray]:
+        return self.arrays.get('matrix')
+
+    @property
+    def tours(self) -> Dict[str, np.ndarray]:
+        """Stored tours by name"""
+        return {name[len('tour:'):]: array for name, array in self.arrays.items()
+                if name.startswith('tour:')}
+
+
+def _aligned(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+def save_binary(path: str, cities, matrix=None, tours: Optional[Dict[str, List[int]]] = None,
+                metadata: Optional[Dict] = None):
+    """
+    Write an instance (and optionally results) to a .tspb file
+    cities: (n, 2) coordinates, stored as float64
+    matrix: Optional explicit (n, n) distance matrix, stored with its own dtype
+    tours: Optional {name: tour}, stored as int32
+    metadata: JSON-serializable dict (solver, distances, timestamps, ...)
+    """
+    arrays = {'cities': np.ascontiguousarray(np.asarray(cities, dtype='<f8').reshape(-1, 2))}
+    if matrix is not None:
+        matrix = np.asarray(matrix)
+        arrays['matrix'] = np.ascontiguousarray(matrix, dtype=matrix.dtype.newbyteorder('<'))
+    for name, tour in (tours or {}).items():
+        arrays[f'tour:{name}'] = np.ascontiguousarray(np.asarray(tour, dtype='<i4'))
+
+    # Header chứa offset tuyệt đối nên phải cố định độ dài trước khi tính offset
+    entries = {name: {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': 0}
+               for name, array in arrays.items()}
+    header_size = len(json.dumps({'metadata': metadata or {}, 'arrays': entries}).encode('utf-8'))
+    header_size += 24 * len(entries)  # chỗ cho các chữ số offset
+    offset = _aligned(_PREFIX.size + header_size)
+    for name, array in arrays.items():
+        entries[name]['offset'] = offset
+        offset = _aligned(offset + array.nbytes)
+
+    header = json.dumps({'metadata': metadata or {}, 'arrays': entries}).encode('utf-8')
+    header = header.ljust(header_size)
+
+    with open(path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, len(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(entries[name]['offset'])
+            f.write(array.tobytes())
+        f.truncate(offset)
+
+
+def read_binary_header(path: str) -> Dict:
+    """Parsed JSON header of a .tspb file"""
+    with open(path, 'rb') as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"{path}: not a TSPBIN file")
+        magic, length = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: not a TSPBIN file")
+        return json.loads(f.read(length).decode('utf-8'))
+
+
+def load_binary(path: str, mmap: bool = True) -> BinaryInstance:
+    """
+    Load a .tspb file
+    mmap: Map the arrays read-only instead of reading them (zero-copy; the
+        OS pages data in on demand, so opening is O(1) in the file size)
+    """
+    header = read_binary_header(path)
+    arrays = {}
+    for name, entry in header['arrays'].items():
+        dtype = np.dtype(entry['dtype'])
+        shape = tuple(entry['shape'])
+        if mmap:
+            if int(np.prod(shape)) == 0:
+                arrays[name] = np.zeros(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode='r',
+                                         offset=entry['offset'], shape=shape)
+        else:
+            arrays[name] = np.fromfile(path, dtype=dtype, count=int(np.prod(shape)),
+                                       offset=entry['offset']).reshape(shape)
+    return BinaryInstance(arrays, header['metadata'])
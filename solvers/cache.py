@@ -0,0 +1,176 @@
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from .base import TSPSolver
+from .hashing import canonical_coordinates, instance_hash
+
+CachedSolution = Tuple[List[int], float, float]
+
+
+class SolutionCache:
+    """Two-tier solution cache: in-memory LRU in front of an optional SQLite store"""
+
+    def __init__(self, max_entries: int = 1024,
+                 path: Optional[str] = None,
+                 max_disk_bytes: Optional[int] = None):
+        """
+        max_entries: Solutions kept in memory (least recently used are dropped)
+        path: SQLite file for the persistent tier (None = memory only)
+        max_disk_bytes: Size limit of the stored tours; least recently used
+            rows are deleted when it is exceeded
+        """
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: 'OrderedDict[str, CachedSolution]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0,
+                      'memory_evictions': 0, 'disk_evictions': 0}
+
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS solutions ('
+                ' key TEXT PRIMARY KEY, tour BLOB NOT NULL, distance REAL NOT NULL,'
+                ' solve_time REAL NOT NULL, size INTEGER NOT NULL, last_access REAL NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS idx_last_access ON solutions (last_access)')
+            self._db.commit()
+
+    @staticmethod
+    def make_key(solver_class: Type[TSPSolver], cities, params: Dict) -> str:
+        """Canonical key: coordinates + solver class + resolved constructor parameters"""
+        name = f'{solver_class.__module__}.{solver_class.__qualname__}'
+        return instance_hash(cities, name, solver_class.resolve_params(**params))
+
+    def get(self, key: str) -> Optional[CachedSolution]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.stats['memory_hits'] += 1
+                tour, distance, solve_time = self._memory[key]
+                return list(tour), distance, solve_time
+
+            if self._db is not None:
+                row = self._db.execute(
+                    'SELECT tour, distance, solve_time FROM solutions WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute('UPDATE solutions SET last_access = ? WHERE key = ?',
+                                     (time.time(), key))
+                    self._db.commit()
+                    self.stats['disk_hits'] += 1
+                    solution = (np.frombuffer(row[0], dtype='<i4').tolist(), row[1], row[2])
+                    self._remember(key, solution)
+                    return list(solution[0]), solution[1], solution[2]
+
+            self.stats['misses'] += 1
+            return None
+
+    def put(self, key: str, tour: List[int], distance: float, solve_time: float):
+        solution = ([int(c) for c in tour], float(distance), float(solve_time))
+        with self._lock:
+            self._remember(key, solution)
+            if self._db is not None:
+                blob = np.asarray(solution[0], dtype='<i4').tobytes()
+                self._db.execute(
+                    'INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?)',
+                    (key, blob, solution[1], solution[2], len(blob), time.time())
+                )
+                self._evict_disk()
+                self._db.commit()
+
+    def _remember(self, key: str, solution: CachedSolution):
+        """Insert into the memory tier (lock held)"""
+        self._memory[key] = solution
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats['memory_evictions'] += 1
+
+    def _evict_disk(self):
+        """Delete least recently used rows until under max_disk_bytes (lock held)"""
+        if self.max_disk_bytes is None:
+            return
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM solutions').fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+        for key, size in self._db.execute(
+                'SELECT key, size FROM solutions ORDER BY last_access').fetchall():
+            if total <= self.max_disk_bytes:
+                break
+            self._db.execute('DELETE FROM solutions WHERE key = ?', (key,))
+            total -= size
+            self.stats['disk_evictions'] += 1
+
+    def solve(self, solver: Union[str, Type[TSPSolver]], cities, **params) -> CachedSolution:
+        """
+        Return a cached (tour, distance, solve_time) or solve and store it
+        solver: Registered solver name or TSPSolver subclass
+        The solver (and its distance matrix) is only built on a miss.
+        Stochastic solvers are only cached when a seed is given, otherwise
+        every call would return the same "random" run.
+        """
+        if isinstance(solver, str):
+            from .registry import get_solver
+            solver = get_solver(solver)
+        if not self.cacheable(solver, params):
+            tour, distance, solve_time = solver(cities, **params).solve()
+            return list(tour), float(distance), solve_time
+
+        points = canonical_coordinates(cities)
+        key = self.make_key(solver, points, params)
+
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        tour, distance, solve_time = solver(cities, **params).solve()
+        self.put(key, tour, distance, solve_time)
+        return list(tour), float(distance), solve_time
+
+    def solve_instance(self, solver: TSPSolver) -> CachedSolution:
+        """Same as solve() for an already constructed solver"""
+        params = solver.get_params()
+        if not self.cacheable(type(solver), params):
+            return solver.solve()
+        key = self.make_key(type(solver), solver.cities, params)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        tour, distance, solve_time = solver.solve()
+        self.put(key, tour, distance, solve_time)
+        return list(tour), float(distance), solve_time
+
+    @staticmethod
+    def cacheable(solver_class: Type[TSPSolver], params: Dict) -> bool:
+        return solver_class.is_deterministic(params)
+
+    def hit_rate(self) -> float:
+        hits = self.stats['memory_hits'] + self.stats['disk_hits']
+        total = hits + self.stats['misses']
+        return hits / total if total else 0.0
+
+    def disk_usage(self) -> int:
+        """Bytes of tour data in the persistent tier"""
+        if self._db is None:
+            return 0
+        with self._lock:
+            return self._db.execute('SELECT COALESCE(SUM(size), 0) FROM solutions').fetchone()[0]
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute('DELETE FROM solutions')
+                self._db.commit()
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
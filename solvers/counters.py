@@ -0,0 +1,45 @@
+from typing import Dict
+
+# Các loại phép toán được đếm
+COUNTER_NAMES = (
+    'distance_lookups',    # tra/tính một khoảng cách
+    'insertion_evals',     # đánh giá chi phí chèn một thành phố vào một vị trí
+    'candidate_scans',     # xét một ứng viên (thành phố, cạnh, cặp savings, ...)
+    'pheromone_updates',   # ghi pheromone lên một cạnh (bay hơi hoặc bồi đắp)
+    'rng_draws',           # số ngẫu nhiên được rút
+)
+
+
+class OperationCounters:
+    """
+    Counts of the basic operations a solver performs
+    Opt-in: solvers only count when TSPSolver.enable_counters() was called.
+    Counts are added in bulk once per loop (not per operation), so the
+    disabled path is a single `is None` check per outer iteration.
+    """
+
+    __slots__ = COUNTER_NAMES
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        for name in COUNTER_NAMES:
+            setattr(self, name, 0)
+
+    def __iadd__(self, other: 'OperationCounters') -> 'OperationCounters':
+        for name in COUNTER_NAMES:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        return self
+
+    @property
+    def comparisons(self) -> int:
+        """Distance lookups, insertion evaluations and candidate scans together"""
+        return self.distance_lookups + self.insertion_evals + self.candidate_scans
+
+    def to_dict(self) -> Dict[str, int]:
+        return {name: int(getattr(self, name)) for name in COUNTER_NAMES}
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{name}={getattr(self, name)}' for name in COUNTER_NAMES)
+        return f'OperationCounters({fields})'
@@ -0,0 +1,221 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base import TSPSolver
+from .counters import OperationCounters
+from .space_filling_curve import hilbert_order
+
+
+def _solve_cell(job: Tuple[str, np.ndarray, Dict, bool]) -> Tuple[np.ndarray, Optional[OperationCounters]]:
+    """
+    Solve one cell in a worker process
+    Returns the sub-tour as local indices and the sub-solver's operation
+    counters (None unless counting was requested).
+    """
+    from .registry import get_solver
+
+    solver_name, points, params, count = job
+    if len(points) < 3:
+        return np.arange(len(points)), None
+    solver = get_solver(solver_name)(points, **params)
+    counters = solver.enable_counters() if count else None
+    tour, _, _ = solver.solve()
+    return np.asarray(tour, dtype=np.intp), counters
+
+
+class SpatialDecomposition(TSPSolver):
+    """Karp-style spatial decomposition: median-split cells solved in parallel"""
+
+    needs_distance_matrix = False
+
+    # Phụ thuộc vào sub_solver (xem is_deterministic)
+    deterministic = False
+
+    @classmethod
+    def is_deterministic(cls, params: Dict) -> bool:
+        """Deterministic exactly when the sub-solver is, with the given sub_solver_params"""
+        from .registry import get_solver
+
+        resolved = cls.resolve_params(**params)
+        sub_solver = get_solver(resolved['sub_solver'])
+        return sub_solver.is_deterministic(resolved['sub_solver_params'] or {})
+
+    def __init__(self, cities: List[Tuple[float, float]],
+                 sub_solver: str = 'savings',
+                 sub_solver_params: Optional[Dict] = None,
+                 max_cell_size: int = 2000,
+                 n_workers: Optional[int] = None,
+                 metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64',
+                 matrix_layout: str = 'dense'):
+        """
+        Initialize decomposition solver
+        sub_solver: Registered solver name used inside every cell
+        sub_solver_params: Keyword arguments for the sub-solver
+        max_cell_size: Cells are split at the median until no larger than this
+        n_workers: Worker processes (default: CPU count, 1 = solve in-process)
+        metric: Distance metric name (see solvers.metrics)
+        matrix_dtype, matrix_layout: Distance matrix storage (see TSPSolver)
+        """
+        super().__init__(cities, metric, matrix_dtype, matrix_layout)
+        self.sub_solver = sub_solver
+        self.sub_solver_params = sub_solver_params or {}
+        self.max_cell_size = max_cell_size
+        self.n_workers = n_workers
+
+    def get_complexity(self) -> Tuple[str, str]:
+        """
+        Time Complexity: O((n / c) × T(c)) - n / c cells of size c, divided across workers
+        Space Complexity: O(n + c²) - Coordinates plus one cell's matrix per worker
+        """
+        return ("O((n / c) × T(c))", "O(n + c²)")
+
+    def solve(self) -> Tuple[List[int], float, float]:
+        tour, distance, time_taken, _ = self.solve_with_steps()
+        return tour, distance, time_taken
+
+    def _partition(self, points: np.ndarray) -> List[np.ndarray]:
+        """Recursive median split along the longer side until cells are small enough"""
+        cells = []
+        pending = [np.arange(len(points))]
+        while pending:
+            idx = pending.pop()
+            if len(idx) <= self.max_cell_size:
+                cells.append(idx)
+                continue
+            sub = points[idx]
+            axis = int(np.argmax(sub.max(axis=0) - sub.min(axis=0)))
+            half = len(idx) // 2
+            split = np.argpartition(sub[:, axis], half)
+            pending.append(idx[split[:half]])
+            pending.append(idx[split[half:]])
+        return cells
+
+    def _solve_cells(self, points: np.ndarray, cells: List[np.ndarray]) -> List[np.ndarray]:
+        """Solve every cell, in a process pool when more than one worker is allowed"""
+        params = {**self._matrix_params(), **self.sub_solver_params}
+        count = self.counters is not None
+        jobs = [(self.sub_solver, points[idx], params, count) for idx in cells]
+        n_workers = self.n_workers or os.cpu_count() or 1
+        n_workers = min(n_workers, len(jobs))
+        if n_workers <= 1:
+            results = []
+            for job in jobs:
+                self._checkpoint()
+                results.append(_solve_cell(job))
+        else:
+            chunksize = max(1, len(jobs) // (4 * n_workers))
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                results = list(pool.map(_solve_cell, jobs, chunksize=chunksize))
+        if count:
+            # Cộng dồn bộ đếm của các bài toán con (kể cả khi giải ở tiến trình khác)
+            for _, counters in results:
+                if counters is not None:
+                    self.counters += counters
+        return [idx[local] for idx, (local, _) in zip(cells, results)]
+
+    def _stitch(self, points: np.ndarray, sub_tours: List[np.ndarray]) -> np.ndarray:
+        """
+        Open each cyclic sub-tour at its cheapest edge and chain them
+        For every edge (a, b) of the next cell we evaluate entering at one end
+        and leaving from the other, paying d(prev_exit, entry) - d(a, b) plus
+        the distance from the exit to the following cell's centroid.
+        """
+        centroids = np.array([points[t].mean(axis=0) for t in sub_tours])
+        pieces = []
+        prev_exit = centroids[-1]
+        for c, sub in enumerate(sub_tours):
+            if len(sub) == 1:
+                pieces.append(sub)
+                prev_exit = points[sub[0]]
+                continue
+
+            nxt = centroids[(c + 1) % len(sub_tours)]
+            a = points[sub]
+            b = np.roll(a, -1, axis=0)
+            edge = self._metric(a, b)
+            # Vào tại b, đi ngược về a (thoát tại a) hoặc vào tại a, thoát tại b
+            enter_b = self._metric(b, prev_exit) - edge + self._metric(a, nxt)
+            enter_a = self._metric(a, prev_exit) - edge + self._metric(b, nxt)
+
+            i_b, i_a = int(np.argmin(enter_b)), int(np.argmin(enter_a))
+            if enter_b[i_b] <= enter_a[i_a]:
+                # b_i = sub[i + 1] ... vòng tới a_i = sub[i]
+                piece = np.roll(sub, -(i_b + 1))
+            else:
+                # a_i = sub[i] ... ngược chiều tới b_i = sub[i + 1]
+                piece = np.roll(sub, -(i_a + 1))[::-1]
+            pieces.append(piece)
+            prev_exit = points[piece[-1]]
+            if self.counters is not None:
+                # 5 khoảng cách và 2 cách vào cho mỗi cạnh của ô
+                self.counters.distance_lookups += 5 * len(sub)
+                self.counters.candidate_scans += 2 * len(sub)
+        return np.concatenate(pieces)
+
+    def solve_with_steps(self) -> Tuple[List[int], float, float, List[Dict]]:
+        start_time = time.time()
+        steps = []
+
+        if self.n < 3:
+            tour = list(range(self.n))
+            distance = self.calculate_tour_distance(tour)
+            steps.append({
+                'step': 0,
+                'description': f'Hoàn thành tour với khoảng cách {distance:.2f}',
+                'tour': tour.copy(),
+                'selected': None,
+                'position': None
+            })
+            return tour, distance, time.time() - start_time, steps
+
+        points = self.points
+        with self._span('partition'):
+            cells = self._partition(points)
+
+        # Thứ tự các ô theo đường cong Hilbert của trọng tâm để ô kề nhau nối liền
+        centroids = np.array([points[idx].mean(axis=0) for idx in cells])
+        cells = [cells[i] for i in hilbert_order(centroids)]
+
+        steps.append({
+            'step': 0,
+            'description': f'Chia mặt phẳng thành {len(cells)} ô (tối đa {self.max_cell_size} thành phố mỗi ô)',
+            'tour': None,
+            'selected': None,
+            'position': None
+        })
+
+        with self._span('solve_cells'):
+            sub_tours = self._solve_cells(points, cells)
+
+        steps.append({
+            'step': 1,
+            'description': f'Giải {len(cells)} bài toán con bằng {self.sub_solver}',
+            'tour': None,
+            'selected': None,
+            'position': None
+        })
+
+        with self._span('stitch'):
+            order = self._stitch(points, sub_tours)
+
+        # Xoay tour để luôn bắt đầu từ thành phố 0
+        start = int(np.flatnonzero(order == 0)[0])
+        tour = np.roll(order, -start).tolist()
+
+        distance = self.calculate_tour_distance(tour)
+        time_taken = time.time() - start_time
+
+        steps.append({
+            'step': 2,
+            'description': f'Hoàn thành tour với khoảng cách {distance:.2f}. Tour khép kín từ {tour[-1]} về {tour[0]}',
+            'tour': tour.copy(),
+            'selected': None,
+            'position': None
+        })
+
+        return tour, distance, time_taken, steps
@@ -9,10 +9,11 @@ class FarthestInsertion(TSPSolver):
 
     def get_complexity(self) -> Tuple[str, str]:
         """
-        Time Complexity: O(n²) - For each city, find farthest and best insertion
+        Time Complexity: O(n³) - Each of the n insertions recomputes every
+            unvisited city's distance to the whole tour
         Space Complexity: O(n²) - Distance matrix
         """
-        return ("O(n²)", "O(n²)")
+        return ("O(n³)", "O(n²)")
 
     def solve(self) -> Tuple[List[int], float, float]:
         tour, distance, time_taken, _ = self.solve_with_steps()
@@ -42,12 +43,17 @@ class FarthestInsertion(TSPSolver):
             return tour, distance, time.time() - start_time, steps
 
         # Start with two farthest cities, đảm bảo bắt đầu từ 0
+        # Gán ma trận một lần thay vì đọc qua property ở mỗi phép so sánh
+        matrix = self.distance_matrix
         max_dist = 0
         start_city1, start_city2 = 0, 1
+        if self.counters is not None:
+            self.counters.distance_lookups += self.n * (self.n - 1) // 2
         for i in range(self.n):
+            self._checkpoint()
             for j in range(i + 1, self.n):
-                if self.distance_matrix[i][j] > max_dist:
-                    max_dist = self.distance_matrix[i][j]
+                if matrix[i, j] > max_dist:
+                    max_dist = matrix[i, j]
                     start_city1, start_city2 = i, j
 
         if start_city1 == 0:
@@ -55,7 +61,7 @@ class FarthestInsertion(TSPSolver):
         elif start_city2 == 0:
             tour = [0, start_city1]
         else:
-            if self.distance_matrix[0][start_city1] < self.distance_matrix[0][start_city2]:
+            if matrix[0, start_city1] < matrix[0, start_city2]:
                 tour = [0, start_city1]
             else:
                 tour = [0, start_city2]
@@ -72,41 +78,49 @@ class FarthestInsertion(TSPSolver):
 
         step_num = 1
         while unvisited:
+            self._checkpoint()
             farthest_city = None
             max_min_dist = -1
-
-            for city in unvisited:
-                min_dist_to_tour = min(self.distance_matrix[city][t] for t in tour)
-                if min_dist_to_tour > max_min_dist:
-                    max_min_dist = min_dist_to_tour
-                    farthest_city = city
+            if self.counters is not None:
+                self.counters.candidate_scans += len(unvisited)
+                self.counters.insertion_evals += len(tour)
+                self.counters.distance_lookups += len(unvisited) * len(tour) + 3 * len(tour)
+
+            with self._span('select'):
+                for city in unvisited:
+                    min_dist_to_tour = min(matrix[city, t] for t in tour)
+                    if min_dist_to_tour > max_min_dist:
+                        max_min_dist = min_dist_to_tour
+                        farthest_city = city
 
             best_position = None
             best_increase = float('inf')
 
-            for pos in range(len(tour)):
-                prev_city = tour[pos]
-                next_city = tour[(pos + 1) % len(tour)]
-                cost = (self.distance_matrix[prev_city][farthest_city] +
-                        self.distance_matrix[farthest_city][next_city] -
-                        self.distance_matrix[prev_city][next_city])
+            with self._span('insertion_eval'):
+                for pos in range(len(tour)):
+                    prev_city = tour[pos]
+                    next_city = tour[(pos + 1) % len(tour)]
+                    cost = (matrix[prev_city, farthest_city] +
+                            matrix[farthest_city, next_city] -
+                            matrix[prev_city, next_city])
 
-                if cost < best_increase:
-                    best_increase = cost
-                    best_position = pos + 1
+                    if cost < best_increase:
+                        best_increase = cost
+                        best_position = pos + 1
 
             tour.insert(best_position, farthest_city)
             unvisited.remove(farthest_city)
 
-            steps.append({
-                'step': step_num,
-                'description': f'Chèn thành phố {farthest_city} (xa nhất) vào vị trí {best_position}',
-                'tour': tour.copy(),
-                'selected': farthest_city,
-                'position': best_position,
-                'distance': max_min_dist,
-                'cost': best_increase
-            })
+            with self._span('record_steps'):
+                steps.append({
+                    'step': step_num,
+                    'description': f'Chèn thành phố {farthest_city} (xa nhất) vào vị trí {best_position}',
+                    'tour': tour.copy(),
+                    'selected': farthest_city,
+                    'position': best_position,
+                    'distance': max_min_dist,
+                    'cost': best_increase
+                })
             step_num += 1
 
         distance = self.calculate_tour_distance(tour)
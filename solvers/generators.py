@@ -0,0 +1,131 @@
+from typing import Callable, Dict, Optional, Union
+
+import numpy as np
+
+# Mỗi generator là hàm vector hoá (n, rng, size, **params) -> mảng (n, 2) float64
+# trong hình vuông [0, size]²; mọi ngẫu nhiên đi qua rng nên cùng seed cho cùng
+# instance, không đụng tới trạng thái toàn cục np.random.
+Generator = Callable[..., np.ndarray]
+
+
+def _clip(points: np.ndarray, size: float) -> np.ndarray:
+    np.clip(points, 0.0, size, out=points)
+    return points
+
+
+def _sample_labels(weights: np.ndarray, n: int, rng: np.random.Generator) -> np.ndarray:
+    """n indices drawn with probabilities ∝ weights, in random order"""
+    counts = rng.multinomial(n, weights / weights.sum())
+    labels = np.repeat(np.arange(len(weights)), counts)
+    rng.shuffle(labels)
+    return labels
+
+
+def uniform_points(n: int, rng: np.random.Generator, size: float = 100.0) -> np.ndarray:
+    return rng.uniform(0.0, size, (n, 2))
+
+
+def clustered_points(n: int, rng: np.random.Generator, size: float = 100.0,
+                     n_clusters: Optional[int] = None, spread: float = 0.03,
+                     concentration: float = 1.0) -> np.ndarray:
+    """
+    Gaussian clusters of uneven size and width
+    n_clusters: Number of clusters (default grows like √n / 4)
+    spread: Mean cluster standard deviation as a fraction of size
+    concentration: Dirichlet parameter of the cluster weights (small = very uneven)
+    """
+    k = n_clusters or max(2, int(np.sqrt(n) / 4))
+    centers = rng.uniform(0.1 * size, 0.9 * size, (k, 2))
+    weights = rng.dirichlet(np.full(k, concentration))
+    sigmas = spread * size * rng.lognormal(0.0, 0.5, k)
+    # Một lần gather cho cả tâm và độ lệch chuẩn của cụm
+    per_point = np.column_stack([centers, sigmas])[_sample_labels(weights, n, rng)]
+    points = rng.standard_normal((n, 2))
+    points *= per_point[:, 2:3]
+    points += per_point[:, :2]
+    return _clip(points, size)
+
+
+def grid_points(n: int, rng: np.random.Generator, size: float = 100.0,
+                jitter: float = 0.1) -> np.ndarray:
+    """
+    Random cells of a square lattice, perturbed by Gaussian jitter
+    jitter: Standard deviation as a fraction of the lattice spacing
+    """
+    side = int(np.ceil(np.sqrt(n)))
+    spacing = size / side
+    cells = rng.permutation(side * side)[:n] if n < side * side else np.arange(n)
+    points = np.empty((n, 2))
+    points[:, 0] = (cells % side + 0.5) * spacing
+    points[:, 1] = (cells // side + 0.5) * spacing
+    points += rng.standard_normal((n, 2)) * (jitter * spacing)
+    return _clip(points, size)
+
+
+def road_points(n: int, rng: np.random.Generator, size: float = 100.0,
+                n_roads: Optional[int] = None, width: float = 0.005) -> np.ndarray:
+    """
+    Points along random straight roads, denser on longer roads
+    n_roads: Number of road segments (default grows like n^(1/3))
+    width: Standard deviation across the road as a fraction of size
+    """
+    k = n_roads or max(2, int(round(n ** (1 / 3))))
+    starts = rng.uniform(0.0, size, (k, 2))
+    ends = rng.uniform(0.0, size, (k, 2))
+    directions = ends - starts
+    lengths = np.maximum(np.hypot(directions[:, 0], directions[:, 1]), 1e-12)
+    normals = np.column_stack([-directions[:, 1], directions[:, 0]]) / lengths[:, None]
+
+    per_point = np.column_stack([starts, directions, normals])[_sample_labels(lengths, n, rng)]
+    t = rng.random(n)[:, None]
+    offset = rng.standard_normal(n)[:, None] * (width * size)
+    points = per_point[:, 2:4] * t
+    points += per_point[:, :2]
+    points += per_point[:, 4:6] * offset
+    return _clip(points, size)
+
+
+def mixed_points(n: int, rng: np.random.Generator, size: float = 100.0,
+                 clustered: float = 0.6, roads: float = 0.25) -> np.ndarray:
+    """
+    Mixed density: dense clusters ("cities"), roads between them and a sparse
+    uniform background ("countryside"), shuffled together
+    clustered, roads: Fractions of the points; the rest is uniform
+    """
+    if clustered < 0 or roads < 0 or clustered + roads > 1:
+        raise ValueError("clustered and roads must be non-negative fractions summing to at most 1")
+    n_clustered = int(round(n * clustered))
+    n_roads = min(int(round(n * roads)), n - n_clustered)
+    points = np.concatenate([
+        clustered_points(n_clustered, rng, size, spread=0.015, concentration=0.5),
+        road_points(n_roads, rng, size),
+        uniform_points(n - n_clustered - n_roads, rng, size),
+    ])
+    return points[rng.permutation(n)]
+
+
+DISTRIBUTIONS: Dict[str, Generator] = {
+    'uniform': uniform_points,
+    'clustered': clustered_points,
+    'grid': grid_points,
+    'roads': road_points,
+    'mixed': mixed_points,
+}
+
+
+def generate_points(distribution: str, n: int,
+                    rng: Union[np.random.Generator, int, None] = None, **params) -> np.ndarray:
+    """
+    n points from a named distribution
+    rng: np.random.Generator or seed (None: fresh OS entropy)
+    params: Distribution parameters (size, n_clusters, jitter, ...)
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution: {distribution}")
+    if n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
+    if not isinstance(rng, np.random.Generator):
+        rng = np.random.default_rng(rng)
+    if n == 0:
+        return np.empty((0, 2))
+    return np.ascontiguousarray(DISTRIBUTIONS[distribution](n, rng, **params), dtype=np.float64)
@@ -0,0 +1,151 @@
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .base import TSPSolver
+from .neighbors import candidate_pairs
+from .profiling import profiled
+
+
+class GreedyEdge(TSPSolver):
+    """Greedy Edge (greedy matching) construction with union-find"""
+
+    needs_distance_matrix = False
+
+    def __init__(self, cities: List[Tuple[float, float]],
+                 k: int = 10,
+                 candidate_threshold: int = 1000,
+                 metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64',
+                 matrix_layout: str = 'dense'):
+        """
+        Initialize Greedy Edge solver
+        k: Number of nearest neighbours per city used as candidate edges
+        candidate_threshold: Up to this many cities all edges are candidates,
+            above it only the k-nearest edges are (no dense matrix is built)
+        metric: Distance metric name (see solvers.metrics)
+        matrix_dtype, matrix_layout: Distance matrix storage (see TSPSolver)
+        """
+        super().__init__(cities, metric, matrix_dtype, matrix_layout)
+        self.k = k
+        self.candidate_threshold = candidate_threshold
+
+    def get_complexity(self) -> Tuple[str, str]:
+        """
+        Time Complexity: O(n² log n) - Sort all edges (O(nk log(nk)) on candidate lists)
+        Space Complexity: O(n²) - All edges (O(nk) on candidate lists)
+        """
+        if self.n > self.candidate_threshold:
+            return ("O(n·k log(n·k))", "O(n·k)")
+        return ("O(n² log n)", "O(n²)")
+
+    def solve(self) -> Tuple[List[int], float, float]:
+        tour, distance, time_taken, _ = self.solve_with_steps()
+        return tour, distance, time_taken
+
+    @profiled('candidate_edges')
+    def _candidate_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidate edges (i, j) with i < j, sorted by increasing length"""
+        if self.n <= self.candidate_threshold:
+            u, v = np.triu_indices(self.n, k=1)
+        else:
+            u, v = candidate_pairs(self.points, self.k)
+
+        weights = self._pair_distances(u, v)
+        order = np.argsort(weights, kind='stable')
+        return u[order], v[order]
+
+    def solve_with_steps(self) -> Tuple[List[int], float, float, List[Dict]]:
+        start_time = time.time()
+        steps = []
+
+        if self.n < 3:
+            tour = list(range(self.n))
+            distance = self.calculate_tour_distance(tour)
+            steps.append({
+                'step': 0,
+                'description': f'Hoàn thành tour với khoảng cách {distance:.2f}. Tour khép kín từ {tour[-1]} về {tour[0]}',
+                'tour': tour.copy(),
+                'selected': None,
+                'position': None
+            })
+            return tour, distance, time.time() - start_time, steps
+
+        u, v = self._candidate_edges()
+        self._checkpoint()
+
+        steps.append({
+            'step': 0,
+            'description': f'Sắp xếp {len(u)} cạnh ứng viên theo độ dài',
+            'tour': None,
+            'selected': None,
+            'position': None
+        })
+
+        # Union-find trên mảng (path halving) + bậc của từng đỉnh
+        parent = list(range(self.n))
+        degree = [0] * self.n
+        adjacency = [[] for _ in range(self.n)]
+        accepted = 0
+        a = b = None
+
+        with self._span('select_edges'):
+            for a, b in zip(u.tolist(), v.tolist()):
+                if degree[a] >= 2 or degree[b] >= 2:
+                    continue
+                root_a = a
+                while parent[root_a] != root_a:
+                    parent[root_a] = parent[parent[root_a]]
+                    root_a = parent[root_a]
+                root_b = b
+                while parent[root_b] != root_b:
+                    parent[root_b] = parent[parent[root_b]]
+                    root_b = parent[root_b]
+                if root_a == root_b:
+                    continue  # sẽ đóng chu trình sớm
+
+                parent[root_a] = root_b
+                degree[a] += 1
+                degree[b] += 1
+                adjacency[a].append(b)
+                adjacency[b].append(a)
+                accepted += 1
+                if accepted == self.n - 1:
+                    break
+                # Kiểm tra huỷ theo cạnh được nhận (n lần), không theo cạnh được xét
+                self._checkpoint()
+
+        if self.counters is not None:
+            # Vị trí cạnh cuối cùng được xét (tính sau vòng lặp để không làm chậm nó)
+            scanned = len(u)
+            if accepted == self.n - 1 and a is not None:
+                scanned = int(np.flatnonzero((u == a) & (v == b))[0]) + 1
+            self.counters.candidate_scans += scanned
+
+        steps.append({
+            'step': 1,
+            'description': f'Chọn {accepted} cạnh ngắn nhất không tạo chu trình và không vượt bậc 2',
+            'tour': None,
+            'selected': None,
+            'position': None
+        })
+
+        tour = self._join_path_fragments(adjacency)
+
+        # Xoay tour để luôn bắt đầu từ thành phố 0
+        start = tour.index(0)
+        tour = tour[start:] + tour[:start]
+
+        distance = self.calculate_tour_distance(tour)
+        time_taken = time.time() - start_time
+
+        steps.append({
+            'step': 2,
+            'description': f'Hoàn thành tour với khoảng cách {distance:.2f}. Tour khép kín từ {tour[-1]} về {tour[0]}',
+            'tour': tour.copy(),
+            'selected': None,
+            'position': None
+        })
+
+        return tour, distance, time_taken, steps
@@ -0,0 +1,26 @@
+import hashlib
+import json
+from typing import Dict, Optional
+
+import numpy as np
+
+
+def canonical_coordinates(cities) -> np.ndarray:
+    """Cities as a C-contiguous little-endian (n, 2) float64 array"""
+    points = np.asarray(cities, dtype='<f8')
+    return np.ascontiguousarray(points.reshape(-1, 2))
+
+
+def instance_hash(cities, solver: str = '', params: Optional[Dict] = None) -> str:
+    """
+    Stable SHA-256 key of an instance together with how it is solved
+    The coordinates are hashed as raw float64 bytes; parameters (seed
+    included) are serialized as sorted JSON so keyword order does not matter.
+    """
+    digest = hashlib.sha256()
+    points = canonical_coordinates(cities)
+    digest.update(np.int64(len(points)).tobytes())
+    digest.update(points.tobytes())
+    digest.update(solver.encode('utf-8'))
+    digest.update(json.dumps(params or {}, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
@@ -0,0 +1,156 @@
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .base import TSPSolver
+
+
+class HeldKarp(TSPSolver):
+    """Exact Held-Karp bitmask dynamic programming (small instances only)"""
+
+    def __init__(self, cities: List[Tuple[float, float]],
+                 memory_limit_mb: float = 1024.0,
+                 metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64',
+                 matrix_layout: str = 'dense'):
+        """
+        Initialize Held-Karp solver
+        memory_limit_mb: Maximum size of the DP table (and its working buffers)
+        metric: Distance metric name (see solvers.metrics)
+        matrix_dtype, matrix_layout: Distance matrix storage (see TSPSolver)
+        """
+        self.memory_limit_mb = memory_limit_mb
+
+        # Kiểm tra bộ nhớ trước khi tính ma trận khoảng cách
+        required_mb = self.estimate_memory_mb(len(cities))
+        if required_mb > memory_limit_mb:
+            raise ValueError(
+                f"Held-Karp cần khoảng {required_mb:.1f} MB cho {len(cities)} thành phố, "
+                f"vượt giới hạn memory_limit_mb={memory_limit_mb:.1f} MB"
+            )
+
+        super().__init__(cities, metric, matrix_dtype, matrix_layout)
+
+    @staticmethod
+    def estimate_memory_mb(n: int) -> float:
+        """
+        Estimate memory needed for n cities in MB
+        City 0 is fixed as the start, so the table has shape (2^(n-1), n-1)
+        in float32; the vectorized transitions need about one more table worth
+        of temporaries for the largest subset layer.
+        """
+        if n < 2:
+            return 0.0
+        m = n - 1
+        table_bytes = (1 << m) * m * np.dtype(np.float32).itemsize
+        return 2 * table_bytes / (1024 * 1024)
+
+    def get_complexity(self) -> Tuple[str, str]:
+        """
+        Time Complexity: O(n² × 2ⁿ) - Every subset, every last city, every predecessor
+        Space Complexity: O(n × 2ⁿ) - DP table
+        """
+        return ("O(n² × 2ⁿ)", "O(n × 2ⁿ)")
+
+    def solve(self) -> Tuple[List[int], float, float]:
+        tour, distance, time_taken, _ = self.solve_with_steps()
+        return tour, distance, time_taken
+
+    def _subsets_by_size(self, m: int) -> List[np.ndarray]:
+        """Group all bitmasks over m cities by their number of set bits"""
+        masks = np.arange(1 << m, dtype=np.int64)
+        popcount = np.zeros(1 << m, dtype=np.int64)
+        for bit in range(m):
+            popcount += (masks >> bit) & 1
+        order = np.argsort(popcount, kind='stable')
+        bounds = np.searchsorted(popcount[order], np.arange(m + 2))
+        return [order[bounds[s]:bounds[s + 1]] for s in range(m + 1)]
+
+    def solve_with_steps(self) -> Tuple[List[int], float, float, List[Dict]]:
+        start_time = time.time()
+        steps = []
+
+        if self.n < 4:
+            tour = list(range(self.n))
+            distance = self.calculate_tour_distance(tour)
+            steps.append({
+                'step': 0,
+                'description': f'Hoàn thành tour với khoảng cách {distance:.2f}. Tour khép kín từ {tour[-1]} về {tour[0]}',
+                'tour': tour.copy(),
+                'selected': None,
+                'position': None
+            })
+            return tour, distance, time.time() - start_time, steps
+
+        # Thành phố 0 cố định là điểm xuất phát; DP chỉ chạy trên thành phố 1..n-1
+        m = self.n - 1
+        full = (1 << m) - 1
+        dist = np.asarray(self.distance_matrix, dtype=np.float32)
+        inner = dist[1:, 1:]
+        from_start = dist[0, 1:]
+        to_start = dist[1:, 0]
+
+        # dp[mask, j]: đường đi ngắn nhất từ 0 qua tập mask, kết thúc tại thành phố j + 1
+        dp = np.full((1 << m, m), np.inf, dtype=np.float32)
+        singles = np.left_shift(1, np.arange(m))
+        dp[singles, np.arange(m)] = from_start
+
+        steps.append({
+            'step': 0,
+            'description': f'Khởi tạo bảng DP kích thước {dp.shape[0]}×{dp.shape[1]} (float32)',
+            'tour': [0],
+            'selected': None,
+            'position': None
+        })
+
+        layers = self._subsets_by_size(m)
+        for size in range(2, m + 1):
+            self._checkpoint()
+            layer = layers[size]
+            if self.counters is not None:
+                # Mỗi (tập con, thành phố cuối) xét m thành phố liền trước
+                transitions = len(layer) * size * m
+                self.counters.candidate_scans += transitions
+                self.counters.distance_lookups += transitions
+            with self._span('dp_layer', size=size):
+                for j in range(m):
+                    bit = 1 << j
+                    sel = layer[(layer & bit) != 0]
+                    prev = sel ^ bit
+                    # Vector hoá: mọi tập con cùng kích thước kết thúc tại j cùng lúc
+                    dp[sel, j] = np.min(dp[prev] + inner[:, j], axis=1)
+
+            steps.append({
+                'step': size - 1,
+                'description': f'Tính xong {len(layer)} tập con kích thước {size}',
+                'tour': None,
+                'selected': None,
+                'position': None
+            })
+
+        # Đóng tour về thành phố 0 rồi truy vết ngược
+        with self._span('backtrack'):
+            closing = dp[full] + to_start
+            last = int(np.argmin(closing))
+            path = [last]
+            mask = full
+            while mask != (1 << last):
+                prev_mask = mask ^ (1 << last)
+                last = int(np.argmin(dp[prev_mask] + inner[:, last]))
+                path.append(last)
+                mask = prev_mask
+
+        tour = [0] + [city + 1 for city in reversed(path)]
+        distance = self.calculate_tour_distance(tour)
+        time_taken = time.time() - start_time
+
+        steps.append({
+            'step': m,
+            'description': f'Hoàn thành tour tối ưu với khoảng cách {distance:.2f}. Tour khép kín từ {tour[-1]} về {tour[0]}',
+            'tour': tour.copy(),
+            'selected': None,
+            'position': None
+        })
+
+        return tour, distance, time_taken, steps
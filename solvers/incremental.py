@@ -0,0 +1,225 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .matrix import MATRIX_DTYPES, cast_distances
+from .metrics import get_metric
+
+
+class IncrementalTour:
+    """
+    A solved tour that can be updated as cities are added or removed
+    City indices stay stable: a removed city keeps its index (it just leaves
+    the tour) and new cities get the next free index. Every update costs
+    O(n) plus a bounded local search around the touched part of the tour.
+    """
+
+    def __init__(self, cities, tour: List[int],
+                 distance_matrix: Optional[np.ndarray] = None,
+                 search_radius: int = 8,
+                 metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64'):
+        """
+        cities: Coordinates the tour was solved on
+        tour: Visiting order of all cities
+        distance_matrix: Matrix of the original solver, grown in place on
+            additions (None = distances are taken from coordinates)
+        search_radius: Tour positions on each side of a change examined by
+            the local search (0 disables it)
+        metric: Distance metric name (must match the matrix, if given)
+        matrix_dtype: Storage dtype of the solver's distances; coordinate
+            distances are cast to it like TSPSolver does (int32 rounds)
+        """
+        points = np.asarray(cities, dtype=float).reshape(-1, 2)
+        n = len(points)
+        if sorted(tour) != list(range(n)):
+            raise ValueError("tour must visit every city exactly once")
+        if matrix_dtype not in MATRIX_DTYPES:
+            raise ValueError(f"matrix_dtype must be one of {MATRIX_DTYPES}, got {matrix_dtype!r}")
+        self.matrix_dtype = matrix_dtype
+        self._dtype = np.dtype(matrix_dtype)
+
+        # Dự trữ thêm chỗ để mỗi lần thêm thành phố không phải cấp phát lại ma trận
+        self._capacity = n + self._growth(n)
+        self._points = np.zeros((self._capacity, 2))
+        self._points[:n] = points
+        self._matrix = None
+        if distance_matrix is not None:
+            self._matrix = np.zeros((self._capacity, self._capacity), dtype=self._dtype)
+            self._matrix[:n, :n] = distance_matrix
+
+        self.metric = metric
+        self._metric = get_metric(metric)
+        self.n = n
+        self.active = np.zeros(self._capacity, dtype=bool)
+        self.active[:n] = True
+        self.search_radius = search_radius
+        self._tour = [int(c) for c in tour]
+        self._distance = self._full_distance()
+
+    @classmethod
+    def from_solver(cls, solver, tour: Optional[List[int]] = None,
+                    search_radius: int = 8) -> 'IncrementalTour':
+        """Wrap a solver's tour (solving first when no tour is given)"""
+        if tour is None:
+            tour = solver.solve()[0]
+        return cls(solver.points, tour, solver._distance_matrix, search_radius, solver.metric,
+                   solver.matrix_dtype)
+
+    @staticmethod
+    def _growth(n: int) -> int:
+        # Tăng ~1/8 mỗi lần: chi phí sao chép trung bình O(n) cho mỗi thành phố
+        return max(16, n // 8)
+
+    @property
+    def tour(self) -> List[int]:
+        return list(self._tour)
+
+    @property
+    def distance(self) -> float:
+        return self._distance
+
+    @property
+    def cities(self) -> np.ndarray:
+        """Coordinates of every city ever added (removed ones included)"""
+        return self._points[:self.n]
+
+    def _coordinate_distances(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Metric distances cast to matrix_dtype, as TSPSolver._coordinate_distances does"""
+        distances = self._metric(a, b)
+        if self.matrix_dtype == 'float64':
+            return distances
+        return cast_distances(np.asarray(distances), self._dtype)
+
+    def _dist(self, a: int, b: int) -> float:
+        if self._matrix is not None:
+            return float(self._matrix[a, b])
+        return float(self._coordinate_distances(self._points[a], self._points[b]))
+
+    def _full_distance(self) -> float:
+        if len(self._tour) < 2:
+            return 0.0
+        order = np.asarray(self._tour)
+        nxt = np.roll(order, -1)
+        if self._matrix is not None:
+            return float(np.sum(self._matrix[order, nxt], dtype=np.float64))
+        return float(np.sum(self._coordinate_distances(self._points[order], self._points[nxt]),
+                            dtype=np.float64))
+
+    def _grow(self):
+        """Enlarge the coordinate/matrix buffers (amortized O(n) per city)"""
+        capacity = self._capacity + self._growth(self._capacity)
+        points = np.zeros((capacity, 2))
+        points[:self.n] = self._points[:self.n]
+        self._points = points
+        active = np.zeros(capacity, dtype=bool)
+        active[:self.n] = self.active[:self.n]
+        self.active = active
+        if self._matrix is not None:
+            matrix = np.zeros((capacity, capacity), dtype=self._dtype)
+            matrix[:self.n, :self.n] = self._matrix[:self.n, :self.n]
+            self._matrix = matrix
+        self._capacity = capacity
+
+    def add_city(self, city: Tuple[float, float], local_search: bool = True) -> int:
+        """
+        Cheapest-insert a new city into the tour and return its index
+        """
+        if self.n == self._capacity:
+            self._grow()
+        index = self.n
+        self._points[index] = city
+        self.n += 1
+        self.active[index] = True
+
+        # Khoảng cách tới mọi thành phố cũ: O(n), thêm một hàng và một cột vào ma trận
+        row = self._dists_to_all(index)
+        if self._matrix is not None:
+            self._matrix[index, :index] = row
+            self._matrix[:index, index] = row
+        order = np.asarray(self._tour, dtype=np.int64)
+        # Tính chi phí chèn bằng float64 (int32 có thể tràn khi cộng)
+        to_new = row[order].astype(np.float64)
+
+        if len(order) < 2:
+            self._tour.append(index)
+            self._distance = self._full_distance()
+            return index
+
+        nxt = np.roll(order, -1)
+        edge = self._matrix[order, nxt] if self._matrix is not None else self._dists_between(order, nxt)
+        cost = to_new + np.roll(to_new, -1) - edge.astype(np.float64)
+        position = int(np.argmin(cost)) + 1
+        self._tour.insert(position, index)
+        self._distance += float(cost[position - 1])
+
+        if local_search:
+            self._local_search(position)
+        return index
+
+    def _dists_to_all(self, city: int) -> np.ndarray:
+        """Coordinate distances from city to every lower index"""
+        return self._coordinate_distances(self._points[:city], self._points[city])
+
+    def _dists_between(self, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+        return self._coordinate_distances(self._points[u], self._points[v])
+
+    def remove_city(self, city: int, local_search: bool = True):
+        """Splice a city out of the tour and repair around the gap"""
+        if not (0 <= city < self.n) or not self.active[city]:
+            raise ValueError(f"city {city} is not in the tour")
+        position = self._tour.index(city)
+        m = len(self._tour)
+        prev_city = self._tour[position - 1]
+        next_city = self._tour[(position + 1) % m]
+        self._distance += (self._dist(prev_city, next_city)
+                           - self._dist(prev_city, city) - self._dist(city, next_city))
+        del self._tour[position]
+        self.active[city] = False
+
+        if len(self._tour) < 3:
+            self._distance = self._full_distance()
+        elif local_search:
+            self._local_search(position % len(self._tour))
+
+    def _local_search(self, position: int):
+        """
+        2-opt restricted to a window of tour positions around position
+        Both edges of every move lie in the window, so each reversal is
+        bounded by the window size and never wraps around the tour start.
+        """
+        m = len(self._tour)
+        if self.search_radius <= 0 or m < 4:
+            return
+        lo = max(0, position - self.search_radius)
+        hi = min(m - 1, position + self.search_radius)
+        tour = self._tour
+
+        improved = True
+        while improved:
+            improved = False
+            for i in range(lo, hi - 1):
+                a, b = tour[i], tour[i + 1]
+                d_ab = self._dist(a, b)
+                for j in range(i + 2, hi + 1):
+                    c, d = tour[j], tour[(j + 1) % m]
+                    if d == a:
+                        continue
+                    delta = self._dist(a, c) + self._dist(b, d) - d_ab - self._dist(c, d)
+                    if delta < -1e-10:
+                        tour[i + 1:j + 1] = tour[i + 1:j + 1][::-1]
+                        self._distance += delta
+                        improved = True
+                        break
+                if improved:
+                    break
+
+    def rotate_to(self, city: int):
+        """Rotate the tour so that it starts at city"""
+        position = self._tour.index(city)
+        self._tour = self._tour[position:] + self._tour[:position]
+
+    def recompute_distance(self) -> float:
+        """Recompute the tour length from scratch (drops accumulated rounding)"""
+        self._distance = self._full_distance()
+        return self._distance
@@ -0,0 +1,156 @@
+from typing import Callable, Union
+
+import numpy as np
+
+MATRIX_DTYPES = ('float64', 'float32', 'int32')
+MATRIX_LAYOUTS = ('dense', 'condensed')
+
+# Số phần tử tối đa tính trong một khối khi dựng ma trận (giới hạn bộ nhớ tạm)
+_BLOCK_ELEMENTS = 1 << 20
+
+
+def cast_distances(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Cast distances to the storage dtype (integer dtypes round to nearest)"""
+    if np.issubdtype(dtype, np.integer):
+        return np.rint(values).astype(dtype)
+    return values.astype(dtype, copy=False)
+
+
+class CondensedMatrix:
+    """
+    Symmetric distance matrix stored as its strict upper triangle
+    Holds n(n-1)/2 values instead of n²; supports m[i, j], vectorized
+    m[u, v] on index arrays and m[i] row extraction like a dense array.
+    """
+
+    def __init__(self, data: np.ndarray, n: int):
+        if len(data) != n * (n - 1) // 2:
+            raise ValueError(f"condensed data for {n} cities needs {n * (n - 1) // 2} values")
+        self.data = data
+        self.n = n
+        # Phần tử (i, j), i < j nằm ở data[self._offsets[i] + j]
+        i = np.arange(n, dtype=np.int64)
+        self._offsets = i * n - i * (i + 1) // 2 - i - 1
+
+    @property
+    def shape(self):
+        return (self.n, self.n)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.data.dtype
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes + self._offsets.nbytes
+
+    def __len__(self) -> int:
+        return self.n
+
+    def row(self, i: int) -> np.ndarray:
+        """Distances from city i to every city, O(n) vectorized"""
+        out = np.empty(self.n, dtype=self.data.dtype)
+        out[:i] = self.data[self._offsets[:i] + i]
+        out[i] = 0
+        start = self._offsets[i] + i + 1
+        out[i + 1:] = self.data[start:start + self.n - i - 1]
+        return out
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            return self.row(int(key))
+        i, j = key
+        if isinstance(i, (int, np.integer)) and isinstance(j, (int, np.integer)):
+            if i == j:
+                return self.data.dtype.type(0)
+            if i > j:
+                i, j = j, i
+            return self.data[self._offsets[i] + j]
+
+        i, j = np.broadcast_arrays(np.asarray(i, dtype=np.int64), np.asarray(j, dtype=np.int64))
+        lo, hi = np.minimum(i, j), np.maximum(i, j)
+        same = lo == hi
+        index = np.where(same, 0, self._offsets[lo] + hi)
+        values = self.data[index] if len(self.data) else np.zeros(index.shape, self.data.dtype)
+        return np.where(same, self.data.dtype.type(0), values)
+
+    def __array__(self, dtype=None, copy=None):
+        dense = np.zeros((self.n, self.n), dtype=dtype or self.data.dtype)
+        rows, cols = np.triu_indices(self.n, 1)
+        dense[rows, cols] = self.data
+        dense[cols, rows] = self.data
+        return dense
+
+    def row_sums(self) -> np.ndarray:
+        """Sum of every row (= every column, the matrix is symmetric) in float64"""
+        sums = np.zeros(self.n, dtype=np.float64)
+        for i in range(self.n - 1):
+            # Đoạn (i, i+1..n-1) góp vào tổng hàng i và vào hàng của từng j > i
+            start = self._offsets[i] + i + 1
+            segment = self.data[start:start + self.n - i - 1]
+            sums[i] += np.sum(segment, dtype=np.float64)
+            sums[i + 1:] += segment
+        return sums
+
+    def mean(self, axis=None, dtype=None, out=None):
+        """
+        Mean over all n² entries (diagonal zeros included), like ndarray.mean()
+        axis=0 or 1 gives the per-row means (the same for both axes).
+        """
+        if axis is None:
+            total = 2.0 * float(np.sum(self.data, dtype=np.float64))
+            result = np.float64(total / (self.n * self.n) if self.n else float('nan'))
+        elif axis in (0, 1, -1, -2):
+            result = self.row_sums() / self.n if self.n else np.empty(0)
+        else:
+            raise ValueError(f"axis {axis} is out of bounds for a 2-dimensional matrix")
+        if dtype is not None:
+            result = np.asarray(result).astype(dtype)[()]
+        if out is not None:
+            out[...] = result
+            return out
+        return result
+
+
+DistanceMatrix = Union[np.ndarray, CondensedMatrix]
+
+
+def build_distance_matrix(points: np.ndarray, metric: Callable,
+                          dtype: str = 'float64', layout: str = 'dense') -> DistanceMatrix:
+    """
+    Distance matrix of points under metric, built block by block
+    Only one block of rows is ever held in float64, so a float32 or int32
+    matrix never needs a full float64 temporary.
+    """
+    if dtype not in MATRIX_DTYPES:
+        raise ValueError(f"matrix_dtype must be one of {MATRIX_DTYPES}, got {dtype!r}")
+    if layout not in MATRIX_LAYOUTS:
+        raise ValueError(f"matrix_layout must be one of {MATRIX_LAYOUTS}, got {layout!r}")
+    dtype = np.dtype(dtype)
+    n = len(points)
+
+    if layout == 'dense':
+        if dtype == np.float64 and n * n <= _BLOCK_ELEMENTS:
+            return metric(points[:, None, :], points[None, :, :])
+        matrix = np.empty((n, n), dtype=dtype)
+        block = max(1, _BLOCK_ELEMENTS // max(n, 1))
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            matrix[start:stop] = cast_distances(metric(points[start:stop, None, :], points[None, :, :]), dtype)
+        return matrix
+
+    data = np.empty(n * (n - 1) // 2, dtype=dtype)
+    position = 0
+    for i in range(n - 1):
+        length = n - i - 1
+        data[position:position + length] = cast_distances(metric(points[i + 1:], points[i]), dtype)
+        position += length
+    return CondensedMatrix(data, n)
+
+
+def matrix_nbytes(n: int, dtype: str = 'float64', layout: str = 'dense') -> int:
+    """Bytes needed to store an n-city matrix with the given dtype and layout"""
+    itemsize = np.dtype(dtype).itemsize
+    if layout == 'condensed':
+        return itemsize * n * (n - 1) // 2 + 8 * n
+    return itemsize * n * n
@@ -0,0 +1,70 @@
+from typing import Callable, Dict
+
+import numpy as np
+
+from .tsplib import tsplib_distances
+
+# Một metric là hàm vector hoá d(a, b) trên hai mảng toạ độ (..., 2) có thể
+# broadcast với nhau; cùng một hàm phục vụ cả ma trận đầy đủ
+# (points[:, None], points[None]) lẫn một hàng theo yêu cầu (points, points[i]).
+Metric = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def euclidean(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    dx = a[..., 0] - b[..., 0]
+    dy = a[..., 1] - b[..., 1]
+    return np.sqrt(dx * dx + dy * dy)
+
+
+def manhattan(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.abs(a[..., 0] - b[..., 0]) + np.abs(a[..., 1] - b[..., 1])
+
+
+def chebyshev(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.maximum(np.abs(a[..., 0] - b[..., 0]), np.abs(a[..., 1] - b[..., 1]))
+
+
+def haversine(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Great-circle distance in km between (latitude, longitude) points in degrees"""
+    lat_a, lon_a = np.radians(a[..., 0]), np.radians(a[..., 1])
+    lat_b, lon_b = np.radians(b[..., 0]), np.radians(b[..., 1])
+    sin_lat = np.sin(0.5 * (lat_b - lat_a))
+    sin_lon = np.sin(0.5 * (lon_b - lon_a))
+    h = sin_lat * sin_lat + np.cos(lat_a) * np.cos(lat_b) * sin_lon * sin_lon
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+
+def _tsplib(edge_weight_type: str) -> Metric:
+    def metric(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return tsplib_distances(a, b, edge_weight_type)
+    metric.__name__ = edge_weight_type.lower()
+    return metric
+
+
+METRICS: Dict[str, Metric] = {
+    'euclidean': euclidean,
+    'manhattan': manhattan,
+    'chebyshev': chebyshev,
+    'haversine': haversine,
+    # Các hàm khoảng cách TSPLIB (làm tròn nint / ceil / ATT / GEO)
+    'euc_2d': _tsplib('EUC_2D'),
+    'ceil_2d': _tsplib('CEIL_2D'),
+    'att': _tsplib('ATT'),
+    'geo': _tsplib('GEO'),
+}
+
+
+def register_metric(name: str, metric: Metric):
+    """Register a vectorized distance function d(a, b) under a name"""
+    if not callable(metric):
+        raise TypeError(f"{metric!r} is not callable")
+    METRICS[name] = metric
+
+
+def get_metric(name: str) -> Metric:
+    """Look up a registered metric by name"""
+    if name not in METRICS:
+        raise ValueError(f"Unknown metric: {name}")
+    return METRICS[name]
@@ -0,0 +1,45 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def prim_mst(matrix: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    Minimum spanning tree with dense Prim's algorithm, O(n²)
+    Each of the n - 1 steps is one vectorized pass over a matrix row.
+    Returns (parent, weight): parent[v] is v's neighbour towards city 0
+    (parent[0] = -1) and weight is the total edge length.
+    """
+    n = len(matrix)
+    if n < 2:
+        return np.full(n, -1, dtype=np.intp), 0.0
+
+    parent = np.zeros(n, dtype=np.intp)
+    parent[0] = -1
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[0] = True
+    best = np.asarray(matrix[0], dtype=float).copy()
+    best[0] = np.inf
+
+    total = 0.0
+    for _ in range(n - 1):
+        v = int(np.argmin(best))
+        total += float(best[v])
+        in_tree[v] = True
+        best[v] = np.inf
+
+        row = np.asarray(matrix[v], dtype=float)
+        closer = (row < best) & ~in_tree
+        best[closer] = row[closer]
+        parent[closer] = v
+    return parent, total
+
+
+def tree_adjacency(parent: np.ndarray) -> list:
+    """Adjacency lists of a tree given as a parent array"""
+    adjacency = [[] for _ in range(len(parent))]
+    for child, par in enumerate(parent.tolist()):
+        if par >= 0:
+            adjacency[child].append(par)
+            adjacency[par].append(child)
+    return adjacency
@@ -31,6 +31,7 @@ class NearestNeighbor(TSPSolver):
 
 
         unvisited = set(range(self.n))
+        matrix = self.distance_matrix
         tour = []
         current = 0  # luôn bắt đầu từ thành phố 0
         tour.append(current)
@@ -48,19 +49,25 @@ class NearestNeighbor(TSPSolver):
 
         step_num = 1
         while unvisited:
-            nearest = min(unvisited, key=lambda city: self.distance_matrix[current][city])
+            self._checkpoint()
+            if self.counters is not None:
+                self.counters.candidate_scans += len(unvisited)
+                self.counters.distance_lookups += len(unvisited)
+            with self._span('select'):
+                nearest = min(unvisited, key=lambda city: matrix[current, city])
             tour.append(nearest)
             unvisited.remove(nearest)
 
 
-            steps.append({
-                'step': step_num,
-                'description': f'Chọn thành phố {nearest} (gần nhất từ {current})',
-                'tour': tour.copy(),
-                'current': current,
-                'selected': nearest,
-                'distance': self.distance_matrix[current][nearest]
-            })
+            with self._span('record_steps'):
+                steps.append({
+                    'step': step_num,
+                    'description': f'Chọn thành phố {nearest} (gần nhất từ {current})',
+                    'tour': tour.copy(),
+                    'current': current,
+                    'selected': nearest,
+                    'distance': matrix[current, nearest]
+                })
 
 
             current = nearest
@@ -0,0 +1,127 @@
+import numpy as np
+
+
+# Số phần tử tối đa của một khối khoảng cách tạm (~32 MB float64)
+BLOCK_ELEMENTS = 1 << 22
+
+
+def _brute_force_knn(points: np.ndarray, queries: np.ndarray, k: int,
+                     block_size: int = 2048) -> np.ndarray:
+    """k nearest neighbours of the query cities against all points, in row blocks"""
+    squared = np.einsum('ij,ij->i', points, points)
+    block_size = max(1, min(block_size, BLOCK_ELEMENTS // len(points)))
+    result = np.empty((len(queries), k), dtype=np.intp)
+    for start in range(0, len(queries), block_size):
+        rows = queries[start:start + block_size]
+        d2 = squared[rows, None] + squared[None, :] - 2.0 * (points[rows] @ points.T)
+        d2[np.arange(len(rows)), rows] = np.inf
+
+        nearest = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(d2, nearest, axis=1), axis=1, kind='stable')
+        result[start:start + len(rows)] = np.take_along_axis(nearest, order, axis=1)
+    return result
+
+
+def _grid_knn(points: np.ndarray, k: int) -> np.ndarray:
+    """
+    k nearest neighbours using a uniform grid
+    Each cell looks at its 3×3 block of cells; a point whose k-th neighbour
+    is farther than one cell width may have missed a closer point outside the
+    block, so those few points are redone by brute force.
+    """
+    n = len(points)
+    lo = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - lo, 1e-12)
+
+    # Khoảng k điểm mỗi ô: láng giềng thứ k thường nằm trong nửa ô
+    per_cell = max(2.0, float(k))
+    cells_per_axis = max(1, int(np.sqrt(n / per_cell)))
+    cell_size = float(np.max(extent)) / cells_per_axis
+    gx = np.minimum((points[:, 0] - lo[0]) // cell_size, cells_per_axis - 1).astype(np.intp)
+    gy = np.minimum((points[:, 1] - lo[1]) // cell_size, cells_per_axis - 1).astype(np.intp)
+    side = int(max(gx.max(), gy.max())) + 1
+    cell = gx * side + gy
+
+    order = np.argsort(cell, kind='stable')
+    sorted_cells = cell[order]
+    bounds = np.searchsorted(sorted_cells, np.arange(side * side + 1))
+
+    result = np.empty((n, k), dtype=np.intp)
+    redo = []
+    squared_cell = cell_size * cell_size
+    for c in np.unique(sorted_cells).tolist():
+        cx, cy = divmod(c, side)
+        members = order[bounds[c]:bounds[c + 1]]
+        # Các ô cùng cột x nằm liền nhau trong thứ tự đã sắp xếp
+        ylo, yhi = max(cy - 1, 0), min(cy + 2, side)
+        candidates = np.concatenate([order[bounds[x * side + ylo]:bounds[x * side + yhi]]
+                                     for x in range(max(cx - 1, 0), min(cx + 2, side))])
+        if len(candidates) <= k:
+            redo.append(members)
+            continue
+
+        # Ô dày đặc (dữ liệu phân cụm) được xử lý theo từng lát để giới hạn bộ nhớ tạm
+        step = max(1, BLOCK_ELEMENTS // len(candidates))
+        for start in range(0, len(members), step):
+            rows = members[start:start + step]
+            delta = points[rows, None, :] - points[None, candidates, :]
+            d2 = np.einsum('ijk,ijk->ij', delta, delta)
+            d2[candidates[None, :] == rows[:, None]] = np.inf
+            nearest = np.argpartition(d2, k - 1, axis=1)[:, :k]
+            nearest_d2 = np.take_along_axis(d2, nearest, axis=1)
+            ranked = np.argsort(nearest_d2, axis=1, kind='stable')
+            result[rows] = candidates[np.take_along_axis(nearest, ranked, axis=1)]
+
+            too_far = np.take_along_axis(nearest_d2, ranked[:, -1:], axis=1)[:, 0] > squared_cell
+            if too_far.any():
+                redo.append(rows[too_far])
+
+    if redo:
+        queries = np.concatenate(redo)
+        result[queries] = _brute_force_knn(points, queries, k)
+    return result
+
+
+def k_nearest_neighbors(points: np.ndarray, k: int, grid_threshold: int = 5000) -> np.ndarray:
+    """
+    k nearest neighbours of every point, sorted by distance
+    points: (n, 2) array of coordinates
+    Small inputs use blocked brute force, larger ones a uniform grid.
+    Returns an (n, k) int array of city indices.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.zeros((n, 0), dtype=np.intp)
+    if n <= grid_threshold:
+        return _brute_force_knn(points, np.arange(n), k)
+    return _grid_knn(points, k)
+
+
+def candidate_pairs(points: np.ndarray, k: int) -> tuple:
+    """
+    Undirected k-nearest-neighbour edges (u, v) with u < v, without duplicates
+    Returns two int arrays.
+    """
+    n = len(points)
+    neighbors = k_nearest_neighbors(points, k)
+    rows = np.repeat(np.arange(n), neighbors.shape[1])
+    cols = neighbors.ravel()
+    keys = np.unique(np.minimum(rows, cols) * n + np.maximum(rows, cols))
+    return keys // n, keys % n
+
+
+def k_nearest_from_matrix(matrix: np.ndarray, k: int) -> np.ndarray:
+    """k nearest neighbours of every city taken from a dense distance matrix"""
+    matrix = np.asarray(matrix)
+    n = len(matrix)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.zeros((n, 0), dtype=np.intp)
+
+    d = matrix.astype(float, copy=True)
+    np.fill_diagonal(d, np.inf)
+    nearest = np.argpartition(d, k - 1, axis=1)[:, :k]
+    order = np.argsort(np.take_along_axis(d, nearest, axis=1), axis=1, kind='stable')
+    return np.take_along_axis(nearest, order, axis=1)
@@ -0,0 +1,67 @@
+import numpy as np
+
+
+class CandidatePheromone:
+    """
+    Pheromone on a sparse set of candidate edges, stored CSR-style
+    Row i holds the candidate neighbours of city i (sorted) in
+    indices[indptr[i]:indptr[i + 1]] with their trail in values. Edges
+    outside the candidate set share one default trail, so evaporation is
+    O(n·k) and memory stays linear in n.
+    """
+
+    def __init__(self, u: np.ndarray, v: np.ndarray, n: int, initial: float,
+                 dtype=np.float64):
+        """
+        u, v: Undirected candidate edges (each pair once); stored in both directions
+        n: Number of cities
+        initial: Starting trail on every edge (candidate or not)
+        """
+        rows = np.concatenate([u, v]).astype(np.int64)
+        cols = np.concatenate([v, u]).astype(np.int64)
+        order = np.lexsort((cols, rows))
+        rows, cols = rows[order], cols[order]
+
+        self.n = n
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=self.indptr[1:])
+        self.indices = cols
+        self.values = np.full(len(cols), initial, dtype=dtype)
+        self.default = float(initial)
+        # Khoá toàn cục (hàng * n + cột) tăng dần, dùng để tìm cạnh bằng searchsorted
+        self._keys = rows * n + cols
+
+    @property
+    def nbytes(self) -> int:
+        return self.indptr.nbytes + self.indices.nbytes + self.values.nbytes + self._keys.nbytes
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def neighbors(self, city: int) -> slice:
+        """Slice of the CSR arrays holding city's candidate edges"""
+        return slice(self.indptr[city], self.indptr[city + 1])
+
+    def positions(self, a: np.ndarray, b: np.ndarray):
+        """CSR positions of edges (a[i], b[i]) and a mask of which are candidates"""
+        keys = np.asarray(a, dtype=np.int64) * self.n + np.asarray(b, dtype=np.int64)
+        pos = np.searchsorted(self._keys, keys)
+        pos = np.minimum(pos, len(self._keys) - 1)
+        found = self._keys[pos] == keys if len(self._keys) else np.zeros(len(keys), dtype=bool)
+        return pos, found
+
+    def get(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Trail on edges (a[i], b[i]); the default for non-candidate edges"""
+        pos, found = self.positions(a, b)
+        return np.where(found, self.values[pos] if len(self.values) else 0.0, self.default)
+
+    def evaporate(self, rate: float):
+        self.values *= (1 - rate)
+        self.default *= (1 - rate)
+
+    def deposit(self, a: np.ndarray, b: np.ndarray, amounts):
+        """Add amounts to edges (a, b) in both directions; non-candidate edges are skipped"""
+        amounts = np.broadcast_to(np.asarray(amounts, dtype=float), np.shape(a))
+        for x, y in ((a, b), (b, a)):
+            pos, found = self.positions(x, y)
+            np.add.at(self.values, pos[found], amounts[found])
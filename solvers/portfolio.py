@@ -0,0 +1,180 @@
+import multiprocessing as mp
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .base import TSPSolver
+from .space_filling_curve import SpaceFillingCurve
+
+
+def _portfolio_worker(name: str, params: Dict, shm_name: str, n: int, results):
+    """
+    Run one solver on the shared coordinates
+    Every improved tour is sent as soon as it is found, so a solver that is
+    cancelled at the deadline still contributes its best-so-far tour.
+    """
+    from .registry import get_solver
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        points = np.ndarray((n, 2), dtype=np.float64, buffer=shm.buf)
+        solver = get_solver(name)(points, **params)
+        for event in solver.iter_solve():
+            if event['tour'] is not None or event['type'] == 'done':
+                tour = list(event['tour']) if event['tour'] is not None else None
+                results.put((name, tour, float(event['best_distance']), None,
+                             event['type'] == 'done'))
+    except Exception as exc:  # báo lỗi về tiến trình chính thay vì im lặng
+        results.put((name, None, float('inf'), repr(exc), True))
+    finally:
+        solver = points = None
+        shm.close()
+
+
+class Portfolio(TSPSolver):
+    """Race several solvers in parallel processes and keep the best tour"""
+
+    needs_distance_matrix = False
+
+    # Thuật toán thắng phụ thuộc vào thời gian chạy thực tế (deadline), kể cả khi mọi thành viên có seed
+    deterministic = False
+
+    @classmethod
+    def is_deterministic(cls, params: Dict) -> bool:
+        return False
+
+    def __init__(self, cities: List[Tuple[float, float]],
+                 algorithms: Optional[Dict[str, Dict]] = None,
+                 time_budget: float = 10.0,
+                 metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64',
+                 matrix_layout: str = 'dense'):
+        """
+        Initialize portfolio
+        algorithms: Registered solver name -> constructor keyword arguments
+        time_budget: Seconds to wait before cancelling solvers that are still running
+        metric: Distance metric name (see solvers.metrics)
+        matrix_dtype, matrix_layout: Distance matrix storage (see TSPSolver)
+        """
+        super().__init__(cities, metric, matrix_dtype, matrix_layout)
+        if algorithms is None:
+            algorithms = {
+                'nearest_neighbor': {},
+                'nearest_insertion': {},
+                'farthest_insertion': {},
+                'ant_colony': {'n_ants': min(50, max(1, self.n)), 'n_iterations': 100},
+            }
+        self.algorithms = algorithms
+        self.time_budget = time_budget
+        self.results = {}
+
+    def get_complexity(self) -> Tuple[str, str]:
+        """
+        Time Complexity: O(min(budget, max T_i)) - Solvers run concurrently
+        Space Complexity: O(Σ S_i) - Every worker holds its own solver state
+        """
+        return ("O(min(budget, max T_i))", "O(Σ S_i)")
+
+    def solve(self) -> Tuple[List[int], float, float]:
+        tour, distance, time_taken, _ = self.solve_with_steps()
+        return tour, distance, time_taken
+
+    def solve_with_steps(self) -> Tuple[List[int], float, float, List[Dict]]:
+        start_time = time.time()
+        deadline = start_time + self.time_budget
+        steps = []
+        self.results = {}
+
+        points = self.points
+        shm = shared_memory.SharedMemory(create=True, size=max(points.nbytes, 1))
+        shared = np.ndarray(points.shape, dtype=np.float64, buffer=shm.buf)
+        shared[:] = points
+
+        ctx = mp.get_context()
+        results = ctx.Queue()
+        workers = {}
+        try:
+            for name, params in self.algorithms.items():
+                params = {**self._matrix_params(), **params}
+                proc = ctx.Process(target=_portfolio_worker,
+                                   args=(name, params, shm.name, self.n, results),
+                                   daemon=True)
+                proc.start()
+                workers[name] = proc
+
+            steps.append({
+                'step': 0,
+                'description': f'Chạy song song {len(workers)} thuật toán, ngân sách {self.time_budget:.1f}s',
+                'tour': None,
+                'selected': None,
+                'position': None
+            })
+
+            pending = set(workers)
+            best_tour, best_distance = None, float('inf')
+            while pending:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    name, tour, distance, error, finished = results.get(timeout=min(remaining, 0.1))
+                except queue.Empty:
+                    # Tiến trình chết mà không gửi kết quả
+                    pending = {alg for alg in pending if workers[alg].is_alive()}
+                    continue
+
+                if finished:
+                    pending.discard(name)
+                self.results[name] = {'distance': distance, 'error': error,
+                                      'time': time.time() - start_time,
+                                      'finished': finished}
+                if tour is not None and distance < best_distance:
+                    best_tour, best_distance = tour, distance
+                    status = 'về đích' if finished else 'cải thiện'
+                    steps.append({
+                        'step': len(steps),
+                        'description': f'{name} {status}: khoảng cách {distance:.2f} (tốt nhất hiện tại)',
+                        'tour': tour.copy(),
+                        'selected': None,
+                        'position': None
+                    })
+        finally:
+            # Huỷ các thuật toán chưa xong khi hết giờ
+            for proc in workers.values():
+                if proc.is_alive():
+                    proc.terminate()
+            for proc in workers.values():
+                proc.join()
+            results.close()
+            shared = None
+            shm.close()
+            shm.unlink()
+
+        cancelled = [name for name in self.algorithms
+                     if not self.results.get(name, {}).get('finished')]
+        for name in cancelled:
+            partial = self.results.get(name, {'distance': float('inf'), 'time': None})
+            self.results[name] = {'distance': partial['distance'], 'error': 'cancelled',
+                                  'time': partial['time'], 'finished': False}
+
+        if best_tour is None:
+            # Không thuật toán nào kịp xong: dùng đường cong Hilbert (O(n log n)),
+            # tính khoảng cách cùng metric/kiểu ma trận với các thành viên
+            best_tour, best_distance, _ = SpaceFillingCurve(points, **self._matrix_params()).solve()
+
+        time_taken = time.time() - start_time
+
+        steps.append({
+            'step': len(steps),
+            'description': f'Hoàn thành tour với khoảng cách {best_distance:.2f} '
+                           f'({len(cancelled)} thuật toán bị huỷ khi hết giờ). '
+                           f'Tour khép kín từ {best_tour[-1]} về {best_tour[0]}',
+            'tour': list(best_tour),
+            'selected': None,
+            'position': None
+        })
+
+        return list(best_tour), best_distance, time_taken, steps
@@ -0,0 +1,274 @@
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Context manager rỗng dùng chung khi không bật profiler (không cấp phát gì)
+NULL_SPAN = contextlib.nullcontext()
+
+
+class _Span:
+    """One timed region; nested spans subtract their time from the parent's self time"""
+
+    __slots__ = ('profiler', 'name', 'args', 'start', 'child_ns')
+
+    def __init__(self, profiler: 'Profiler', name: str, args: Optional[Dict]):
+        self.profiler = profiler
+        self.name = name
+        self.args = args
+        self.child_ns = 0
+
+    def __enter__(self) -> '_Span':
+        self.profiler._stack().append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        stack = self.profiler._stack()
+        stack.pop()
+        duration = end - self.start
+        if stack:
+            stack[-1].child_ns += duration
+        self.profiler._record(self.name, self.start, duration, duration - self.child_ns,
+                              len(stack), self.args)
+        return False
+
+
+class Profiler:
+    """
+    Lightweight span timer with an optional sampling profiler
+    Spans are opened with `with profiler.span('phase'):` (solvers do this
+    through TSPSolver._span / @profiled, which cost nothing but an `is None`
+    check while profiling is off). Results are available as a flat per-phase
+    summary() and as a Chrome trace / Perfetto JSON (write_chrome_trace()).
+    """
+
+    def __init__(self, sample_interval: Optional[float] = None, max_events: int = 1_000_000):
+        """
+        sample_interval: Seconds between stack samples inside sampling() (None: no sampling)
+        max_events: Individual spans kept for the trace; later spans still count in summary()
+        """
+        if sample_interval is not None and sample_interval <= 0:
+            raise ValueError(f"sample_interval must be positive, got {sample_interval}")
+        self.sample_interval = sample_interval
+        self.max_events = max_events
+        self.origin = time.perf_counter_ns()
+        # (tên, bắt đầu ns, độ dài ns, thread, args) của từng span
+        self.events: List[Tuple[str, int, int, int, Optional[Dict]]] = []
+        self.dropped_events = 0
+        # tên -> [số lần, tổng ns, self ns, max ns]
+        self.phases: Dict[str, List[int]] = {}
+        self.top_level_ns = 0
+        # (thời điểm ns, ngăn xếp hàm từ ngoài vào trong) của từng mẫu
+        self.samples: List[Tuple[int, Tuple[str, ...]]] = []
+        self.sampled_thread: Optional[int] = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def span(self, name: str, **args) -> _Span:
+        """Context manager timing one region; args are shown in the trace viewer"""
+        return _Span(self, name, args or None)
+
+    def add(self, name: str, seconds: float):
+        """Record a duration measured elsewhere as a top-level phase"""
+        duration = int(seconds * 1e9)
+        self._record(name, time.perf_counter_ns() - duration, duration, duration, 0, None)
+
+    def _record(self, name: str, start: int, duration: int, self_ns: int, depth: int,
+                args: Optional[Dict]):
+        with self._lock:
+            phase = self.phases.get(name)
+            if phase is None:
+                self.phases[name] = [1, duration, self_ns, duration]
+            else:
+                phase[0] += 1
+                phase[1] += duration
+                phase[2] += self_ns
+                if duration > phase[3]:
+                    phase[3] = duration
+            if depth == 0:
+                self.top_level_ns += duration
+            if len(self.events) < self.max_events:
+                self.events.append((name, start, duration, threading.get_ident(), args))
+            else:
+                self.dropped_events += 1
+
+    @contextlib.contextmanager
+    def sampling(self):
+        """
+        Sample the calling thread's Python stack every sample_interval seconds
+        A no-op when sample_interval is None. Samples are taken from a
+        background thread, which only runs when the sampled thread releases
+        the GIL, so the switch interval is lowered to the sampling interval
+        for the duration.
+        """
+        if self.sample_interval is None:
+            yield self
+            return
+        target = threading.get_ident()
+        self.sampled_thread = target
+        stop = threading.Event()
+        sampler = threading.Thread(target=self._sample_loop, args=(target, stop),
+                                   name='profiler-sampler', daemon=True)
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(switch_interval, self.sample_interval))
+        sampler.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            sampler.join()
+            sys.setswitchinterval(switch_interval)
+
+    def _sample_loop(self, target: int, stop: threading.Event):
+        own_file = __file__
+        while not stop.wait(self.sample_interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None and len(stack) < 128:
+                code = frame.f_code
+                # Bỏ các khung của chính profiler (contextmanager sampling, span)
+                if code.co_filename != own_file:
+                    stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self.samples.append((time.perf_counter_ns(), tuple(reversed(stack))))
+
+    def _sampled_summary(self, top: int) -> Optional[Dict]:
+        if not self.samples:
+            return None
+        own = Counter(stack[-1] for _, stack in self.samples)
+        total = Counter(name for _, stack in self.samples for name in set(stack))
+        n = len(self.samples)
+        return {
+            'n_samples': n,
+            'interval_s': self.sample_interval,
+            'functions': {
+                name: {'self_samples': count, 'total_samples': total[name],
+                       'self_fraction': round(count / n, 4)}
+                for name, count in own.most_common(top)
+            }
+        }
+
+    def summary(self, top: int = 20) -> Dict:
+        """
+        Flat per-phase summary
+        phases: count, total/self/mean/max seconds and the share of the
+        top-level wall time spent in the phase itself (children excluded),
+        sorted by self time. sampled: the top functions by leaf samples.
+        """
+        wall = self.top_level_ns
+        phases = {}
+        for name, (count, total, self_ns, longest) in sorted(
+                self.phases.items(), key=lambda item: -item[1][2]):
+            phases[name] = {
+                'count': count,
+                'total_s': round(total / 1e9, 6),
+                'self_s': round(self_ns / 1e9, 6),
+                'mean_s': round(total / count / 1e9, 9),
+                'max_s': round(longest / 1e9, 6),
+                'self_fraction': round(self_ns / wall, 4) if wall else None
+            }
+        return {
+            'wall_s': round(wall / 1e9, 6),
+            'phases': phases,
+            'sampled': self._sampled_summary(top),
+            'dropped_events': self.dropped_events
+        }
+
+    def print_summary(self, top: int = 20):
+        summary = self.summary(top)
+        print(f"{'Phase':<24} {'Count':>9} {'Total (s)':>11} {'Self (s)':>11} {'Self %':>7}")
+        for name, phase in summary['phases'].items():
+            share = phase['self_fraction']
+            print(f"{name:<24} {phase['count']:>9} {phase['total_s']:>11.4f} {phase['self_s']:>11.4f} "
+                  f"{'' if share is None else f'{share:.1%}':>7}")
+        sampled = summary['sampled']
+        if sampled:
+            print(f"\nTop functions ({sampled['n_samples']} samples):")
+            for name, stats in sampled['functions'].items():
+                print(f"  {stats['self_fraction']:>6.1%}  {name}")
+
+    def _sample_events(self, pid: int, tid: int) -> List[Dict]:
+        """
+        Coalesce consecutive samples into nested complete events
+        A frame stays open while successive samples share the same stack
+        prefix, which turns the samples into a flame chart.
+        """
+        events = []
+        open_frames: List[Tuple[str, int]] = []
+
+        def close(depth: int, end: int):
+            while len(open_frames) > depth:
+                name, start = open_frames.pop()
+                events.append({'name': name, 'cat': 'sample', 'ph': 'X', 'pid': pid, 'tid': tid,
+                               'ts': (start - self.origin) / 1e3, 'dur': (end - start) / 1e3})
+
+        for ts, stack in self.samples:
+            common = 0
+            while (common < len(open_frames) and common < len(stack)
+                   and open_frames[common][0] == stack[common]):
+                common += 1
+            close(common, ts)
+            open_frames.extend((name, ts) for name in stack[common:])
+        if self.samples:
+            close(0, self.samples[-1][0] + int(self.sample_interval * 1e9))
+        return events
+
+    def chrome_trace(self, metadata: Optional[Dict] = None) -> Dict:
+        """Spans (and sampled stacks) in the Chrome trace event format, also read by Perfetto"""
+        pid = os.getpid()
+        # Thread id thật rất lớn; đánh số lại 1, 2, ... cho dễ đọc
+        threads: Dict[int, int] = {}
+        events = []
+        for name, start, duration, thread, args in self.events:
+            tid = threads.setdefault(thread, len(threads) + 1)
+            event = {'name': name, 'cat': 'span', 'ph': 'X', 'pid': pid, 'tid': tid,
+                     'ts': (start - self.origin) / 1e3, 'dur': duration / 1e3}
+            if args:
+                event['args'] = args
+            events.append(event)
+        for thread, tid in threads.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                           'args': {'name': f'spans (thread {tid})'}})
+        if self.samples:
+            tid = len(threads) + 1
+            events.extend(self._sample_events(pid, tid))
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                           'args': {'name': f'samples ({self.sample_interval * 1e3:g} ms)'}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms', 'otherData': metadata or {}}
+
+    def write_chrome_trace(self, filename: str, metadata: Optional[Dict] = None):
+        """Write the trace as JSON (open in chrome://tracing or ui.perfetto.dev)"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(metadata), f)
+
+
+def profiled(name: str) -> Callable:
+    """
+    Decorator timing a TSPSolver method as the span `name`
+    While the solver's profiler is None the wrapper only adds a call and an
+    `is None` check.
+    """
+    def decorate(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profiler = self.profiler
+            if profiler is None:
+                return method(self, *args, **kwargs)
+            with profiler.span(name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
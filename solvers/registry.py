@@ -0,0 +1,43 @@
+from typing import Dict, Type
+
+from .base import TSPSolver
+from .nearest_neighbor import NearestNeighbor
+from .nearest_insertion import NearestInsertion
+from .farthest_insertion import FarthestInsertion
+from .ant_colony import AntColonyOptimization
+from .held_karp import HeldKarp
+from .greedy_edge import GreedyEdge
+from .savings import Savings
+from .christofides import Christofides
+from .space_filling_curve import SpaceFillingCurve
+from .decomposition import SpatialDecomposition
+from .portfolio import Portfolio
+
+# Tên thuật toán -> lớp solver (dùng chung cho benchmark, phân rã, ...)
+SOLVERS: Dict[str, Type[TSPSolver]] = {
+    'nearest_neighbor': NearestNeighbor,
+    'nearest_insertion': NearestInsertion,
+    'farthest_insertion': FarthestInsertion,
+    'ant_colony': AntColonyOptimization,
+    'held_karp': HeldKarp,
+    'space_filling_curve': SpaceFillingCurve,
+    'greedy_edge': GreedyEdge,
+    'savings': Savings,
+    'christofides': Christofides,
+    'spatial_decomposition': SpatialDecomposition,
+    'portfolio': Portfolio,
+}
+
+
+def register_solver(name: str, solver_class: Type[TSPSolver]):
+    """Register a solver class under a name"""
+    if not issubclass(solver_class, TSPSolver):
+        raise TypeError(f"{solver_class!r} is not a TSPSolver subclass")
+    SOLVERS[name] = solver_class
+
+
+def get_solver(name: str) -> Type[TSPSolver]:
+    """Look up a registered solver class by name"""
+    if name not in SOLVERS:
+        raise ValueError(f"Unknown algorithm: {name}")
+    return SOLVERS[name]
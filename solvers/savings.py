@@ -0,0 +1,150 @@
+import heapq
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .base import TSPSolver
+from .neighbors import candidate_pairs
+from .profiling import profiled
+
+
+class Savings(TSPSolver):
+    """Clarke-Wright Savings algorithm"""
+
+    needs_distance_matrix = False
+
+    def __init__(self, cities: List[Tuple[float, float]],
+                 hub: int = 0,
+                 k: int = 20,
+                 candidate_threshold: int = 1000,
+                 metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64',
+                 matrix_layout: str = 'dense'):
+        """
+        Initialize Savings solver
+        hub: City every route starts from before routes are merged
+        k: Number of nearest neighbours per city used as candidate pairs
+        candidate_threshold: Up to this many cities all pairs are candidates,
+            above it only the k-nearest pairs are (no dense matrix is built)
+        metric: Distance metric name (see solvers.metrics)
+        matrix_dtype, matrix_layout: Distance matrix storage (see TSPSolver)
+        """
+        super().__init__(cities, metric, matrix_dtype, matrix_layout)
+        self.hub = hub
+        self.k = k
+        self.candidate_threshold = candidate_threshold
+
+    def get_complexity(self) -> Tuple[str, str]:
+        """
+        Time Complexity: O(n² log n) - Heap over all pairs (O(nk log(nk)) on candidate lists)
+        Space Complexity: O(n²) - All pairs (O(nk) on candidate lists)
+        """
+        if self.n > self.candidate_threshold:
+            return ("O(n·k log(n·k))", "O(n·k)")
+        return ("O(n² log n)", "O(n²)")
+
+    def solve(self) -> Tuple[List[int], float, float]:
+        tour, distance, time_taken, _ = self.solve_with_steps()
+        return tour, distance, time_taken
+
+    @profiled('savings')
+    def _savings(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Savings s(i, j) = d(hub, i) + d(hub, j) - d(i, j) for every candidate pair"""
+        if self.n <= self.candidate_threshold:
+            u, v = np.triu_indices(self.n, k=1)
+        else:
+            u, v = candidate_pairs(self.points, self.k)
+
+        keep = (u != self.hub) & (v != self.hub)
+        u, v = u[keep], v[keep]
+        from_hub = self._distances_from(self.hub)
+        savings = from_hub[u] + from_hub[v] - self._pair_distances(u, v)
+        return savings, u, v
+
+    def solve_with_steps(self) -> Tuple[List[int], float, float, List[Dict]]:
+        start_time = time.time()
+        steps = []
+
+        if self.n < 3:
+            tour = list(range(self.n))
+            distance = self.calculate_tour_distance(tour)
+            steps.append({
+                'step': 0,
+                'description': f'Hoàn thành tour với khoảng cách {distance:.2f}. Tour khép kín từ {tour[-1]} về {tour[0]}',
+                'tour': tour.copy(),
+                'selected': None,
+                'position': None
+            })
+            return tour, distance, time.time() - start_time, steps
+
+        savings, u, v = self._savings()
+        self._checkpoint()
+        with self._span('heapify'):
+            heap = list(zip((-savings).tolist(), u.tolist(), v.tolist()))
+            heapq.heapify(heap)
+
+        steps.append({
+            'step': 0,
+            'description': f'Tính {len(heap)} giá trị tiết kiệm so với thành phố trung tâm {self.hub}',
+            'tour': None,
+            'selected': None,
+            'position': None
+        })
+
+        # other_end[i]: đầu mút còn lại của tuyến có đầu mút i; links[i]: số cạnh đã nối
+        other_end = list(range(self.n))
+        links = [0] * self.n
+        adjacency = [[] for _ in range(self.n)]
+        merges = 0
+        target = self.n - 2
+        n_pairs = len(heap)
+
+        with self._span('merge_routes'):
+            while heap and merges < target:
+                _, i, j = heapq.heappop(heap)
+                if links[i] >= 2 or links[j] >= 2:
+                    continue  # không còn là đầu mút của tuyến
+                if other_end[i] == j:
+                    continue  # cùng một tuyến
+
+                a, b = other_end[i], other_end[j]
+                other_end[a] = b
+                other_end[b] = a
+                links[i] += 1
+                links[j] += 1
+                adjacency[i].append(j)
+                adjacency[j].append(i)
+                merges += 1
+                self._checkpoint()
+
+        if self.counters is not None:
+            self.counters.candidate_scans += n_pairs - len(heap)
+
+        steps.append({
+            'step': 1,
+            'description': f'Gộp {merges} cặp tuyến theo giá trị tiết kiệm giảm dần',
+            'tour': None,
+            'selected': None,
+            'position': None
+        })
+
+        # Thành phố trung tâm không có cạnh nên là một đoạn riêng; nối các tuyến còn lại
+        tour = self._join_path_fragments(adjacency)
+
+        # Xoay tour để luôn bắt đầu từ thành phố 0
+        start = tour.index(0)
+        tour = tour[start:] + tour[:start]
+
+        distance = self.calculate_tour_distance(tour)
+        time_taken = time.time() - start_time
+
+        steps.append({
+            'step': 2,
+            'description': f'Hoàn thành tour với khoảng cách {distance:.2f}. Tour khép kín từ {tour[-1]} về {tour[0]}',
+            'tour': tour.copy(),
+            'selected': None,
+            'position': None
+        })
+
+        return tour, distance, time_taken, steps
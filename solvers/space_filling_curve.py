@@ -0,0 +1,156 @@
+import time
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .base import TSPSolver
+
+
+def _hilbert_tables() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    State machine for the Hilbert curve, two levels (4 bits) per lookup
+    A state is the orientation of the current sub-square: (swap, complement).
+    """
+    digit = np.zeros(16, dtype=np.int64)
+    next_state = np.zeros(16, dtype=np.intp)
+    for state in range(4):
+        swap, flip = state >> 1, state & 1
+        for quadrant in range(4):
+            tx, ty = (quadrant >> 1) ^ flip, (quadrant & 1) ^ flip
+            if swap:
+                tx, ty = ty, tx
+            new_swap, new_flip = swap, flip
+            if ty == 0:
+                new_swap ^= 1
+                new_flip ^= tx
+            digit[state * 4 + quadrant] = (3 * tx) ^ ty
+            next_state[state * 4 + quadrant] = new_swap * 2 + new_flip
+
+    # Gộp hai mức liên tiếp thành một bảng 64 phần tử
+    digit2 = np.zeros(64, dtype=np.int64)
+    next_state2 = np.zeros(64, dtype=np.intp)
+    for state in range(4):
+        for bits in range(16):
+            high = state * 4 + (bits >> 2)
+            low = next_state[high] * 4 + (bits & 3)
+            digit2[state * 16 + bits] = (digit[high] << 2) | digit[low]
+            next_state2[state * 16 + bits] = next_state[low]
+    return digit2, next_state2
+
+
+_HILBERT_DIGITS, _HILBERT_NEXT = _hilbert_tables()
+
+
+def _spread_bits(v: np.ndarray) -> np.ndarray:
+    """Insert a zero bit between each of the low 16 bits of v"""
+    v = (v | (v << 8)) & 0x00FF00FF
+    v = (v | (v << 4)) & 0x0F0F0F0F
+    v = (v | (v << 2)) & 0x33333333
+    v = (v | (v << 1)) & 0x55555555
+    return v
+
+
+def hilbert_indices(points: np.ndarray, order: int = 16) -> np.ndarray:
+    """
+    Hilbert curve index of every point, computed with vectorized bit operations
+    points: (n, 2) array of coordinates
+    order: Curve resolution (at most 16), the plane is split into a 2^order × 2^order grid
+    """
+    if not 1 <= order <= 16:
+        raise ValueError(f"order must be between 1 and 16, got {order}")
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    if n == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # Đưa toạ độ về lưới số nguyên [0, 2^order - 1] (giữ tỉ lệ trục x/y)
+    lo = points.min(axis=0)
+    span = float(np.max(points.max(axis=0) - lo))
+    if span == 0:
+        return np.zeros(n, dtype=np.int64)
+    scale = ((1 << order) - 1) / span
+    x = ((points[:, 0] - lo[0]) * scale).astype(np.int64)
+    y = ((points[:, 1] - lo[1]) * scale).astype(np.int64)
+
+    # Xen kẽ bit x/y (Morton), sau đó duyệt 4 bit một lần qua máy trạng thái
+    morton = (_spread_bits(x) << 1) | _spread_bits(y)
+    levels = order + (order & 1)
+    d = np.zeros(n, dtype=np.int64)
+    state = np.zeros(n, dtype=np.intp)
+    for shift in range(2 * levels - 4, -1, -4):
+        key = (state << 4) | ((morton >> shift) & 15)
+        d <<= 4
+        d |= _HILBERT_DIGITS[key]
+        state = _HILBERT_NEXT[key]
+    return d
+
+
+def hilbert_order(points: np.ndarray, order: int = 16) -> np.ndarray:
+    """Visit order of the points along the Hilbert curve (usable as a seed tour)"""
+    return np.argsort(hilbert_indices(points, order), kind='stable')
+
+
+class SpaceFillingCurve(TSPSolver):
+    """Hilbert space-filling curve heuristic (no distance matrix needed)"""
+
+    needs_distance_matrix = False
+
+    def __init__(self, cities: List[Tuple[float, float]], order: int = 16,
+                 metric: str = 'euclidean',
+                 matrix_dtype: str = 'float64',
+                 matrix_layout: str = 'dense'):
+        """
+        Initialize space-filling curve solver
+        order: Hilbert curve resolution (grid of 2^order × 2^order cells)
+        metric: Distance metric name (see solvers.metrics)
+        matrix_dtype, matrix_layout: Distance matrix storage (see TSPSolver)
+        """
+        super().__init__(cities, metric, matrix_dtype, matrix_layout)
+        self.order = order
+
+    def get_complexity(self) -> Tuple[str, str]:
+        """
+        Time Complexity: O(n log n) - Hilbert index per city, then sort
+        Space Complexity: O(n) - Coordinates and indices only
+        """
+        return ("O(n log n)", "O(n)")
+
+    def solve(self) -> Tuple[List[int], float, float]:
+        tour, distance, time_taken, _ = self.solve_with_steps()
+        return tour, distance, time_taken
+
+    def solve_with_steps(self) -> Tuple[List[int], float, float, List[Dict]]:
+        start_time = time.time()
+        steps = []
+
+        if self.n == 0:
+            return [], 0.0, time.time() - start_time, steps
+
+        points = self.points
+        with self._span('hilbert_order'):
+            order = hilbert_order(points, self.order)
+
+        # Xoay tour để luôn bắt đầu từ thành phố 0
+        start = int(np.flatnonzero(order == 0)[0])
+        order = np.roll(order, -start)
+
+        tour = order.tolist()
+        distance = self.calculate_tour_distance(tour)
+        time_taken = time.time() - start_time
+
+        steps.append({
+            'step': 0,
+            'description': f'Sắp xếp {self.n} thành phố theo chỉ số đường cong Hilbert (bậc {self.order})',
+            'tour': tour.copy(),
+            'selected': None,
+            'position': None
+        })
+        steps.append({
+            'step': 1,
+            'description': f'Hoàn thành tour với khoảng cách {distance:.2f}. Tour khép kín từ {tour[-1]} về {tour[0]}',
+            'tour': tour.copy(),
+            'selected': None,
+            'position': None
+        })
+
+        return tour, distance, time_taken, steps
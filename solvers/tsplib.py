@@ -0,0 +1,249 @@
+"""
+TSPLIB reader/writer (.tsp instances and .tour files)
+Đọc/ghi định dạng TSPLIB, phần số liệu được phân tích hàng loạt bằng NumPy
+"""
+
+import gzip
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Các phần dữ liệu đã biết; phần header kết thúc ở phần đầu tiên gặp
+_SECTION_RE = re.compile(rb'^\s*([A-Z_]+_SECTION|EOF)\b', re.MULTILINE)
+
+# Thứ tự phần tử của ma trận EXPLICIT. Ma trận đối xứng nên dạng theo cột
+# trùng với dạng theo hàng của tam giác còn lại.
+_TRIANGLE_INDICES = {
+    'UPPER_ROW': lambda n: np.triu_indices(n, 1),
+    'LOWER_ROW': lambda n: np.tril_indices(n, -1),
+    'UPPER_DIAG_ROW': lambda n: np.triu_indices(n, 0),
+    'LOWER_DIAG_ROW': lambda n: np.tril_indices(n, 0),
+    'UPPER_COL': lambda n: np.tril_indices(n, -1),
+    'LOWER_COL': lambda n: np.triu_indices(n, 1),
+    'UPPER_DIAG_COL': lambda n: np.tril_indices(n, 0),
+    'LOWER_DIAG_COL': lambda n: np.triu_indices(n, 0),
+}
+
+COORDINATE_TYPES = ('EUC_2D', 'CEIL_2D', 'ATT', 'GEO')
+
+
+class TSPLIBInstance:
+    """Parsed TSPLIB problem: header fields plus coordinates and/or an explicit matrix"""
+
+    def __init__(self, header: Dict[str, str], coords: Optional[np.ndarray],
+                 matrix: Optional[np.ndarray]):
+        self.header = header
+        self.name = header.get('NAME', '')
+        self.comment = header.get('COMMENT', '')
+        self.dimension = int(header['DIMENSION'])
+        self.edge_weight_type = header.get('EDGE_WEIGHT_TYPE', 'EUC_2D')
+        self.coords = coords
+        self.matrix = matrix
+
+    @property
+    def metric(self) -> str:
+        """Name of the matching solver metric (see solvers.metrics)"""
+        return self.edge_weight_type.lower()
+
+    @property
+    def cities(self) -> np.ndarray:
+        """Node coordinates as an (n, 2) array (display data for EXPLICIT files)"""
+        if self.coords is None:
+            raise ValueError(f"{self.name or 'instance'} has no node coordinates")
+        return self.coords
+
+    def distance_matrix(self) -> np.ndarray:
+        """Distances with the TSPLIB rounding of the instance's edge weight type"""
+        if self.matrix is not None:
+            return self.matrix
+        return tsplib_distance_matrix(self.cities, self.edge_weight_type)
+
+    def tour_length(self, tour: List[int]) -> float:
+        """Length of a 0-based tour under the instance's own distance function"""
+        order = np.asarray(tour)
+        nxt = np.roll(order, -1)
+        if self.matrix is not None:
+            return float(np.sum(self.matrix[order, nxt]))
+        points = self.cities
+        return float(np.sum(tsplib_distances(points[order], points[nxt], self.edge_weight_type)))
+
+
+def _open(path: str):
+    return gzip.open(path, 'rb') if str(path).endswith('.gz') else open(path, 'rb')
+
+
+def _parse_numbers(data: bytes, dtype=np.float64) -> np.ndarray:
+    """All whitespace separated numbers of a section, parsed in C"""
+    return np.fromstring(data.decode('ascii'), dtype=dtype, sep=' ')
+
+
+def _split_sections(data: bytes):
+    """Header dict and {section name: raw bytes}"""
+    matches = list(_SECTION_RE.finditer(data))
+    header_end = matches[0].start() if matches else len(data)
+
+    header = {}
+    for line in data[:header_end].decode('ascii', errors='replace').splitlines():
+        if ':' in line:
+            key, value = line.split(':', 1)
+            header[key.strip().upper()] = value.strip()
+        elif line.strip():
+            parts = line.split(None, 1)
+            header[parts[0].upper()] = parts[1].strip() if len(parts) > 1 else ''
+
+    sections = {}
+    for i, match in enumerate(matches):
+        name = match.group(1).decode('ascii')
+        if name == 'EOF':
+            break
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(data)
+        sections[name] = data[match.end():end]
+    return header, sections
+
+
+def _coordinate_section(raw: bytes, n: int) -> np.ndarray:
+    """NODE_COORD_SECTION / DISPLAY_DATA_SECTION rows 'id x y' -> (n, 2) in id order"""
+    values = _parse_numbers(raw)
+    if len(values) != 3 * n:
+        raise ValueError(f"expected {n} nodes with 2 coordinates, got {len(values)} values")
+    rows = values.reshape(n, 3)
+    ids = rows[:, 0].astype(np.int64) - 1
+    coords = np.empty((n, 2))
+    coords[ids] = rows[:, 1:]
+    return coords
+
+
+def _explicit_matrix(raw: bytes, n: int, edge_format: str) -> np.ndarray:
+    """EDGE_WEIGHT_SECTION in any TSPLIB layout -> dense (n, n) matrix"""
+    values = _parse_numbers(raw)
+    if edge_format == 'FULL_MATRIX':
+        if len(values) != n * n:
+            raise ValueError(f"FULL_MATRIX needs {n * n} values, got {len(values)}")
+        return values.reshape(n, n)
+    if edge_format not in _TRIANGLE_INDICES:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT: {edge_format}")
+
+    rows, cols = _TRIANGLE_INDICES[edge_format](n)
+    if len(values) != len(rows):
+        raise ValueError(f"{edge_format} needs {len(rows)} values, got {len(values)}")
+    matrix = np.zeros((n, n))
+    matrix[rows, cols] = values
+    matrix[cols, rows] = values
+    return matrix
+
+
+def read_tsplib(path: str) -> TSPLIBInstance:
+    """
+    Load a TSPLIB .tsp file (optionally .gz)
+    Supports EUC_2D, CEIL_2D, ATT and GEO coordinates and EXPLICIT
+    matrices in every FULL/UPPER/LOWER (DIAG) ROW/COL layout.
+    """
+    with _open(path) as f:
+        data = f.read()
+    header, sections = _split_sections(data)
+    if 'DIMENSION' not in header:
+        raise ValueError(f"{path}: missing DIMENSION")
+    n = int(header['DIMENSION'])
+    edge_type = header.get('EDGE_WEIGHT_TYPE', 'EUC_2D').upper()
+
+    coords = None
+    matrix = None
+    if edge_type == 'EXPLICIT':
+        if 'EDGE_WEIGHT_SECTION' not in sections:
+            raise ValueError(f"{path}: EXPLICIT instance without EDGE_WEIGHT_SECTION")
+        edge_format = header.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX').upper()
+        matrix = _explicit_matrix(sections['EDGE_WEIGHT_SECTION'], n, edge_format)
+        if 'DISPLAY_DATA_SECTION' in sections:
+            coords = _coordinate_section(sections['DISPLAY_DATA_SECTION'], n)
+    elif edge_type in COORDINATE_TYPES:
+        if 'NODE_COORD_SECTION' not in sections:
+            raise ValueError(f"{path}: {edge_type} instance without NODE_COORD_SECTION")
+        coords = _coordinate_section(sections['NODE_COORD_SECTION'], n)
+    else:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {edge_type}")
+
+    header['EDGE_WEIGHT_TYPE'] = edge_type
+    return TSPLIBInstance(header, coords, matrix)
+
+
+def read_tour(path: str) -> List[int]:
+    """Load a TSPLIB .tour file as a 0-based tour"""
+    with _open(path) as f:
+        data = f.read()
+    _, sections = _split_sections(data)
+    if 'TOUR_SECTION' not in sections:
+        raise ValueError(f"{path}: missing TOUR_SECTION")
+    values = _parse_numbers(sections['TOUR_SECTION'], dtype=np.int64)
+    # Phần tour kết thúc bằng -1
+    end = np.flatnonzero(values == -1)
+    if len(end):
+        values = values[:end[0]]
+    return (values - 1).tolist()
+
+
+def write_tour(path: str, tour: List[int], name: str = 'tour', comment: str = ''):
+    """Write a 0-based tour as a TSPLIB .tour file"""
+    order = np.asarray(tour, dtype=np.int64) + 1
+    with open(path, 'w', encoding='ascii') as f:
+        f.write(f'NAME : {name}\n')
+        if comment:
+            f.write(f'COMMENT : {comment}\n')
+        f.write(f'TYPE : TOUR\nDIMENSION : {len(order)}\nTOUR_SECTION\n')
+        np.savetxt(f, order, fmt='%d')
+        f.write('-1\nEOF\n')
+
+
+def write_tsplib(path: str, cities, name: str = 'instance', comment: str = '',
+                 edge_weight_type: str = 'EUC_2D'):
+    """Write coordinates as a TSPLIB .tsp file"""
+    points = np.asarray(cities, dtype=float).reshape(-1, 2)
+    rows = np.column_stack([np.arange(1, len(points) + 1), points])
+    with open(path, 'w', encoding='ascii') as f:
+        f.write(f'NAME : {name}\n')
+        if comment:
+            f.write(f'COMMENT : {comment}\n')
+        f.write(f'TYPE : TSP\nDIMENSION : {len(points)}\n'
+                f'EDGE_WEIGHT_TYPE : {edge_weight_type}\nNODE_COORD_SECTION\n')
+        np.savetxt(f, rows, fmt=['%d', '%.10g', '%.10g'])
+        f.write('EOF\n')
+
+
+def _geo_radians(values: np.ndarray) -> np.ndarray:
+    """TSPLIB GEO coordinates (DDD.MM) -> radians"""
+    degrees = np.trunc(values)
+    minutes = values - degrees
+    # TSPLIB dùng PI = 3.141592 khi tính khoảng cách GEO
+    return 3.141592 * (degrees + 5.0 * minutes / 3.0) / 180.0
+
+
+def tsplib_distances(a: np.ndarray, b: np.ndarray, edge_weight_type: str) -> np.ndarray:
+    """Row-wise TSPLIB distances between point arrays a and b"""
+    if edge_weight_type == 'GEO':
+        lat_a, lon_a = _geo_radians(a[..., 0]), _geo_radians(a[..., 1])
+        lat_b, lon_b = _geo_radians(b[..., 0]), _geo_radians(b[..., 1])
+        q1 = np.cos(lon_a - lon_b)
+        q2 = np.cos(lat_a - lat_b)
+        q3 = np.cos(lat_a + lat_b)
+        radius = 6378.388
+        arc = np.arccos(np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0))
+        return np.trunc(radius * arc + 1.0)
+
+    dx = a[..., 0] - b[..., 0]
+    dy = a[..., 1] - b[..., 1]
+    if edge_weight_type == 'ATT':
+        r = np.sqrt((dx * dx + dy * dy) / 10.0)
+        t = np.floor(r + 0.5)
+        return np.where(t < r, t + 1.0, t)
+    euclid = np.sqrt(dx * dx + dy * dy)
+    if edge_weight_type == 'EUC_2D':
+        return np.floor(euclid + 0.5)
+    if edge_weight_type == 'CEIL_2D':
+        return np.ceil(euclid)
+    raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {edge_weight_type}")
+
+
+def tsplib_distance_matrix(cities, edge_weight_type: str = 'EUC_2D') -> np.ndarray:
+    """Dense distance matrix with TSPLIB rounding"""
+    points = np.asarray(cities, dtype=float).reshape(-1, 2)
+    return tsplib_distances(points[:, None, :], points[None, :, :], edge_weight_type)
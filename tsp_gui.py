@@ -14,6 +14,7 @@ from solvers import (
     FarthestInsertion,
     AntColonyOptimization,
 )
+from solvers.tsplib import read_tsplib, write_tour
 
 
 class TSPGUI:
@@ -23,6 +24,8 @@ class TSPGUI:
         self.root.geometry("1400x900")
         
         self.cities = []
+        # Metric của instance (file TSPLIB GEO/ATT/CEIL_2D), truyền cho mọi solver
+        self.metric = 'euclidean'
         self.results = {}
         self.process_plot_frame = None
         self.current_step = 0
@@ -50,6 +53,12 @@ class TSPGUI:
         ttk.Button(city_frame, text="Tạo ngẫu nhiên", 
                   command=self.generate_random_cities).grid(row=1, column=0, columnspan=2, pady=5, sticky=tk.W+tk.E)
         
+        ttk.Button(city_frame, text="Tải file TSPLIB", 
+                  command=self.load_tsplib_file).grid(row=2, column=0, columnspan=2, pady=5, sticky=tk.W+tk.E)
+        
+        ttk.Button(city_frame, text="Lưu tour tốt nhất", 
+                  command=self.save_best_tour).grid(row=3, column=0, columnspan=2, pady=5, sticky=tk.W+tk.E)
+        
         
         # Algorithm parameters
         algo_frame = ttk.LabelFrame(left_panel, text="Tham số thuật toán", padding="10")
@@ -137,10 +146,51 @@ class TSPGUI:
                 return
            
             self.cities = [(random.uniform(0, 100), random.uniform(0, 100)) for _ in range(n)]
+            self.metric = 'euclidean'
             self.plot_cities()
             messagebox.showinfo("Thành công", f"Đã tạo {n} thành phố ngẫu nhiên")
         except ValueError:
             messagebox.showerror("Lỗi", "Vui lòng nhập số hợp lệ")
+    
+    def load_tsplib_file(self):
+        path = filedialog.askopenfilename(
+            title="Chọn file TSPLIB",
+            filetypes=[("TSPLIB", "*.tsp *.tsp.gz"), ("Tất cả", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            instance = read_tsplib(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Lỗi", f"Không đọc được file: {e}")
+            return
+        if instance.edge_weight_type == 'EXPLICIT':
+            messagebox.showerror("Lỗi", "File EXPLICIT chỉ có ma trận khoảng cách, "
+                                        "các thuật toán cần toạ độ và metric nên chưa hỗ trợ")
+            return
+        cities = instance.cities
+        
+        if self.results:
+            self.clear_results()
+        self.cities = [tuple(city) for city in cities.tolist()]
+        self.metric = instance.metric
+        self.plot_cities()
+        messagebox.showinfo("Thành công", f"Đã tải {instance.name or path} ({len(self.cities)} thành phố, "
+                                          f"{instance.edge_weight_type})")
+    
+    def save_best_tour(self):
+        if not self.results:
+            messagebox.showerror("Lỗi", "Chưa có kết quả để lưu")
+            return
+        name, result = min(self.results.items(), key=lambda item: item[1]['distance'])
+        path = filedialog.asksaveasfilename(
+            title="Lưu tour", defaultextension=".tour",
+            filetypes=[("TSPLIB tour", "*.tour")]
+        )
+        if not path:
+            return
+        write_tour(path, result['tour'], comment=f"{name}, length {result['distance']:.2f}")
+        messagebox.showinfo("Thành công", f"Đã lưu tour của {name}")
    
    
    
@@ -189,11 +239,11 @@ class TSPGUI:
             return
        
         algorithms = [
-            ("Nearest Neighbor", NearestNeighbor(self.cities)),
-            ("Nearest Insertion", NearestInsertion(self.cities)),
-            ("Farthest Insertion", FarthestInsertion(self.cities)),
+            ("Nearest Neighbor", NearestNeighbor(self.cities, metric=self.metric)),
+            ("Nearest Insertion", NearestInsertion(self.cities, metric=self.metric)),
+            ("Farthest Insertion", FarthestInsertion(self.cities, metric=self.metric)),
             ("Ant Colony Optimization", AntColonyOptimization(
-                self.cities, n_ants=n_ants, n_iterations=n_iterations
+                self.cities, n_ants=n_ants, n_iterations=n_iterations, metric=self.metric
             ))
         ]
        
@@ -0,0 +1,294 @@
+"""
+HTTP/JSON Solve Service for TSP Algorithms
+Dịch vụ HTTP giải TSP chỉ dùng thư viện chuẩn
+
+Endpoints:
+  POST /solve     JSON {"cities": [[x, y], ...], "solver": "...", "params": {...}}
+                  hoặc application/octet-stream (mảng float64/float32 x, y liên tiếp)
+                  với ?solver=...&params=<json>&dtype=float64
+  GET  /metrics   Latency histogram, queue depth, counters
+  GET  /solvers   Registered solver names
+  GET  /health
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from solvers import SOLVERS, SolveCancelled, get_solver
+from solvers.hashing import instance_hash
+
+# Biên trên (giây) của các bucket latency, kiểu Prometheus
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float('inf')]
+
+
+def _run_solver(solver: str, points: np.ndarray, params: Dict,
+                deadline: float) -> Tuple[List[int], float, float]:
+    """
+    Solve one request in a worker
+    The job gives up with SolveCancelled at the first solver checkpoint after
+    deadline (time.time()), so an abandoned request frees its worker and its
+    max_pending slot instead of running to completion.
+    """
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        raise SolveCancelled()
+    instance = get_solver(solver)(points, **params)
+    instance.cancel_event = threading.Event()
+    timer = threading.Timer(remaining, instance.cancel_event.set)
+    timer.daemon = True
+    timer.start()
+    try:
+        tour, distance, time_taken = instance.solve()
+    finally:
+        timer.cancel()
+    return [int(c) for c in tour], float(distance), time_taken
+
+
+class ServiceOverloaded(Exception):
+    """Raised when the job queue is full"""
+
+
+class SolveService:
+    """Bounded worker pool with request coalescing and metrics"""
+
+    def __init__(self, n_workers: int = 2, max_pending: int = 64, executor: str = 'process',
+                 request_timeout: float = 300.0):
+        """
+        n_workers: Worker processes/threads
+        max_pending: Distinct jobs allowed in the system (running + queued);
+            further requests get HTTP 503 instead of piling up
+        executor: 'process' or 'thread'
+        request_timeout: Seconds a request waits for its job (HTTP 504 after
+            that); the job itself is cancelled at the same deadline, which
+            coalesced requests share with the request that started it
+        """
+        if executor == 'process':
+            self.pool = ProcessPoolExecutor(max_workers=n_workers)
+        elif executor == 'thread':
+            self.pool = ThreadPoolExecutor(max_workers=n_workers)
+        else:
+            raise ValueError(f"executor must be 'process' or 'thread', got {executor!r}")
+        self.n_workers = n_workers
+        self.max_pending = max_pending
+        self.request_timeout = request_timeout
+
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, Future] = {}
+        self.counters = {'requests': 0, 'coalesced': 0, 'rejected': 0, 'errors': 0, 'timeouts': 0,
+                         'completed': 0}
+        self.latency_counts = [0] * len(LATENCY_BUCKETS)
+        self.latency_sum = 0.0
+
+    def submit(self, solver: str, points: np.ndarray, params: Dict) -> Tuple[Future, str, bool]:
+        """Start a job, or join an identical one already running"""
+        # Lỗi tên thuật toán / tham số -> 400 trước khi vào hàng đợi; khoá băm dùng
+        # tham số đã điền mặc định (kể cả metric) để hai cách viết cùng bài toán trùng nhau
+        resolved = get_solver(solver).resolve_params(**params)
+        key = instance_hash(points, solver, resolved)
+        with self._lock:
+            self.counters['requests'] += 1
+            existing = self._jobs.get(key)
+            if existing is not None:
+                self.counters['coalesced'] += 1
+                return existing, key, True
+            if len(self._jobs) >= self.max_pending:
+                self.counters['rejected'] += 1
+                raise ServiceOverloaded()
+
+            deadline = time.time() + self.request_timeout
+            future = self.pool.submit(_run_solver, solver, points, params, deadline)
+            self._jobs[key] = future
+        future.add_done_callback(lambda _: self._forget(key))
+        return future, key, False
+
+    def _forget(self, key: str):
+        with self._lock:
+            self._jobs.pop(key, None)
+
+    def record(self, latency: float, ok: bool, timed_out: bool = False):
+        """Add a finished request to the histogram"""
+        with self._lock:
+            self.counters['completed' if ok else 'timeouts' if timed_out else 'errors'] += 1
+            self.latency_sum += latency
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if latency <= bound:
+                    self.latency_counts[i] += 1
+                    break
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            pending = len(self._jobs)
+            return {
+                'counters': dict(self.counters),
+                'pending_jobs': pending,
+                'queue_depth': max(0, pending - self.n_workers),
+                'max_pending': self.max_pending,
+                'workers': self.n_workers,
+                'latency_seconds': {
+                    'buckets': [str(b) if b != float('inf') else '+Inf' for b in LATENCY_BUCKETS],
+                    'counts': list(self.latency_counts),
+                    'sum': round(self.latency_sum, 6),
+                    'count': sum(self.latency_counts),
+                },
+            }
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """HTTP handler; the service instance lives on the server"""
+
+    server_version = 'TSPService/1.0'
+
+    def log_message(self, format, *args):
+        if not getattr(self.server, 'quiet', False):
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Dict, headers: Optional[Dict] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == '/metrics':
+            self._send_json(200, self.server.service.metrics())
+        elif path == '/solvers':
+            self._send_json(200, {'solvers': sorted(SOLVERS)})
+        elif path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        else:
+            self._send_json(404, {'error': f'not found: {path}'})
+
+    def _parse_request(self) -> Tuple[str, np.ndarray, Dict]:
+        """Read (solver, points, params) from a JSON or binary body"""
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        content_type = self.headers.get('Content-Type', 'application/json').split(';')[0].strip()
+
+        if content_type == 'application/octet-stream':
+            dtype = query.get('dtype', ['float64'])[0]
+            if dtype not in ('float64', 'float32'):
+                raise ValueError(f"dtype must be float64 or float32, got {dtype!r}")
+            flat = np.frombuffer(body, dtype='<f8' if dtype == 'float64' else '<f4')
+            if len(flat) % 2:
+                raise ValueError('binary body must hold an even number of values (x, y pairs)')
+            points = flat.astype(np.float64).reshape(-1, 2)
+            solver = query.get('solver', ['nearest_neighbor'])[0]
+            params = json.loads(query.get('params', ['{}'])[0])
+        else:
+            data = json.loads(body or b'{}')
+            if not isinstance(data, dict):
+                raise ValueError('request body must be a JSON object')
+            points = np.asarray(data.get('cities', []), dtype=np.float64).reshape(-1, 2)
+            solver = data.get('solver', 'nearest_neighbor')
+            params = data.get('params', {})
+
+        if not isinstance(params, dict):
+            raise ValueError('params must be a JSON object')
+        if len(points) < 1:
+            raise ValueError('no cities given')
+        return solver, points, params
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        if path != '/solve':
+            self._send_json(404, {'error': f'not found: {path}'})
+            return
+
+        service = self.server.service
+        start = time.perf_counter()
+        try:
+            solver, points, params = self._parse_request()
+            future, key, coalesced = service.submit(solver, points, params)
+        except ServiceOverloaded:
+            self._send_json(503, {'error': 'too many pending jobs'}, {'Retry-After': '1'})
+            return
+        except (ValueError, TypeError) as exc:
+            self._send_json(400, {'error': str(exc)})
+            return
+
+        try:
+            tour, distance, time_taken = future.result(timeout=service.request_timeout)
+        except (FutureTimeoutError, SolveCancelled):
+            # Job bị huỷ ở deadline (hoặc sắp bị huỷ): không còn giữ chỗ trong max_pending
+            service.record(time.perf_counter() - start, ok=False, timed_out=True)
+            self._send_json(504, {'error': f'solve did not finish within {service.request_timeout}s'})
+            return
+        except Exception as exc:
+            service.record(time.perf_counter() - start, ok=False)
+            status = 400 if isinstance(exc, (ValueError, TypeError)) else 500
+            self._send_json(status, {'error': repr(exc)})
+            return
+
+        service.record(time.perf_counter() - start, ok=True)
+        self._send_json(200, {
+            'solver': solver,
+            'hash': key,
+            'coalesced': coalesced,
+            'tour': tour,
+            'distance': distance,
+            'solve_time': time_taken,
+        })
+
+
+def create_server(host: str = '127.0.0.1', port: int = 8000, quiet: bool = False,
+                  **service_options) -> ThreadingHTTPServer:
+    """Build the HTTP server (port 0 picks a free port, handy for tests)"""
+    server = ThreadingHTTPServer((host, port), SolveRequestHandler)
+    server.daemon_threads = True
+    server.service = SolveService(**service_options)
+    server.quiet = quiet
+    return server
+
+
+def serve_in_background(server: ThreadingHTTPServer) -> threading.Thread:
+    """Run serve_forever in a daemon thread; stop with server.shutdown()"""
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def main():
+    """Chạy dịch vụ giải TSP"""
+    parser = argparse.ArgumentParser(description='TSP HTTP/JSON solve service')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-pending', type=int, default=64)
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process')
+    parser.add_argument('--timeout', type=float, default=300.0)
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, n_workers=args.workers,
+                           max_pending=args.max_pending, executor=args.executor,
+                           request_timeout=args.timeout)
+    print(f"TSP service listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
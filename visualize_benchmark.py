@@ -11,51 +11,107 @@ import glob
 
 
 def load_benchmark_results(pattern="benchmark_results_*.json"):
-    """Load tất cả các file benchmark results"""
+    """
+    Load tất cả các file benchmark results
+    Khoá là tên instance (file chạy từ corpus) hoặc số thành phố, giá trị là
+    {'n_cities': n, 'results': {thuật toán: thống kê}}; sắp theo n rồi theo tên.
+    Nhiều file cùng khoá: file mới nhất (theo tên) được giữ.
+    """
     files = sorted(glob.glob(pattern))
-    results = {}
+    loaded = {}
     
     for file in files:
         with open(file, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            n_cities = data['metadata']['n_cities']
-            results[n_cities] = data['results']
+            metadata = data['metadata']
+            instance = metadata.get('instance')
+            key = instance['name'] if instance else metadata['n_cities']
+            loaded[key] = {'n_cities': metadata['n_cities'], 'results': data['results']}
     
-    return results
+    return dict(sorted(loaded.items(), key=lambda item: (item[1]['n_cities'], str(item[0]))))
+
+
+def load_scaling_results(pattern="scaling_results_*.json"):
+    """Load file scaling_benchmark.py mới nhất (None nếu chưa có)"""
+    files = sorted(glob.glob(pattern))
+    if not files:
+        return None
+    with open(files[-1], 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Tên hiển thị, tên ngắn và màu của các thuật toán benchmark mặc định
+ALGO_NAMES = {
+    'nearest_neighbor': 'Nearest Neighbor',
+    'nearest_insertion': 'Nearest Insertion',
+    'farthest_insertion': 'Farthest Insertion',
+    'ant_colony': 'Ant Colony',
+    'space_filling_curve': 'Space-Filling Curve',
+    'greedy_edge': 'Greedy Edge',
+    'savings': 'Savings',
+    'spatial_decomposition': 'Spatial Decomposition',
+}
+ALGO_SHORT = {
+    'nearest_neighbor': 'NN',
+    'nearest_insertion': 'NI',
+    'farthest_insertion': 'FI',
+    'ant_colony': 'ACO',
+    'space_filling_curve': 'SFC',
+    'greedy_edge': 'GE',
+    'savings': 'CW',
+    'spatial_decomposition': 'SD',
+}
+ALGO_COLORS = {
+    'nearest_neighbor': '#2ecc71',
+    'nearest_insertion': '#3498db',
+    'farthest_insertion': '#e74c3c',
+    'ant_colony': '#f39c12',
+    'space_filling_curve': '#9b59b6',
+    'greedy_edge': '#1abc9c',
+    'savings': '#34495e',
+    'spatial_decomposition': '#e67e22',
+}
+
+
+def algorithms_in(results, exclude=()):
+    """Các thuật toán có trong ít nhất một bộ kết quả, theo thứ tự ALGO_NAMES rồi theo tên"""
+    present = {algo for entry in results.values() for algo in entry['results']} - set(exclude)
+    known = [algo for algo in ALGO_NAMES if algo in present]
+    return known + sorted(present - set(known))
+
+
+def series(results, algo, metric):
+    """(n, mean, std) của một thuật toán qua các bộ kết quả có chạy nó"""
+    sizes, means, stds = [], [], []
+    for entry in results.values():
+        stats = entry['results'].get(algo)
+        if stats is None:
+            continue
+        sizes.append(entry['n_cities'])
+        means.append(stats[metric]['mean'])
+        stds.append(stats[metric].get('std', 0.0))
+    return sizes, means, stds
+
+
+def _plot_series(ax, results, algorithms, metric, errorbars=True):
+    for algo in algorithms:
+        sizes, means, stds = series(results, algo, metric)
+        if not sizes:
+            continue
+        style = dict(label=ALGO_NAMES.get(algo, algo), marker='o', linewidth=2,
+                     color=ALGO_COLORS.get(algo), markersize=8)
+        if errorbars:
+            ax.errorbar(sizes, means, yerr=stds, capsize=5, **style)
+        else:
+            ax.plot(sizes, means, **style)
 
 
 def plot_execution_time_comparison(results):
     """Biểu đồ so sánh thời gian thực thi"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
     
-    algorithms = ['nearest_neighbor', 'nearest_insertion', 'farthest_insertion', 'ant_colony']
-    algo_names = {
-        'nearest_neighbor': 'Nearest Neighbor',
-        'nearest_insertion': 'Nearest Insertion',
-        'farthest_insertion': 'Farthest Insertion',
-        'ant_colony': 'Ant Colony'
-    }
-    colors = {
-        'nearest_neighbor': '#2ecc71',
-        'nearest_insertion': '#3498db',
-        'farthest_insertion': '#e74c3c',
-        'ant_colony': '#f39c12'
-    }
-    
-    n_cities_list = sorted(results.keys())
-    
     # Plot 1: Tất cả thuật toán
-    for algo in algorithms:
-        times = []
-        stds = []
-        for n_cities in n_cities_list:
-            time_data = results[n_cities][algo]['time']
-            times.append(time_data['mean'])
-            stds.append(time_data['std'])
-        
-        ax1.errorbar(n_cities_list, times, yerr=stds, 
-                    label=algo_names[algo], marker='o', linewidth=2,
-                    color=colors[algo], capsize=5, markersize=8)
+    _plot_series(ax1, results, algorithms_in(results), 'time')
     
     ax1.set_xlabel('Số lượng thành phố', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Thời gian thực thi (giây)', fontsize=12, fontweight='bold')
@@ -66,17 +122,7 @@ def plot_execution_time_comparison(results):
     ax1.set_yscale('log')
     
     # Plot 2: Không có Ant Colony (để nhìn rõ các thuật toán nhanh hơn)
-    for algo in algorithms[:-1]:  # Bỏ ant_colony
-        times = []
-        stds = []
-        for n_cities in n_cities_list:
-            time_data = results[n_cities][algo]['time']
-            times.append(time_data['mean'])
-            stds.append(time_data['std'])
-        
-        ax2.errorbar(n_cities_list, times, yerr=stds, 
-                    label=algo_names[algo], marker='o', linewidth=2,
-                    color=colors[algo], capsize=5, markersize=8)
+    _plot_series(ax2, results, algorithms_in(results, exclude=('ant_colony',)), 'time')
     
     ax2.set_xlabel('Số lượng thành phố', fontsize=12, fontweight='bold')
     ax2.set_ylabel('Thời gian thực thi (giây)', fontsize=12, fontweight='bold')
@@ -95,33 +141,7 @@ def plot_distance_comparison(results):
     """Biểu đồ so sánh khoảng cách tour"""
     fig, ax = plt.subplots(figsize=(12, 7))
     
-    algorithms = ['nearest_neighbor', 'nearest_insertion', 'farthest_insertion', 'ant_colony']
-    algo_names = {
-        'nearest_neighbor': 'Nearest Neighbor',
-        'nearest_insertion': 'Nearest Insertion',
-        'farthest_insertion': 'Farthest Insertion',
-        'ant_colony': 'Ant Colony'
-    }
-    colors = {
-        'nearest_neighbor': '#2ecc71',
-        'nearest_insertion': '#3498db',
-        'farthest_insertion': '#e74c3c',
-        'ant_colony': '#f39c12'
-    }
-    
-    n_cities_list = sorted(results.keys())
-    
-    for algo in algorithms:
-        distances = []
-        stds = []
-        for n_cities in n_cities_list:
-            dist_data = results[n_cities][algo]['distance']
-            distances.append(dist_data['mean'])
-            stds.append(dist_data['std'])
-        
-        ax.errorbar(n_cities_list, distances, yerr=stds,
-                   label=algo_names[algo], marker='o', linewidth=2,
-                   color=colors[algo], capsize=5, markersize=8)
+    _plot_series(ax, results, algorithms_in(results), 'distance')
     
     ax.set_xlabel('Số lượng thành phố', fontsize=12, fontweight='bold')
     ax.set_ylabel('Khoảng cách tour', fontsize=12, fontweight='bold')
@@ -140,30 +160,7 @@ def plot_memory_usage(results):
     """Biểu đồ so sánh bộ nhớ sử dụng"""
     fig, ax = plt.subplots(figsize=(12, 7))
     
-    algorithms = ['nearest_neighbor', 'nearest_insertion', 'farthest_insertion', 'ant_colony']
-    algo_names = {
-        'nearest_neighbor': 'Nearest Neighbor',
-        'nearest_insertion': 'Nearest Insertion',
-        'farthest_insertion': 'Farthest Insertion',
-        'ant_colony': 'Ant Colony'
-    }
-    colors = {
-        'nearest_neighbor': '#2ecc71',
-        'nearest_insertion': '#3498db',
-        'farthest_insertion': '#e74c3c',
-        'ant_colony': '#f39c12'
-    }
-    
-    n_cities_list = sorted(results.keys())
-    
-    for algo in algorithms:
-        memories = []
-        for n_cities in n_cities_list:
-            mem_data = results[n_cities][algo]['memory_mb']
-            memories.append(mem_data['mean'])
-        
-        ax.plot(n_cities_list, memories, label=algo_names[algo], 
-               marker='o', linewidth=2, color=colors[algo], markersize=8)
+    _plot_series(ax, results, algorithms_in(results), 'memory_mb', errorbars=False)
     
     ax.set_xlabel('Số lượng thành phố', fontsize=12, fontweight='bold')
     ax.set_ylabel('Bộ nhớ sử dụng (MB)', fontsize=12, fontweight='bold')
@@ -179,89 +176,38 @@ def plot_memory_usage(results):
 
 
 def plot_performance_heatmap(results):
-    """Heatmap so sánh tổng hợp"""
-    algorithms = ['nearest_neighbor', 'nearest_insertion', 'farthest_insertion', 'ant_colony']
-    algo_names = {
-        'nearest_neighbor': 'Nearest\nNeighbor',
-        'nearest_insertion': 'Nearest\nInsertion',
-        'farthest_insertion': 'Farthest\nInsertion',
-        'ant_colony': 'Ant\nColony'
-    }
-    
-    n_cities_list = sorted(results.keys())
+    """Heatmap so sánh tổng hợp (ô trống: thuật toán không chạy trên bộ kết quả đó)"""
+    algorithms = algorithms_in(results)
+    labels = [str(key) for key in results]
     
     # Tạo 3 subplots cho 3 metrics
     fig, (ax1, ax2, ax3) = plt.subplots(1, 3, figsize=(18, 5))
     
-    # Heatmap 1: Execution Time
-    time_data = []
-    for n_cities in n_cities_list:
-        row = []
-        for algo in algorithms:
-            row.append(results[n_cities][algo]['time']['mean'])
-        time_data.append(row)
-    
-    im1 = ax1.imshow(np.array(time_data).T, cmap='RdYlGn_r', aspect='auto')
-    ax1.set_xticks(range(len(n_cities_list)))
-    ax1.set_xticklabels(n_cities_list)
-    ax1.set_yticks(range(len(algorithms)))
-    ax1.set_yticklabels([algo_names[a] for a in algorithms])
-    ax1.set_xlabel('Số lượng thành phố', fontweight='bold')
-    ax1.set_title('Thời gian thực thi (s)', fontweight='bold', fontsize=12)
-    
-    # Thêm giá trị vào cells
-    for i in range(len(algorithms)):
-        for j in range(len(n_cities_list)):
-            text = ax1.text(j, i, f'{time_data[j][i]:.4f}',
-                          ha="center", va="center", color="black", fontsize=9)
-    
-    plt.colorbar(im1, ax=ax1)
-    
-    # Heatmap 2: Distance
-    dist_data = []
-    for n_cities in n_cities_list:
-        row = []
-        for algo in algorithms:
-            row.append(results[n_cities][algo]['distance']['mean'])
-        dist_data.append(row)
-    
-    im2 = ax2.imshow(np.array(dist_data).T, cmap='RdYlGn_r', aspect='auto')
-    ax2.set_xticks(range(len(n_cities_list)))
-    ax2.set_xticklabels(n_cities_list)
-    ax2.set_yticks(range(len(algorithms)))
-    ax2.set_yticklabels([algo_names[a] for a in algorithms])
-    ax2.set_xlabel('Số lượng thành phố', fontweight='bold')
-    ax2.set_title('Khoảng cách tour', fontweight='bold', fontsize=12)
-    
-    for i in range(len(algorithms)):
-        for j in range(len(n_cities_list)):
-            text = ax2.text(j, i, f'{dist_data[j][i]:.1f}',
-                          ha="center", va="center", color="black", fontsize=9)
-    
-    plt.colorbar(im2, ax=ax2)
-    
-    # Heatmap 3: Memory
-    mem_data = []
-    for n_cities in n_cities_list:
-        row = []
-        for algo in algorithms:
-            row.append(results[n_cities][algo]['memory_mb']['mean'])
-        mem_data.append(row)
-    
-    im3 = ax3.imshow(np.array(mem_data).T, cmap='YlOrRd', aspect='auto')
-    ax3.set_xticks(range(len(n_cities_list)))
-    ax3.set_xticklabels(n_cities_list)
-    ax3.set_yticks(range(len(algorithms)))
-    ax3.set_yticklabels([algo_names[a] for a in algorithms])
-    ax3.set_xlabel('Số lượng thành phố', fontweight='bold')
-    ax3.set_title('Bộ nhớ (MB)', fontweight='bold', fontsize=12)
-    
-    for i in range(len(algorithms)):
-        for j in range(len(n_cities_list)):
-            text = ax3.text(j, i, f'{mem_data[j][i]:.2f}',
-                          ha="center", va="center", color="black", fontsize=9)
-    
-    plt.colorbar(im3, ax=ax3)
+    for ax, metric, cmap, title, fmt in ((ax1, 'time', 'RdYlGn_r', 'Thời gian thực thi (s)', '.4f'),
+                                         (ax2, 'distance', 'RdYlGn_r', 'Khoảng cách tour', '.1f'),
+                                         (ax3, 'memory_mb', 'YlOrRd', 'Bộ nhớ (MB)', '.2f')):
+        data = np.full((len(algorithms), len(results)), np.nan)
+        for j, entry in enumerate(results.values()):
+            for i, algo in enumerate(algorithms):
+                if algo in entry['results']:
+                    data[i, j] = entry['results'][algo][metric]['mean']
+        
+        im = ax.imshow(data, cmap=cmap, aspect='auto')
+        ax.set_xticks(range(len(labels)))
+        ax.set_xticklabels(labels, rotation=45, ha='right')
+        ax.set_yticks(range(len(algorithms)))
+        ax.set_yticklabels([ALGO_NAMES.get(a, a).replace(' ', '\n') for a in algorithms])
+        ax.set_xlabel('Bộ kết quả', fontweight='bold')
+        ax.set_title(title, fontweight='bold', fontsize=12)
+        
+        # Thêm giá trị vào cells
+        for i in range(len(algorithms)):
+            for j in range(len(labels)):
+                if not np.isnan(data[i, j]):
+                    ax.text(j, i, f'{data[i, j]:{fmt}}',
+                            ha="center", va="center", color="black", fontsize=9)
+        
+        plt.colorbar(im, ax=ax)
     
     plt.suptitle('Heatmap so sánh hiệu năng các thuật toán TSP', 
                  fontsize=16, fontweight='bold', y=1.02)
@@ -272,33 +218,29 @@ def plot_performance_heatmap(results):
 
 
 def plot_bar_comparison(results):
-    """Biểu đồ cột so sánh cho từng kích thước"""
-    algorithms = ['nearest_neighbor', 'nearest_insertion', 'farthest_insertion', 'ant_colony']
-    algo_names = {
-        'nearest_neighbor': 'NN',
-        'nearest_insertion': 'NI',
-        'farthest_insertion': 'FI',
-        'ant_colony': 'ACO'
-    }
-    colors = ['#2ecc71', '#3498db', '#e74c3c', '#f39c12']
-    
-    n_cities_list = sorted(results.keys())
-    n_sizes = len(n_cities_list)
-    
-    fig, axes = plt.subplots(2, n_sizes, figsize=(5*n_sizes, 10))
-    
-    for idx, n_cities in enumerate(n_cities_list):
+    """Biểu đồ cột so sánh cho từng bộ kết quả (chỉ các thuật toán đã chạy trên nó)"""
+    n_sets = len(results)
+    
+    fig, axes = plt.subplots(2, n_sets, figsize=(5*n_sets, 10), squeeze=False)
+    
+    for idx, (key, entry) in enumerate(results.items()):
+        algorithms = [algo for algo in algorithms_in(results) if algo in entry['results']]
+        stats = [entry['results'][algo] for algo in algorithms]
+        colors = [ALGO_COLORS.get(algo, 'gray') for algo in algorithms]
+        short = [ALGO_SHORT.get(algo, algo) for algo in algorithms]
+        
         # Subplot 1: Thời gian
         ax1 = axes[0, idx]
-        times = [results[n_cities][algo]['time']['mean'] for algo in algorithms]
-        stds = [results[n_cities][algo]['time']['std'] for algo in algorithms]
+        times = [s['time']['mean'] for s in stats]
+        stds = [s['time']['std'] for s in stats]
         
         bars = ax1.bar(range(len(algorithms)), times, yerr=stds, 
                       color=colors, capsize=5, alpha=0.8, edgecolor='black')
         ax1.set_xticks(range(len(algorithms)))
-        ax1.set_xticklabels([algo_names[a] for a in algorithms], rotation=45)
+        ax1.set_xticklabels(short, rotation=45)
         ax1.set_ylabel('Thời gian (s)', fontweight='bold')
-        ax1.set_title(f'{n_cities} thành phố', fontweight='bold', fontsize=12)
+        title = f'{key} thành phố' if isinstance(key, int) else f"{key} ({entry['n_cities']} thành phố)"
+        ax1.set_title(title, fontweight='bold', fontsize=12)
         ax1.grid(True, alpha=0.3, axis='y')
         
         # Thêm giá trị lên cột
@@ -309,13 +251,13 @@ def plot_bar_comparison(results):
         
         # Subplot 2: Khoảng cách
         ax2 = axes[1, idx]
-        distances = [results[n_cities][algo]['distance']['mean'] for algo in algorithms]
-        stds = [results[n_cities][algo]['distance']['std'] for algo in algorithms]
+        distances = [s['distance']['mean'] for s in stats]
+        stds = [s['distance']['std'] for s in stats]
         
         bars = ax2.bar(range(len(algorithms)), distances, yerr=stds,
                       color=colors, capsize=5, alpha=0.8, edgecolor='black')
         ax2.set_xticks(range(len(algorithms)))
-        ax2.set_xticklabels([algo_names[a] for a in algorithms], rotation=45)
+        ax2.set_xticklabels(short, rotation=45)
         ax2.set_ylabel('Khoảng cách', fontweight='bold')
         ax2.grid(True, alpha=0.3, axis='y')
         
@@ -337,33 +279,26 @@ def plot_bar_comparison(results):
 
 
 def plot_speedup_analysis(results):
-    """Phân tích speedup so với thuật toán chậm nhất"""
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    algorithms = ['nearest_neighbor', 'nearest_insertion', 'farthest_insertion']
-    algo_names = {
-        'nearest_neighbor': 'Nearest Neighbor',
-        'nearest_insertion': 'Nearest Insertion',
-        'farthest_insertion': 'Farthest Insertion'
-    }
-    colors = {
-        'nearest_neighbor': '#2ecc71',
-        'nearest_insertion': '#3498db',
-        'farthest_insertion': '#e74c3c'
-    }
+    """Phân tích speedup so với Ant Colony (chỉ các bộ kết quả có chạy ACO)"""
+    with_aco = {key: entry for key, entry in results.items() if 'ant_colony' in entry['results']}
+    if not with_aco:
+        print("- Skipped: benchmark_speedup.png (không có kết quả Ant Colony)")
+        return
     
-    n_cities_list = sorted(results.keys())
+    fig, ax = plt.subplots(figsize=(12, 7))
     
-    for algo in algorithms:
-        speedups = []
-        for n_cities in n_cities_list:
-            aco_time = results[n_cities]['ant_colony']['time']['mean']
-            algo_time = results[n_cities][algo]['time']['mean']
-            speedup = aco_time / algo_time
-            speedups.append(speedup)
+    for algo in algorithms_in(with_aco, exclude=('ant_colony',)):
+        sizes, speedups = [], []
+        for entry in with_aco.values():
+            if algo not in entry['results']:
+                continue
+            aco_time = entry['results']['ant_colony']['time']['mean']
+            algo_time = entry['results'][algo]['time']['mean']
+            sizes.append(entry['n_cities'])
+            speedups.append(aco_time / algo_time)
         
-        ax.plot(n_cities_list, speedups, label=algo_names[algo],
-               marker='o', linewidth=2, color=colors[algo], markersize=8)
+        ax.plot(sizes, speedups, label=ALGO_NAMES.get(algo, algo),
+               marker='o', linewidth=2, color=ALGO_COLORS.get(algo), markersize=8)
     
     ax.set_xlabel('Số lượng thành phố', fontsize=12, fontweight='bold')
     ax.set_ylabel('Speedup (lần)', fontsize=12, fontweight='bold')
@@ -379,6 +314,51 @@ def plot_speedup_analysis(results):
     plt.close()
 
 
+def plot_scaling_fits(scaling):
+    """Thời gian và bộ nhớ theo n trên thang log-log, kèm đường fit và số mũ khai báo"""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+    colors = plt.cm.tab10(np.linspace(0, 1, 10))
+    
+    for i, (algo, result) in enumerate(scaling['results'].items()):
+        points = result['points']
+        if not points:
+            continue
+        color = colors[i % len(colors)]
+        sizes = np.array([p['n'] for p in points], dtype=float)
+        
+        for ax, key, fit_key, check_key in ((ax1, 'total_time', 'time_fit', 'time_check'),
+                                            (ax2, 'memory_mb', 'memory_fit', 'space_check')):
+            values = np.array([p[key] for p in points])
+            positive = values > 0
+            ax.scatter(sizes[positive], values[positive], color=color, s=30)
+            
+            fit, check = result[fit_key], result[check_key] or {}
+            label = algo
+            if fit is not None:
+                # Đường fit: value = e^intercept · n^slope
+                line = np.exp(fit['intercept']) * sizes ** fit['slope']
+                ax.plot(sizes, line, color=color, linewidth=2)
+                label = f"{algo}: n^{fit['slope']:.2f} (khai báo {check.get('declared', '?')})"
+                if check.get('mismatch'):
+                    label += ' ⚠'
+            ax.plot([], [], color=color, marker='o', linewidth=2, label=label)
+    
+    for ax, ylabel, title in ((ax1, 'Thời gian (s)', 'Thời gian theo n (log-log)'),
+                              (ax2, 'Bộ nhớ đỉnh (MB)', 'Bộ nhớ theo n (log-log)')):
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel('Số lượng thành phố', fontsize=12, fontweight='bold')
+        ax.set_ylabel(ylabel, fontsize=12, fontweight='bold')
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.legend(fontsize=8)
+        ax.grid(True, alpha=0.3, which='both')
+    
+    plt.tight_layout()
+    plt.savefig('benchmark_scaling.png', dpi=300, bbox_inches='tight')
+    print("✓ Saved: benchmark_scaling.png")
+    plt.close()
+
+
 def main():
     """Hàm chính"""
     print("="*70)
@@ -388,14 +368,19 @@ def main():
     # Load results
     print("\nLoading benchmark results...")
     results = load_benchmark_results()
+    scaling = load_scaling_results()
+    
+    if not results and scaling is not None:
+        plot_scaling_fits(scaling)
+        return
     
     if not results:
         print("❌ No benchmark results found!")
         print("Please run benchmark.py first to generate results.")
         return
     
-    print(f"✓ Loaded results for {len(results)} different problem sizes")
-    print(f"  Problem sizes: {sorted(results.keys())}")
+    print(f"✓ Loaded {len(results)} result sets")
+    print(f"  Instances: {list(results.keys())}")
     
     # Generate all plots
     print("\nGenerating visualizations...")
@@ -407,6 +392,8 @@ def main():
     plot_performance_heatmap(results)
     plot_bar_comparison(results)
     plot_speedup_analysis(results)
+    if scaling is not None:
+        plot_scaling_fits(scaling)
     
     print("-" * 70)
     print("\n✅ All visualizations generated successfully!")
@@ -417,6 +404,8 @@ def main():
     print("  4. benchmark_heatmap.png - Heatmap tổng hợp")
     print("  5. benchmark_bars.png - Biểu đồ cột chi tiết")
     print("  6. benchmark_speedup.png - Phân tích speedup")
+    if scaling is not None:
+        print("  7. benchmark_scaling.png - Độ phức tạp thực nghiệm (fit log-log)")
     print("="*70)
 
 